@@ -0,0 +1,87 @@
+"""
+Startup time of the command line tools.
+
+The tools are often run on single small files, where importing modules
+dominates the run time, so modules which are slow to import are only imported
+when they are used.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+#: Modules which are only imported when a tool processes files in parallel,
+#: uses a cache or a translation memory
+LAZY_MODULES = ("concurrent.futures", "multiprocessing", "numpy", "sqlite3")
+
+#: Modules which tools for formats which are not XML do not need
+XML_MODULES = ("lxml", "translate.storage.placeables")
+
+#: Tools for formats which are not XML
+TEXT_TOOLS = (
+    "csv2po",
+    "po2csv",
+    "po2prop",
+    "pocompile",
+    "pocount",
+    "pofilter",
+    "pogrep",
+    "pot2po",
+)
+
+
+def entry_points() -> dict[str, str]:
+    with (REPO_ROOT / "pyproject.toml").open("rb") as handle:
+        scripts = tomllib.load(handle)["project"]["scripts"]
+    return {name: target.split(":")[0] for name, target in scripts.items()}
+
+
+def importtimes(*modules: str) -> dict[str, int]:
+    """Returns the cumulative import time of every module imported by modules."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "; ".join(f"import {module}" for module in modules),
+        ],
+        capture_output=True,
+        check=True,
+        cwd=REPO_ROOT,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def matching(imported, packages) -> list[str]:
+    """Returns the imported modules which belong to one of packages."""
+    return [
+        name
+        for name in imported
+        if any(
+            name == package or name.startswith(f"{package}.") for package in packages
+        )
+    ]
+
+
+def test_lazy_modules() -> None:
+    assert not matching(importtimes(*entry_points().values()), LAZY_MODULES)
+
+
+@pytest.mark.parametrize("tool", TEXT_TOOLS)
+def test_startup(tool) -> None:
+    assert not matching(importtimes(entry_points()[tool]), XML_MODULES)
@@ -138,6 +138,7 @@ class TestConvertCommand:
             "-h, --help",
             "--manpage",
             "--errorlevel=ERRORLEVEL",
+            "--jobs=JOBS",
             "-i INPUT, --input=INPUT",
             "-x EXCLUDE, --exclude=EXCLUDE",
             "-o OUTPUT, --output=OUTPUT",
@@ -211,3 +211,16 @@ class TestPO2TMXCommand(test_convert.TestConvertCommand, TestPO2TMX):
         self.run_command("test.po", "test.tmx", language="af")
         content = self.open_testfile("test.tmx", "r").read()
         assert '<prop type="x-context">Context</prop>' in content
+
+    def test_directory(self) -> None:
+        """Tests that the units of several files are written in one TMX file."""
+        self.create_testfile("po/one.po", 'msgid "One"\nmsgstr "Een"\n')
+        self.create_testfile("po/two.po", 'msgid "Two"\nmsgstr "Twee"\n')
+        self.run_command("po", "test.tmx", language="af", source_language="xh")
+        with self.open_testfile("test.tmx") as handle:
+            store = tmx.tmxfile(handle)
+        assert store.document.find("header").get("srclang") == "xh"
+        assert sorted((unit.source, unit.target) for unit in store.units) == [
+            ("One", "Een"),
+            ("Two", "Twee"),
+        ]
@@ -4,6 +4,7 @@ from pytest import mark
 
 from translate.convert import pot2po
 from translate.storage import po
+from translate.tools import pretranslate
 
 from . import test_convert
 
@@ -941,4 +942,56 @@ class TestPOT2POCommand(test_convert.TestConvertCommand, TestPOT2PO):
         "--tm",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
+        "--fanout",
     ]
+
+    def test_fanout(self) -> None:
+        """Checks that every language is updated from the same templates."""
+        self.create_testfile(
+            "pot/one.pot",
+            'msgid ""\nmsgstr ""\n"POT-Creation-Date: 2026-01-01 00:00+0000\\n"\n\n'
+            'msgid "Open"\nmsgstr ""\n\nmsgid "Save file"\nmsgstr ""\n',
+        )
+        self.create_testfile("pot/two.pot", 'msgid "Close"\nmsgstr ""\n')
+        self.create_testfile(
+            "po/af/one.po",
+            'msgid ""\nmsgstr ""\n"Language: af\\n"\n\n'
+            'msgid "Open"\nmsgstr "Oop"\n\nmsgid "Save files"\nmsgstr "Stoor lêers"\n',
+        )
+        self.create_testfile("po/de/two.po", 'msgid "Close"\nmsgstr "Schließen"\n')
+        self.run_command("--fanout", "-t", "po", "pot", "out", jobs=1)
+        expected = {}
+        for language, name in [
+            ("af", "one"),
+            ("af", "two"),
+            ("de", "one"),
+            ("de", "two"),
+        ]:
+            expected[language, name] = self.read_testfile(f"out/{language}/{name}.po")
+        af = po.pofile(expected["af", "one"])
+        assert af.parseheader()["Language"] == "af"
+        assert af.parseheader()["POT-Creation-Date"] == "2026-01-01 00:00+0000"
+        assert [unit.target for unit in af.units[1:]] == ["Oop", "Stoor lêers"]
+        assert af.units[2].isfuzzy()
+        assert po.pofile(expected["de", "two"]).units[-1].target == "Schließen"
+        for language, name in [("de", "one"), ("af", "two")]:
+            store = po.pofile(expected[language, name])
+            assert not any(unit.istranslated() for unit in store.units)
+        # The same result as converting each language separately
+        self.run_command("-t", "po/af", "pot", "separate")
+        assert self.read_testfile("separate/one.po") == expected["af", "one"]
+        self.run_command("--fanout", "-t", "po", "pot", "parallel", jobs=2)
+        for (language, name), content in expected.items():
+            assert self.read_testfile(f"parallel/{language}/{name}.po") == content
+
+    def test_jobs_tm(self, monkeypatch) -> None:
+        """Checks that the TM is loaded once before forking the workers."""
+        monkeypatch.setattr(pretranslate, "tmmatcher", None)
+        self.create_testfile("tm.po", 'msgid "Open file"\nmsgstr "Maak leer oop"\n')
+        for name in ("one", "two"):
+            self.create_testfile(f"pot/{name}.pot", 'msgid "Open files"\nmsgstr ""\n')
+        self.run_command("--tm=tm.po", "pot", "out", jobs=2)
+        assert pretranslate.tmmatcher is not None
+        for name in ("one", "two"):
+            unit = po.pofile(self.read_testfile(f"out/{name}.po")).units[-1]
+            assert unit.target == "Maak leer oop"
@@ -507,3 +507,12 @@ class TestProp2POCommand(test_convert.TestConvertCommand, TestProp2PO):
         "--encoding=ENCODING",
         "--duplicates=DUPLICATESTYLE",
     ]
+
+    def test_jobs(self) -> None:
+        """Checks that a directory is converted the same using several processes."""
+        for name in ("a", "b", "c"):
+            self.create_testfile(f"in/{name}.properties", f"key={name}\n")
+        self.run_command("in", "out", jobs=2)
+        for name in ("a", "b", "c"):
+            pofile = po.pofile(self.read_testfile(f"out/{name}.po"))
+            assert pofile.units[1].source == name
@@ -2585,3 +2585,47 @@ def test_category() -> None:
     assert standard_checker.categories != {}
     assert len(standard_checker.categories.values()) == standard_categories_count
     assert "validxml" not in standard_checker.categories
+
+
+def test_filter_plan() -> None:
+    """Tests the filter plan is built once and follows the configuration."""
+    checker = checks.StandardChecker(limitfilters=["untranslated", "endpunc", "long"])
+    plan = checker.get_filter_plan()
+    # Preconditions come first and run even when not selected
+    assert plan[0][0] == "untranslated"
+    assert [name for name, _function, isdefault, _dependents in plan if isdefault] == [
+        "untranslated",
+        "endpunc",
+        "long",
+    ]
+    assert checker.get_filter_plan() is plan
+    # Failing untranslated check skips endpunc
+    unit = base.TranslationUnit("Hello.")
+    unit.target = ""
+    assert list(checker.run_filters(unit)) == ["untranslated"]
+
+    checker.config.updatetargetlanguage("ja")
+    assert checker.get_filter_plan() is not plan
+
+
+def test_run_filters_many() -> None:
+    """Tests checking several units gives the same results as one by one."""
+    units = []
+    for source, target in (
+        ("Hello %s.", "Bonjour."),
+        ("&Open file", "&Ouvrir le fichier"),
+        ("Hello %s.", "Salut %s"),
+        ("<b>Bold</b>", "<b>Gras"),
+    ):
+        unit = base.TranslationUnit(source)
+        unit.target = target
+        units.append(unit)
+
+    checker = checks.TeeChecker(
+        checkerconfig=checks.CheckerConfig(accelmarkers="&"),
+        checkerclasses=[checks.StandardChecker, checks.StandardUnitChecker],
+    )
+    expected = [checker.run_filters(unit, categorised=True) for unit in units]
+    assert checker.run_filters_many(units, categorised=True) == expected
+    assert all(not subchecker.results_cache for subchecker in checker.checkers)
+    assert all(not subchecker.share_results_cache for subchecker in checker.checkers)
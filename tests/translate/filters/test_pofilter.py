@@ -55,6 +55,33 @@ class BaseTestFilter:
         print(filter_result.units)
         assert "startcaps" in first_translatable(filter_result).geterrors()
 
+    def test_cache(self, tmp_path, monkeypatch) -> None:
+        """Checks that cached results are reused until the unit changes."""
+        cacheoptions = [f"--cache={tmp_path / 'cache.db'}"]
+        target = self.unit.target
+        self.unit.target = "REST"
+        # Filtering adds notes to the units, check a copy of the store
+        content = bytes(self.translationstore).decode()
+        filter_result = self.filter(
+            self.parse_text(content), cmdlineoptions=cacheoptions
+        )
+        assert "startcaps" in first_translatable(filter_result).geterrors()
+
+        def run_filters_many(checker, units, categorised=False):
+            assert not units
+            return []
+
+        with monkeypatch.context() as patch:
+            patch.setattr(checks.TeeChecker, "run_filters_many", run_filters_many)
+            filter_result = self.filter(
+                self.parse_text(content), cmdlineoptions=cacheoptions
+            )
+        assert "startcaps" in first_translatable(filter_result).geterrors()
+
+        self.unit.target = target
+        filter_result = self.filter(self.translationstore, cmdlineoptions=cacheoptions)
+        assert headerless_len(filter_result.units) == 0
+
     def test_variables_across_lines(self) -> None:
         """Test that variables can span lines and still fail/pass."""
         self.unit.source = '"At &timeBombURL."\n"label;."'
@@ -1,5 +1,9 @@
+import sys
+from importlib.util import find_spec
+
 from pytest import raises
 
+from translate.lang import ngram
 from translate.lang.identify import LanguageIdentifier
 from translate.storage.base import TranslationUnit
 
@@ -173,6 +177,51 @@ class TestLanguageIdentifier:
             unit.target = TEXT_LIST[i]
         assert self.langident.identify_target_lang(langlist) == "de"
 
+    def test_identify_stores(self) -> None:
+        german = [TranslationUnit(string) for string in TEXT_LIST]
+        assert self.langident.identify_source_langs([german, [], None]) == [
+            "de",
+            None,
+            None,
+        ]
+        for unit in german:
+            unit.target = unit.source
+        assert self.langident.identify_target_langs([[], german]) == [None, "de"]
+        assert self.langident.identify_langs(["", TEXT]) == [None, "de"]
+
+    def test_classify(self, monkeypatch) -> None:
+        """The compiled models give the distances of the individual models."""
+        models = {}
+        for lang in ("dutch", "english", "german"):
+            with open(
+                f"{LanguageIdentifier.MODEL_DIR}/{lang}.lm", encoding="utf-8"
+            ) as fp:
+                models[lang] = ngram._NGram(
+                    {line.partition("\t")[0]: i for i, line in enumerate(fp)}
+                )
+        texts = [TEXT, *TEXT_LIST, "Een bestand openen", "x"]
+        profiles = [ngram._NGram(text) for text in texts]
+        expected = [
+            [models[lang].compare(profile) for lang in sorted(models)]
+            for profile in profiles
+        ]
+
+        def distances():
+            compiled = ngram.NGram(LanguageIdentifier.MODEL_DIR)
+            columns = [compiled.langs.index(lang) for lang in sorted(models)]
+            return [
+                [row[column] for column in columns]
+                for row in compiled.distances([profile.ngrams for profile in profiles])
+            ]
+
+        if find_spec("numpy") is not None:
+            assert distances() == expected
+            monkeypatch.setattr(ngram.NGram, "BATCH_SIZE", 1)
+            assert distances() == expected
+        # Without NumPy
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        assert distances() == expected
+
     def test_bad_init_data(self) -> None:
         """Test __init__ with bad conf files and data dirs."""
         with raises(ValueError):
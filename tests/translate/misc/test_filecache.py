@@ -0,0 +1,33 @@
+import os
+
+from translate.misc import filecache
+
+
+def test_filestate(tmp_path) -> None:
+    path = tmp_path / "file.po"
+    path.write_bytes(b"content")
+    state, changed = filecache.filestate(path)
+    assert changed
+    assert state.hash == filecache.filehash(path)
+    assert filecache.filestate(path, state) == (state, False)
+    # Touched but not changed
+    os.utime(path, (0, 0))
+    touched, changed = filecache.filestate(path, state)
+    assert not changed
+    assert touched == (0, state.size, state.hash)
+    path.write_bytes(b"changed")
+    newstate, changed = filecache.filestate(path, touched)
+    assert changed
+    assert newstate.hash != state.hash
+
+
+def test_sqlitecache(tmp_path) -> None:
+    class Cache(filecache.SQLiteCache):
+        schema = "CREATE TABLE IF NOT EXISTS values_ (value TEXT);"
+
+    with Cache(tmp_path / "cache.db") as cache:
+        cache.connection.execute("INSERT INTO values_ VALUES ('one')")
+    with Cache(tmp_path / "cache.db") as cache:
+        assert cache.connection.execute("SELECT value FROM values_").fetchall() == [
+            ("one",)
+        ]
@@ -724,6 +724,16 @@ class TestParseArgs:
         with pytest.raises(SystemExit):
             parser.parse_args([])
 
+    def test_jobs(self, capsys) -> None:
+        parser = optrecurse.RecursiveOptionParser({"txt": ("po", None)})
+        options, _args = parser.parse_args(["input.txt"])
+        assert parser.getjobs(options) == 1
+        options, _args = parser.parse_args(["--jobs", "0", "input.txt"])
+        assert parser.getjobs(options) == (os.cpu_count() or 1)
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--jobs", "-4", "input.txt"])
+        assert "--jobs must be 0 or more" in capsys.readouterr().err
+
     def test_single_item_list_is_unwrapped(self) -> None:
         parser = optrecurse.RecursiveOptionParser({"txt": ("po", None)})
         options, _args = parser.parse_args(["-i", "only.txt"])
@@ -1177,3 +1187,25 @@ class TestRecursiveProcess:
         with caplog.at_level(logging.WARNING):
             parser.recursiveprocess(options)
         assert "Error processing" in caplog.text
+
+
+class TestForkMap:
+    def test_forkmap(self, caplog) -> None:
+        def invert(number):
+            return 1 / number
+
+        parser = optrecurse.RecursiveOptionParser({})
+        options = SimpleNamespace(errorlevel="message")
+        with caplog.at_level(logging.WARNING):
+            results = list(
+                parser.forkmap(
+                    options,
+                    invert,
+                    [1, 0, 4],
+                    2,
+                    lambda number: f"Cannot invert {number}",
+                )
+            )
+        assert results == [(True, 1.0), (False, None), (True, 0.25)]
+        assert "Cannot invert 0: division by zero" in caplog.text
+        assert optrecurse._forkjob is None
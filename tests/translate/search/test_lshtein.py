@@ -32,3 +32,25 @@ class TestLevenshtein:
         # since the sentence is long it might be chopped and report higher.
         assert levenshtein.similarity(sentence, sentence[0:62], 0) > 25
         assert levenshtein.similarity(sentence, sentence[0:62], 0) < 50
+
+    def test_similarity_from_distance(self) -> None:
+        """Tests that similarity can be calculated from a known distance."""
+        sentence = "A long, dreary sentence about a cow that never new his mother."
+        levenshtein = lshtein.LevenshteinComparer(40)
+        pairs = [
+            ("word", "word"),
+            ("word", "words"),
+            ("word", "wood"),
+            ("aaa", "bbb"),
+            ("word", ""),
+            (sentence, sentence[0:45]),
+            (sentence, sentence[0:20]),
+            (sentence, sentence.upper()),
+            ("Cow", sentence),
+        ]
+        for a, b in pairs:
+            dist = lshtein.distance(a[:40], b[:40])
+            for stoppercentage in (0, 40, 75, 90):
+                assert levenshtein.similarity_from_distance(
+                    len(a), len(b), dist, stoppercentage
+                ) == levenshtein.similarity(a, b, stoppercentage)
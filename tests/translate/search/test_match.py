@@ -131,3 +131,145 @@ class TestMatch:
         assert candidates == ["preorder"]
         candidates = self.candidatestrings(matcher.matches("You can pre order"))
         assert candidates == ["pre order"]
+
+    def test_index(self) -> None:
+        """Test that the n-gram index does not change the results."""
+        sources = [
+            "Open file",
+            "Open files",
+            "Open the file",
+            "Close file",
+            "Save file as...",
+            "Save all files",
+            "Could not open file",
+            "File not found",
+            "ab",
+            "An error occurred while opening the file",
+            "An error occurred while saving the file",
+        ]
+        csvfile = self.buildcsv(sources)
+        queries = [
+            "Open file",
+            "Opened file",
+            "Save files as...",
+            "An error occurred while closing the file",
+            "ab",
+            "xyz",
+            "",
+        ]
+        for min_similarity in (40, 75, 90):
+            for max_length in (10, 70):
+                plain = match.matcher(
+                    csvfile,
+                    max_candidates=1,
+                    min_similarity=min_similarity,
+                    max_length=max_length,
+                    useindex=False,
+                )
+                indexed = match.matcher(
+                    csvfile,
+                    max_candidates=1,
+                    min_similarity=min_similarity,
+                    max_length=max_length,
+                )
+                for query in queries:
+                    assert self.candidatestrings(
+                        indexed.matches(query)
+                    ) == self.candidatestrings(plain.matches(query))
+
+    def test_index_extendtm(self) -> None:
+        """Test that the index is updated when extending the TM."""
+        csvfile = self.buildcsv(["Close application", "Do something"])
+        matcher = match.matcher(csvfile)
+        assert matcher.matches("Open file...") == []
+        assert matcher.index is not None
+        matcher.extendtm(self.buildcsv(["Open file"]).units)
+        assert matcher.index is None
+        candidates = self.candidatestrings(matcher.matches("Open file..."))
+        assert candidates == ["Open file"]
+
+    def test_terminology_index(self) -> None:
+        """Test that the terminology automaton does not change the results."""
+        csvfile = self.buildcsv(
+            [
+                "file",
+                "files",
+                "open file",
+                "computer",
+                "category",
+                "pre-order",
+                "down time",
+                "ISP (Internet Service Provider)",
+            ],
+            ["lêer", "lêers", "open lêer", "rekenaar", "kategorie", "", "", "ISP"],
+        )
+        texts = [
+            "Open the files on your computer",
+            "Open file in the categories",
+            "You can preorder during the downtime of your ISP",
+            "abc",
+        ]
+        indexed = match.terminologymatcher(csvfile)
+        plain = match.terminologymatcher(csvfile)
+        plain.useindex = False
+        for text in texts:
+            units = indexed.matches(text)
+            assert [(unit.source, unit.target) for unit in units] == [
+                (unit.source, unit.target) for unit in plain.matches(text)
+            ]
+            if units:
+                assert indexed.match_info == plain.match_info
+        indexed.extendtm(self.buildcsv(["abc"]).units)
+        assert self.candidatestrings(indexed.matches("abc")) == ["abc"]
+
+        # The variants of "down time" at the back are longer than the text
+        csvfile = self.buildcsv(["file", "down time"], ["lêer", "staantyd"])
+        indexed = match.terminologymatcher(csvfile)
+        plain = match.terminologymatcher(csvfile)
+        plain.useindex = False
+        assert indexed.matches("a file") == plain.matches("a file")
+
+    def test_terminology_variants(self) -> None:
+        """Test that the altered forms of the terms do not hide shorter terms."""
+        # The variants of "down time" at the back are longer than the text
+        csvfile = self.buildcsv(["file", "down time"], ["lêer", "staantyd"])
+        for useindex in (True, False):
+            matcher = match.terminologymatcher(csvfile)
+            matcher.useindex = useindex
+            assert self.candidatestrings(matcher.matches("a file")) == ["file"]
+            assert self.candidatestrings(matcher.matches("the downtime")) == [
+                "downtime"
+            ]
+
+    def test_matches_many(self) -> None:
+        """Test that looking up several texts gives the same results."""
+        csvfile = self.buildcsv(
+            [
+                "Hy skop die bal",
+                "Ek skop die bal",
+                "Jannie skop die bal",
+                "Ek skop die balle",
+                "Niemand skop die bal nie",
+                "hand",
+                "pond",
+            ]
+        )
+        texts = ["Ek skop die bal", "hond", "Ek skop die bal", "", "Iets anders"]
+        for max_candidates in (1, 3):
+            matcher = match.matcher(csvfile, max_candidates=max_candidates)
+            results = matcher.matches_many(texts)
+            assert len(results) == len(texts)
+            for text, units in zip(texts, results, strict=True):
+                assert self.candidatestrings(units) == self.candidatestrings(
+                    matcher.matches(text)
+                )
+
+    def test_ngrams(self) -> None:
+        assert match.ngrams("banana", 2) == [
+            ("ba", 1),
+            ("an", 1),
+            ("na", 1),
+            ("an", 2),
+            ("na", 2),
+        ]
+        assert match.ngrams("a", 2) == []
@@ -8,3 +8,12 @@ class TestTerminology:
         """Tests basic functionality."""
         termmatcher = terminology.TerminologyComparer()
         assert termmatcher.similarity("Open the file", "file") > 75
+
+    def test_automaton(self) -> None:
+        automaton = terminology.TerminologyAutomaton(
+            ["he", "she", "his", "hers", "file"]
+        )
+        assert automaton.find("ushers") == {"she": 1, "he": 2, "hers": 2}
+        assert automaton.find("this file, his files") == {"his": 1, "file": 5}
+        assert automaton.find("") == {}
+        assert automaton.find("nothing") == {}
@@ -0,0 +1,120 @@
+import os
+
+from translate.search import match, tmdb
+from translate.storage import tmx
+from translate.tools import tmbuild
+
+PO_FILE = b"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+# Translator comment
+msgid "Open file"
+msgstr "Maak leer oop"
+
+#, fuzzy
+msgid "Close file"
+msgstr "Sluit leer"
+
+msgid "Untranslated"
+msgstr ""
+
+msgid "One file"
+msgid_plural "%d files"
+msgstr[0] "Een leer"
+msgstr[1] "%d lere"
+"""
+
+
+class TestTMDB:
+    @staticmethod
+    def write(path, content) -> str:
+        path.write_bytes(content)
+        return str(path)
+
+    def test_update(self, tmp_path) -> None:
+        filename = self.write(tmp_path / "af.po", PO_FILE)
+        with tmdb.TMDB(str(tmp_path / "tm.tmdb")) as database:
+            assert database.update([filename]) == 1
+            assert database.getpaths() == [os.path.abspath(filename)]
+            units = database.units
+            assert [unit.source for unit in units] == [
+                "Open file",
+                "Close file",
+                "One file",
+            ]
+            assert units[0].getnotes(origin="translator") == "Translator comment"
+            assert not units[0].isfuzzy()
+            assert units[1].isfuzzy()
+            assert units[2].source.strings == ["One file", "%d files"]
+            assert units[2].target.strings == ["Een leer", "%d lere"]
+
+            # Nothing changed
+            assert database.update([filename]) == 0
+            # Touched, but the content is the same
+            os.utime(filename, (0, 0))
+            assert database.update([filename]) == 0
+
+            self.write(tmp_path / "af.po", PO_FILE.replace(b"Maak", b"Open"))
+            os.utime(filename, (1, 1))
+            assert database.update([filename]) == 1
+            assert database.units[0].target == "Open leer oop"
+            assert len(database.units) == 3
+
+    def test_prune(self, tmp_path) -> None:
+        first = self.write(tmp_path / "first.po", PO_FILE)
+        second = self.write(tmp_path / "second.po", PO_FILE)
+        with tmdb.TMDB(str(tmp_path / "tm.tmdb")) as database:
+            assert database.update([first, second]) == 2
+            assert len(database.units) == 6
+            assert database.update([first]) == 0
+            assert len(database.units) == 6
+            assert database.update([first], prune=True) == 0
+            assert database.getpaths() == [os.path.abspath(first)]
+            assert len(database.units) == 3
+
+    def test_matcher(self, tmp_path) -> None:
+        filename = self.write(tmp_path / "af.po", PO_FILE)
+        dbname = str(tmp_path / "tm.tmdb")
+        assert not tmdb.istmdb(filename)
+        assert not tmdb.istmdb(dbname)
+        with tmdb.TMDB(dbname) as database:
+            database.update([filename])
+            matcher = match.matcher(database)
+        assert tmdb.istmdb(dbname)
+        assert [unit.target for unit in matcher.matches("Open files")] == [
+            "Maak leer oop"
+        ]
+        # Fuzzy units are not used by default
+        assert matcher.matches("Close files") == []
+
+    def test_tmbuild(self, tmp_path, capsys) -> None:
+        (tmp_path / "af").mkdir()
+        self.write(tmp_path / "af" / "first.po", PO_FILE)
+        self.write(tmp_path / "af" / "readme.txt.unknown", b"Not a translation")
+        dbname = str(tmp_path / "tm.tmdb")
+        tmbuild.main(["-d", dbname, str(tmp_path / "af")])
+        assert capsys.readouterr().out == f"1 files added to {dbname}\n"
+        tmbuild.main(["-d", dbname, str(tmp_path / "af")])
+        assert capsys.readouterr().out == f"0 files added to {dbname}\n"
+        with tmdb.TMDB(dbname) as database:
+            assert len(database.units) == 3
+
+    def test_exporttmx(self, tmp_path, capsys) -> None:
+        filename = self.write(tmp_path / "af.po", PO_FILE)
+        dbname = str(tmp_path / "tm.tmdb")
+        tmxname = str(tmp_path / "tm.tmx")
+        tmbuild.main(["-d", dbname, "--tmx", tmxname, "-l", "af", filename])
+        assert capsys.readouterr().out == (
+            f"1 files added to {dbname}\n2 translations exported to {tmxname}\n"
+        )
+        with open(tmxname, "rb") as handle:
+            store = tmx.tmxfile(handle)
+        assert [(unit.source, unit.target) for unit in store.units] == [
+            ("Open file", "Maak leer oop"),
+            ("One file", "Een leer"),
+        ]
+        assert store.units[0].getnotes() == "Translator comment"
+        # Exporting without adding files
+        tmbuild.main(["-d", dbname, "--tmx", tmxname, "-l", "af"])
+        assert capsys.readouterr().out == f"2 translations exported to {tmxname}\n"
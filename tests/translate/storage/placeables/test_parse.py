@@ -0,0 +1,41 @@
+import pytest
+
+from translate.storage.placeables import general, parse
+from translate.storage.placeables.parse import RegexTokenizer, compile_parsers
+from translate.tools import podebug
+
+STRINGS = [
+    "",
+    "Plain text",
+    "%s",
+    "Hello %s, you have %d new messages.\n",
+    "Line one\r\nLine two\n",
+    'Click <img src="image.jpg" alt="Open %s &amp; <b>more</b>"> now',
+    'alt="ABC"',
+    "Visit http://example.com/path?x=1 or mail joe@example.com",
+    "Use --help or -i with /usr/bin/python and ~/docs/file.txt",
+    "The HTTP_PROXY for iPod and OpenTran costs €1,000.50…",
+    "{0,number,integer} of {count} {{total}} @@name@@ %1$s %L1 %(file)s",
+    "  Leading and trailing  ",
+    "&brand.name; &#123; “quoted” «x» — –",
+]
+
+
+def generic_parse(string, parsers):
+    """Parses with the placeables expanded and pruned one by one."""
+    return parse(string, [lambda text, func=func: func(text) for func in parsers])
+
+
+@pytest.mark.parametrize("string", STRINGS)
+@pytest.mark.parametrize(
+    "parsers",
+    [general.parsers, podebug.podebug_parsers, general.parsers[::-1]],
+    ids=["general", "podebug", "reversed"],
+)
+def test_tokenizer(string, parsers) -> None:
+    assert repr(parse(string, parsers)) == repr(generic_parse(string, parsers))
+
+
+def test_compile_parsers() -> None:
+    assert isinstance(compile_parsers(tuple(general.parsers)), RegexTokenizer)
+    assert compile_parsers((*general.parsers, str.split)) is None
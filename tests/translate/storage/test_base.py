@@ -22,6 +22,7 @@ import json
 import os
 from io import BytesIO
 
+import charset_normalizer
 from pytest import raises
 
 from translate.misc.multistring import multistring
@@ -544,3 +545,55 @@ class TestPrepareInputOwnership:
             base.prepare_input(handle, close_handle=True)
 
         assert handle.closed
+
+
+class TestDetectEncoding:
+    TEXT = "Grüße aus Köln, déjà vu\n" * 4000
+
+    @staticmethod
+    def detect(text, strategy, filename=None):
+        store = base.TranslationStore(encoding="auto")
+        store.encoding_detection = strategy
+        store.filename = filename
+        return store.detect_encoding(text, ["utf-8", "utf-16"])
+
+    def test_quick_detection(self) -> None:
+        def detected(text):
+            result = base.TranslationStore.quick_detection(text)
+            return result and result["encoding"]
+
+        assert detected(b"plain") == "ascii"
+        assert detected("é".encode()) == "utf-8"
+        assert detected("é".encode("utf-8-sig")) == "utf-8-sig"
+        assert detected("é".encode("utf-16")) == "utf-16"
+        assert detected("é".encode("utf-32")) == "utf-32"
+        # UTF-16 without a BOM and other encodings need detection
+        assert detected("a".encode("utf-16-le")) is None
+        assert detected("é".encode("latin1")) is None
+
+    def test_strategies(self) -> None:
+        for encoding in ("utf-8", "utf-8-sig", "utf-16", "utf-16-le", "latin1"):
+            data = self.TEXT.encode(encoding)
+            assert self.detect(data, "sample") == self.detect(data, "full")
+        with raises(ValueError, match="strategy"):
+            self.detect(self.TEXT.encode("latin1"), "guess")
+
+    def test_cache(self, monkeypatch, tmp_path) -> None:
+        calls = []
+
+        def detect(text, detect=charset_normalizer.detect):
+            calls.append(len(text))
+            return detect(text)
+
+        monkeypatch.setattr(charset_normalizer, "detect", detect)
+        data = self.TEXT.encode("latin1")
+        filename = str(tmp_path / "cached.csv")
+        expected = self.detect(data, "full")
+        assert len(calls) == 1
+        assert self.detect(data, "cache", filename) == expected
+        assert self.detect(data, "cache", filename) == expected
+        assert len(calls) == 2
+        # Changed content or another file is detected again
+        self.detect(data + b"\xe9", "cache", filename)
+        self.detect(data, "cache", str(tmp_path / "other.csv"))
+        assert len(calls) == 4
@@ -119,6 +119,20 @@ class BaseTestFactory:
         store = factory.getobject(filename)
         assert isinstance(store, self.expected_instance)  # ty:ignore[unresolved-attribute]
 
+    def test_iterunits(self) -> None:
+        """Tests that the units are the same as those of the store."""
+        store = factory.getobject(givefile(self.filename, self.file_content))  # ty:ignore[unresolved-attribute]
+        expected = [(unit.source, unit.target) for unit in store.units]
+        filename = os.path.join(self.testdir, f"{self.filename}.gz")  # ty:ignore[unresolved-attribute]
+        with GzipFile(filename, mode="wb") as gzfile:
+            gzfile.write(self.file_content)  # ty:ignore[unresolved-attribute]
+        for storefile in (
+            givefile(self.filename, self.file_content),  # ty:ignore[unresolved-attribute]
+            filename,
+        ):
+            units = factory.iterunits(storefile)
+            assert [(unit.source, unit.target) for unit in units] == expected
+
     def test_directory(self) -> None:
         """Test that a directory is correctly detected."""
         with pytest.raises(ValueError):
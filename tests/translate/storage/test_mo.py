@@ -1,8 +1,10 @@
 import os
+import struct
 import subprocess
 import sys
 from io import BytesIO
 
+from translate.misc.multistring import multistring
 from translate.storage import factory, mo
 from translate.tools import pocompile
 
@@ -583,3 +585,53 @@ class TestMOFile(test_base.TestTranslationStore):
         store_big = self.StoreClass(MO_BIG_ENDIAN)
         store_little = self.StoreClass(MO_LITTLE_ENDIAN)
         assert store_big.units == store_little.units
+
+
+class TestMoReader:
+    @staticmethod
+    def mocontent() -> bytes:
+        store = mo.mofile()
+        store.updateheader(add=True, Content_Type="text/plain; charset=UTF-8")
+        for number in range(50):
+            unit = store.addsourceunit(f"Message {number}")
+            unit.target = f"Boodskap {number}"
+        unit = store.addsourceunit("Open")
+        unit.setcontext("menu")
+        unit.target = "Maak oop"
+        unit = store.addsourceunit(multistring(["%d file", "%d files"]))
+        unit.target = multistring(["%d lêer", "%d lêers"])
+        return bytes(store)
+
+    def check(self, reader) -> None:
+        assert len(reader) == 53
+        assert reader.encoding == "UTF-8"
+        assert reader.translate("Message 7") == "Boodskap 7"
+        assert reader.translate("Open") is None
+        assert reader.translate("Open", context="menu") == "Maak oop"
+        assert reader.translate("%d file") == multistring(["%d lêer", "%d lêers"])
+        assert reader.translate("Missing") is None
+        units = list(reader)
+        assert len(units) == 53
+        assert units[0].isheader()
+
+    def test_file(self, tmp_path) -> None:
+        filename = tmp_path / "af.mo"
+        filename.write_bytes(self.mocontent())
+        with mo.MoReader(str(filename)) as reader:
+            self.check(reader)
+        with open(filename, "rb") as handle, mo.MoReader(handle) as reader:
+            self.check(reader)
+
+    def test_without_hash_table(self) -> None:
+        content = bytearray(self.mocontent())
+        # Clear the size of the hash table
+        struct.pack_into("<I", content, 20, 0)
+        reader = mo.MoReader(bytes(content))
+        assert reader.sizehash == 0
+        self.check(reader)
+
+    def test_endian(self) -> None:
+        for content in (MO_BIG_ENDIAN, MO_LITTLE_ENDIAN):
+            reader = mo.MoReader(content)
+            assert reader.translate("simple") == "Een"
+            assert reader.translate("unicode") == "\u2020wee"
@@ -6,7 +6,7 @@ from pytest import mark, raises
 
 from translate.__version__ import sver
 from translate.misc.multistring import multistring
-from translate.storage import pypo
+from translate.storage import poparser, pypo
 
 from . import test_po
 
@@ -113,6 +113,17 @@ class TestPYPOUnit(test_po.TestPOUnit):
         assert CountingList.contains_calls == 0
         assert unit.othercomments == ["#\n", "# existing\n", "#\n", "# new\n"]
 
+    def test_merge_keeps_other_unit(self) -> None:
+        """Merging should not wrap the translation of the other unit again."""
+        unit = self.UnitClass("message")
+        other = self.UnitClass("message")
+        other.msgstr = ['""', '"A translation "', '"wrapped by hand"']
+
+        unit.merge(other)
+
+        assert unit.target == "A translation wrapped by hand"
+        assert other.msgstr == ['""', '"A translation "', '"wrapped by hand"']
+
     def test_merge_source_references_does_not_scan_existing_references(self) -> None:
         """Source reference merging should use indexed membership."""
 
@@ -1192,3 +1203,93 @@ msgstr "Monde"
 
         # Obsolete unit should start at line 11
         assert pofile.units[2].line_number == 11
+
+    def test_iter_units(self) -> None:
+        posource = (
+            'msgid ""\r\nmsgstr ""\r\n'
+            '"Content-Type: text/plain; charset=KOI8-R\\n"\r\n\r\n'
+            '#: file.c:1\r\nmsgid "Hello"\r\nmsgstr "Привет"\r\n\r\n'
+            '#~ msgid "Obsolete"\r\n#~ msgstr "Устарело"\r\n'
+        ).encode("koi8-r")
+        store = pypo.pofile(noheader=True)
+        units = list(store.iterparse(BytesIO(posource)))
+        assert [str(unit) for unit in units] == [
+            str(unit) for unit in self.poparse(posource).units
+        ]
+        assert store.units == []
+        assert store.encoding == "KOI8-R"
+        assert units[1].target == "Привет"
+        assert units[1].getlocations() == ["file.c:1"]
+        assert units[1].line_number == 5
+        assert units[2].isobsolete()
+        assert str(units[2]) == '#~ msgid "Obsolete"\r\n#~ msgstr "Устарело"\r\n'
+
+    def test_iter_units_discards_lines(self) -> None:
+        entries = b"".join(
+            f'msgid "Source {index}"\nmsgstr "Target {index}"\n\n'.encode()
+            for index in range(1000)
+        )
+        lines = pypo.PoLineStream(BytesIO(self.LARGE_PO_HEADER + entries), 100)
+        state = poparser.PoParseState(lines, pypo.pounit)
+        targets = []
+        for unit in poparser.iter_units(state, pypo.pofile()):
+            assert len(lines._lines) < 20
+            targets.append(unit.target)
+        assert len(targets) == 1001
+        assert targets[-1] == "Target 999"
+        with raises(IndexError):
+            lines[0]
+
+    def test_writer(self) -> None:
+        posource = (
+            b'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+            b'#: a.c\nmsgid "One"\nmsgstr "Un"\n\n'
+            b'msgid "Two"\nmsgstr "Deux"\n'
+        )
+        out = BytesIO()
+        writer = pypo.PoWriter(out)
+        for unit in pypo.iter_units(BytesIO(posource)):
+            writer.write(unit)
+        assert out.getvalue() == posource
+        assert bytes(self.poparse(posource)) == posource
+
+
+class TestCompactPYPOUnit(TestPYPOUnit):
+    UnitClass = pypo.compactpounit
+
+    def test_unset_lists(self) -> None:
+        unit = self.UnitClass("message")
+        assert not unit.__dict__
+        assert unit.othercomments == []
+        assert unit._othercomments is None
+        comments = unit.othercomments
+        comments.append("# comment\n")
+        comments.append("# other comment\n")
+        assert unit.othercomments is comments
+        assert unit.getnotes() == "comment\nother comment"
+        # Unrelated lists are not created
+        assert unit._automaticcomments is None
+        copied = unit.copy()
+        assert copied.othercomments == comments
+        assert copied.othercomments is not comments
+
+
+class compactpofile(pypo.pofile):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, compact=True, **kwargs)
+
+
+class TestCompactPYPOFile(TestPYPOFile):
+    StoreClass = compactpofile
+
+    def test_compact_units(self) -> None:
+        posource = b'#: a.c\nmsgid "One"\nmsgstr "Un"\n'
+        unit = self.poparse(posource).units[0]
+        assert isinstance(unit, pypo.compactpounit)
+        assert not unit.__dict__
+        assert unit._msgctxt is None
+        assert unit._othercomments is None
+        assert unit.getlocations() == ["a.c"]
+        assert [unit.target for unit in pypo.iter_units(posource, compact=True)] == [
+            "Un"
+        ]
@@ -185,3 +185,62 @@ class TestTMXfile(test_base.TestTranslationStore):
         assert prop_index < first_tuv_index, (
             "prop element should appear before tuv elements"
         )
+
+
+class TestTMXIterparse:
+    def test_iterparse(self) -> None:
+        store = tmx.tmxfile()
+        for number in range(10):
+            store.addtranslation(f"Source {number}", "en", f"Bron {number}", "af")
+        content = bytes(store)
+        tmxfile = tmx.tmxfile()
+        units = []
+        for unit in tmxfile.iterparse(BytesIO(content)):
+            root = tmxfile.document.getroot()
+            assert unit.xmlelement.getroottree().getroot() is root
+            # The previous units were moved out of the document
+            assert unit.xmlelement.getprevious() is None
+            assert all(
+                previous.xmlelement.getroottree().getroot() is not root
+                for previous in units
+            )
+            units.append(unit)
+        assert not tmxfile.units
+        assert [(unit.source, unit.target) for unit in units] == [
+            (unit.source, unit.target) for unit in tmx.tmxfile(content).units
+        ]
+        # The units keep a copy of their parent
+        assert units[0].xmlelement.getparent().tag == "body"
+
+    def test_iterparse_empty(self) -> None:
+        content = bytes(tmx.tmxfile())
+        tmxfile = tmx.tmxfile()
+        assert not list(tmxfile.iterparse(content))
+        assert tmxfile.getsourcelanguage() == "en"
+
+
+class TestTmxWriter:
+    translations = (
+        ("One", "en", "Een", "af", "A note", "context"),
+        ("Two & <b>two</b>", "en", "Twee\nreëls", "af", None, None),
+    )
+
+    def test_addtranslation(self) -> None:
+        for translations in ((), self.translations):
+            store = tmx.tmxfile()
+            out = BytesIO()
+            with tmx.TmxWriter(out) as writer:
+                for translation in translations:
+                    store.addtranslation(*translation)
+                    writer.addtranslation(*translation)
+            assert out.getvalue() == bytes(store)
+
+    def test_writeunits(self) -> None:
+        store = tmx.tmxfile(sourcelanguage="af")
+        for translation in self.translations:
+            store.addtranslation(*translation)
+        content = bytes(store)
+        out = BytesIO()
+        with tmx.TmxWriter(out, "af") as writer:
+            writer.writeunits(tmx.tmxfile().iterparse(content))
+        assert out.getvalue() == content
@@ -431,3 +431,74 @@ class TestTSfile(test_base.TestTranslationStore):
 
         tsfile = ts.tsfile.parsestring(tsstr)
         assert tsfile.units[0].isblank() is False
+
+    def test_iterparse(self) -> None:
+        tsstr = b"""<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="af">
+<context>
+    <name>Dialog</name>
+    <message>
+        <location filename="dialog.cpp" line="+10"/>
+        <source>Open</source>
+        <translation>Oop</translation>
+    </message>
+    <message>
+        <source>Close</source>
+        <translation type="unfinished"></translation>
+    </message>
+</context>
+<context>
+    <name>Window</name>
+    <message>
+        <location line="+3"/>
+        <source>Open</source>
+        <translation>Maak oop</translation>
+    </message>
+    <message>
+        <location filename="window.cpp" line="20"/>
+        <source>Save</source>
+        <translation>Stoor</translation>
+    </message>
+    <message>
+        <location line="+5"/>
+        <source>Quit</source>
+        <translation>Verlaat</translation>
+    </message>
+</context>
+</TS>
+"""
+        tsfile = ts.tsfile()
+        units = []
+        for unit in tsfile.iterparse(tsstr):
+            # The store is not used to find the previous unit
+            assert tsfile.units == []
+            units.append(unit)
+        assert [
+            (unit.getcontext(), unit.source, unit.target, unit.getlocations())
+            for unit in units
+        ] == [
+            ("Dialog", "Open", "Oop", ["dialog.cpp:10"]),
+            ("Dialog", "Close", "", []),
+            ("Window", "Open", "Maak oop", ["dialog.cpp:13"]),
+            ("Window", "Save", "Stoor", ["window.cpp:20"]),
+            ("Window", "Quit", "Verlaat", ["window.cpp:25"]),
+        ]
+        assert tsfile.gettargetlanguage() == "af"
+
+    def test_iterparse_contexts(self) -> None:
+        """Units keep their context when they share copies of the context."""
+        contexts = "".join(
+            f"<context><name>{name}</name>"
+            + "".join(
+                f"<message><source>{name} {i}</source></message>" for i in range(100)
+            )
+            + "</context>"
+            for name in ("Dialog", "Window")
+        )
+        tsfile = ts.tsfile()
+        units = list(tsfile.iterparse(f"<TS>{contexts}</TS>".encode()))
+        assert [(unit.getcontext(), unit.source) for unit in units] == [
+            (name, f"{name} {i}") for name in ("Dialog", "Window") for i in range(100)
+        ]
+        assert not list(tsfile.document.iter("message"))
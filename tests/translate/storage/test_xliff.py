@@ -1538,3 +1538,100 @@ class TestXLIFFfile(test_base.TestTranslationStore):
         assert "XLIFF 2" in str(exc_info.value)
         assert "namespace" in str(exc_info.value)
         assert "xliff2.Xliff2File" in str(exc_info.value)
+
+
+class TestXLIFFIterparse:
+    def test_iterparse(self) -> None:
+        xliffsource = b"""<?xml version="1.0" encoding="utf-8"?>
+<xliff version="1.1" xmlns="urn:oasis:names:tc:xliff:document:1.1">
+<file original="one.txt" source-language="en" target-language="af">
+<body>
+<trans-unit id="1"><source>One</source><target>Een</target></trans-unit>
+<group id="g">
+<trans-unit id="2"><source>Two</source></trans-unit>
+</group>
+</body>
+</file>
+<file original="two.txt" source-language="en" target-language="af">
+<body>
+<trans-unit id="1" approved="yes"><source>One</source><target>Een</target></trans-unit>
+</body>
+</file>
+</xliff>"""
+        xlifffile = xliff.xlifffile()
+        units = list(xlifffile.iterparse(xliffsource))
+        assert not xlifffile.units
+        expected = xliff.xlifffile.parsestring(xliffsource).units
+        assert [
+            (unit.getid(), unit.source, unit.target, unit.isapproved())
+            for unit in units
+        ] == [
+            (unit.getid(), unit.source, unit.target, unit.isapproved())
+            for unit in expected
+        ]
+        assert units[2].getid() == "two.txt\x041"
+        # The units were moved out of the document
+        units_left = xlifffile.document.iter(xlifffile.namespaced("trans-unit"))
+        assert not list(units_left)
+        assert units[1].xmlelement.getparent().get("id") == "g"
+
+    def test_iterparse_xliff2(self) -> None:
+        with pytest.raises(ValueError, match="XLIFF 2"):
+            list(
+                xliff.xlifffile().iterparse(
+                    b'<xliff xmlns="urn:oasis:names:tc:xliff:document:2.0" version="2.0">'
+                    b'<file id="f1"><unit id="1"><segment><source>Hello</source>'
+                    b"</segment></unit></file></xliff>"
+                )
+            )
+
+
+class TestXLIFFLazyUnits:
+    XLIFFSOURCE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xliff version="1.1" xmlns="urn:oasis:names:tc:xliff:document:1.1">
+<file original="one.txt" source-language="en" target-language="af">
+<body>
+<trans-unit id="1"><source>One</source><target>Een</target></trans-unit>
+<group id="g">
+<trans-unit id="2"><source>Two</source></trans-unit>
+</group>
+<trans-unit id="3"><target>Drie</target></trans-unit>
+</body>
+</file>
+<file original="two.txt" source-language="en" target-language="af">
+<body>
+<trans-unit id="1"><source>One</source><target>Eentjie</target></trans-unit>
+</body>
+</file>
+</xliff>"""
+
+    def test_lookup(self) -> None:
+        xlifffile = xliff.xlifffile.parsestring(self.XLIFFSOURCE)
+        assert xlifffile.findid("two.txt\x041").target == "Eentjie"
+        assert xlifffile.findunit("Two").getid() == "one.txt\x042"
+        assert [unit.target for unit in xlifffile.findunits("One")] == [
+            "Een",
+            "Eentjie",
+        ]
+        # Units without a source are not indexed
+        assert xlifffile.findid("one.txt\x043") is None
+        # Only the units which were looked up were created
+        assert len(xlifffile._unitcache) == 4
+        assert list(xlifffile.getids()) == [
+            "one.txt\x041",
+            "one.txt\x042",
+            "two.txt\x041",
+        ]
+
+    def test_units(self) -> None:
+        xlifffile = xliff.xlifffile.parsestring(self.XLIFFSOURCE)
+        unit = xlifffile.findid("one.txt\x042")
+        assert xlifffile.units[1] is unit
+        assert xlifffile.findid("one.txt\x042") is unit
+        eager = xliff.xlifffile.parsestring(self.XLIFFSOURCE)
+        assert [(unit.getid(), unit.source, unit.target) for unit in eager.units] == [
+            (unit.getid(), unit.source, unit.target) for unit in xlifffile.units
+        ]
+        # New units go to the last file, as before
+        xlifffile.addsourceunit("Four")
+        assert xlifffile.units[-1].getid().startswith("two.txt\x04")
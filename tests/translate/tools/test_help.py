@@ -25,6 +25,7 @@ location = Path(__file__).parent.parent.parent.parent / "translate" / "tools"
         "pretranslate",
         "pydiff",
         "pypo2phppo",
+        "tmbuild",
     ],
 )
 def test_help(command: str) -> None:
@@ -0,0 +1,105 @@
+import os
+from io import BytesIO
+
+from translate.misc.multistring import multistring
+from translate.storage import mo, po
+from translate.tools import pocompile
+
+PO_DOC = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"POT-Creation-Date: 2026-01-01 00:00+0000\\n"
+
+msgid "One"
+msgstr "Een"
+
+msgctxt "verb"
+msgid "File"
+msgstr "Liasseer"
+
+msgid "_: comment\\n"
+"Open"
+msgstr "Oop"
+
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d lêer"
+msgstr[1] "%d lêers"
+
+#, fuzzy
+msgid "Two"
+msgstr "Twee"
+
+msgid "Three"
+msgstr ""
+"""
+
+
+def compiledunits(mofile):
+    return {(unit.getcontext(), unit.source): unit.target for unit in mofile.units}
+
+
+class TestPOCompile:
+    def test_convertstore(self) -> None:
+        store = po.pofile(PO_DOC.encode())
+        units = compiledunits(
+            mo.mofile.parsestring(pocompile.POCompile.convertstore(store))
+        )
+        assert units == {
+            ("", ""): "Content-Type: text/plain; charset=UTF-8\n",
+            ("", "One"): "Een",
+            ("verb", "File"): "Liasseer",
+            ("", "_: comment\nOpen"): "Oop",
+            ("", multistring(["%d file", "%d files"])): multistring(
+                ["%d lêer", "%d lêers"]
+            ),
+        }
+        fuzzy = compiledunits(
+            mo.mofile.parsestring(pocompile.POCompile.convertstore(store, True))
+        )
+        assert fuzzy["", "Two"] == "Twee"
+        assert ("", "Three") not in fuzzy
+
+    def test_cache(self, tmp_path) -> None:
+        inputfile = tmp_path / "af.po"
+        inputfile.write_text(PO_DOC, encoding="utf-8")
+        outputfile = tmp_path / "af.mo"
+        argv = ["--cache", str(tmp_path / "cache.db"), str(inputfile), str(outputfile)]
+        compiled = []
+
+        def convertmo(inputfile, outputfile, templatefile, includefuzzy=False):
+            compiled.append(includefuzzy)
+            return pocompile.convertmo(
+                inputfile, outputfile, templatefile, includefuzzy
+            )
+
+        def run(*args) -> None:
+            parser = pocompile.POCompileOptionParser({"po": ("mo", convertmo)})
+            parser.add_fuzzy_option()
+            parser.run([*args, *argv])
+
+        run()
+        assert compiled == [False]
+        expected = outputfile.read_bytes()
+        assert expected == pocompile.POCompile.convertstore(
+            po.pofile(BytesIO(PO_DOC.encode()))
+        )
+        run()
+        # Touched, but the content is the same
+        os.utime(inputfile)
+        run()
+        assert compiled == [False]
+        # Different options
+        run("--fuzzy")
+        assert compiled == [False, True]
+        # Modified output
+        outputfile.write_bytes(b"")
+        run("--fuzzy")
+        assert compiled == [False, True, True]
+        inputfile.write_text(
+            PO_DOC.replace('"Three"\nmsgstr ""', '"Three"\nmsgstr "Drie"'),
+            encoding="utf-8",
+        )
+        run("--fuzzy")
+        assert compiled == [False, True, True, True]
+        assert outputfile.read_bytes() != expected
@@ -3,6 +3,7 @@ import tempfile
 from io import BytesIO
 
 from translate.storage import po
+from translate.tools import poconflicts
 from translate.tools.poconflicts import ConflictOptionParser
 
 
@@ -50,7 +51,7 @@ def make_po_bytes(units):
 
 
 class TestConflictOptionParser:
-    def run_conflicts(self, po_files_content, ignorecase=True):
+    def run_conflicts(self, po_files_content, *args, ignorecase=True):
         """Run conflict detection on multiple in-memory PO files and return output files."""
         parser = make_parser()
         with (
@@ -61,7 +62,7 @@ class TestConflictOptionParser:
                 with open(os.path.join(inputdir, f"file{i}.po"), "wb") as fh:
                     fh.write(content)
 
-            options_args = ["-i", inputdir, "-o", outputdir]
+            options_args = ["-i", inputdir, "-o", outputdir, *args]
             if ignorecase:
                 options_args.append("-I")
             options, _ = parser.parse_args(options_args)
@@ -92,3 +93,52 @@ class TestConflictOptionParser:
         # Should not raise KeyError
         result = self.run_conflicts([file1, file2, file3, file4, file5, file6])
         assert len(result) > 0
+
+    @staticmethod
+    def translations(result):
+        """Returns the file and translation of the units in every output file."""
+        return {
+            fname: sorted(
+                (os.path.basename(unit.othercomments[0].strip()), unit.target)
+                for unit in po.pofile(content).units
+                if not unit.isheader()
+            )
+            for fname, content in result.items()
+        }
+
+    def test_conflicts(self):
+        files = [
+            make_po_bytes([("Open", "Oop"), ("Save", "Stoor"), ("A", "'n")]),
+            make_po_bytes([("Open", "Maak oop"), ("Save", "Stoor"), ("A", "Een")]),
+        ]
+        assert self.translations(self.run_conflicts(files)) == {
+            "open.po": [("file0.po", "Oop"), ("file1.po", "Maak oop")]
+        }
+
+    def test_jobs(self):
+        files = [
+            make_po_bytes([("Open", "Oop"), ("Save", f"Stoor {i % 2}")])
+            for i in range(4)
+        ]
+        expected = self.translations(self.run_conflicts(files))
+        assert list(expected) == ["save.po"]
+        assert self.translations(self.run_conflicts(files, "--jobs=2")) == expected
+
+    def test_hash_collisions(self, monkeypatch):
+        def colliding_hash(text):
+            # The sources collide, the targets do not
+            return 0 if text in {"open", "save"} else hash(text)
+
+        monkeypatch.setattr(poconflicts, "hash", colliding_hash, raising=False)
+        files = [
+            make_po_bytes([("Open", "Oop"), ("Save", "Stoor")]),
+            make_po_bytes([("Open", "Oop"), ("Save", "Stoor")]),
+        ]
+        assert self.run_conflicts(files) == {}
+        files = [
+            make_po_bytes([("Open", "Oop"), ("Save", "Stoor")]),
+            make_po_bytes([("Save", "Stoor"), ("Open", "Maak oop")]),
+        ]
+        assert self.translations(self.run_conflicts(files)) == {
+            "open.po": [("file0.po", "Oop"), ("file1.po", "Maak oop")]
+        }
@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 from io import BytesIO
@@ -261,6 +262,45 @@ def test_csv_line_terminator(capsys: CaptureFixture[str]) -> None:
         assert line.strip(), "No line should be empty or whitespace-only"
 
 
+class TestStatsCache:
+    inputdata = TestPOCount.inputdata
+
+    def test_cache(self, tmp_path, monkeypatch) -> None:
+        filename = tmp_path / "af.po"
+        filename.write_bytes(self.inputdata)
+        stats = pocount.calcstats(str(filename))
+        cachefile = str(tmp_path / "stats.db")
+        with pocount.StatsCache(cachefile) as cache:
+            assert cache.calcstats(str(filename)) == stats
+
+        def calcstats(filename):
+            raise AssertionError(filename)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(pocount, "calcstats", calcstats)
+            with pocount.StatsCache(cachefile) as cache:
+                assert cache.calcstats(str(filename)) == stats
+                # Touched, but the content is the same
+                os.utime(filename, (0, 0))
+                assert cache.calcstats(str(filename)) == stats
+
+        filename.write_bytes(self.inputdata.replace(b'msgstr ""', b'msgstr "x"', 1))
+        with pocount.StatsCache(cachefile) as cache:
+            assert cache.calcstats(str(filename))["translated"] == 2
+
+    def test_calcdirstats(self, tmp_path) -> None:
+        (tmp_path / "af").mkdir()
+        (tmp_path / "af" / "one.po").write_bytes(self.inputdata)
+        (tmp_path / "af" / "two.po").write_bytes(self.inputdata)
+        cachefile = str(tmp_path / "stats.db")
+        for _ in range(2):
+            stats = pocount.calcdirstats([str(tmp_path / "af")], cachefile=cachefile)
+            assert stats["total"] == 6
+            assert stats["translated"] == 2
+            assert stats["extended"]["needs-work"]["units"] == 2
+        assert pocount.calcdirstats([str(tmp_path / "af")]) == stats
+
+
 class TestPOCountCategorization:
     """Test that units are categorized correctly."""
 
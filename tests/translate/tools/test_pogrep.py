@@ -1,5 +1,10 @@
+import os
+import shutil
+import sys
 from io import BytesIO
 
+import pytest
+
 from translate.storage import po, xliff
 from translate.tools import pogrep
 
@@ -224,3 +229,163 @@ class TestXLiffGrep:
             self.xliff_grep(xliff_text, "unavailable string")
         )
         assert xliff_result.isempty()
+
+
+class TestGrepIndex:
+    posource = """#: file.c:1
+msgid "Open file"
+msgstr "Maak lêer oop"
+
+# Menu entry
+msgid "Save file"
+msgstr "Stoor lêer"
+
+msgid "Quit"
+msgstr "Verlaat"
+"""
+
+    @staticmethod
+    def grep(tmp_path, *args):
+        output = tmp_path / "output"
+        shutil.rmtree(output, ignore_errors=True)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                [
+                    "pogrep",
+                    *args,
+                    "--progress=none",
+                    str(tmp_path / "input"),
+                    str(output),
+                ],
+            )
+            pogrep.main()
+        return {
+            path.name: [
+                unit.source
+                for unit in po.pofile(path.read_bytes()).units
+                if not unit.isheader()
+            ]
+            for path in sorted(output.glob("*.po"))
+        }
+
+    def test_index(self, tmp_path, monkeypatch) -> None:
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        (inputdir / "af.po").write_text(self.posource, encoding="utf-8")
+        (inputdir / "zu.po").write_text(
+            self.posource.replace("Open", "Close"), encoding="utf-8"
+        )
+        index = ["--index", str(tmp_path / "index.db")]
+        expected = {"af.po": ["Open file"]}
+        assert self.grep(tmp_path, "OPEN", "-I") == expected
+        assert self.grep(tmp_path, *index, "OPEN", "-I") == expected
+        # Only the files with candidates are read from an up to date index
+        read = []
+        getobject = pogrep.factory.getobject
+
+        def counting_getobject(storefile, *args, **kwargs):
+            read.append(os.path.basename(getattr(storefile, "name", storefile)))
+            return getobject(storefile, *args, **kwargs)
+
+        monkeypatch.setattr(pogrep.factory, "getobject", counting_getobject)
+        assert self.grep(tmp_path, *index, "OPEN", "-I") == expected
+        assert read == ["af.po"]
+        assert self.grep(tmp_path, *index, "Menu", "--search=notes") == {
+            "af.po": ["Save file"],
+            "zu.po": ["Save file"],
+        }
+        assert self.grep(tmp_path, *index, "file.c", "--search=locations") == {
+            "af.po": ["Open file"],
+            "zu.po": ["Close file"],
+        }
+        # Candidates of the index ignore case, the filter does not
+        assert self.grep(tmp_path, *index, "OPEN") == {}
+        # Changed files are indexed again
+        (inputdir / "zu.po").write_text(self.posource, encoding="utf-8")
+        read.clear()
+        assert self.grep(tmp_path, *index, "open", "-I") == {
+            "af.po": ["Open file"],
+            "zu.po": ["Open file"],
+        }
+        assert sorted(read) == ["af.po", "zu.po", "zu.po"]
+        # Regular expressions read every file
+        assert self.grep(tmp_path, *index, "-e", "^Op") == {
+            "af.po": ["Open file"],
+            "zu.po": ["Open file"],
+        }
+
+    def test_index_locations(self, tmp_path) -> None:
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        (inputdir / "af.po").write_text(
+            self.posource.replace("#: file.c:1", "#: file.c:1 file.h:2"),
+            encoding="utf-8",
+        )
+        index = ["--index", str(tmp_path / "index.db")]
+        args = ["c:1 file.h", "--search=locations"]
+        expected = {"af.po": ["Open file"]}
+        assert self.grep(tmp_path, *args) == expected
+        # Indexing the files and then searching the index
+        assert self.grep(tmp_path, *index, *args) == expected
+        assert self.grep(tmp_path, *index, *args) == expected
+
+    def test_index_jobs(self, tmp_path) -> None:
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        for name in ("af", "nl", "zu"):
+            (inputdir / f"{name}.po").write_text(self.posource, encoding="utf-8")
+        indexfile = tmp_path / "index.db"
+        expected = {f"{name}.po": ["Open file"] for name in ("af", "nl", "zu")}
+        for _run in range(2):
+            assert (
+                self.grep(tmp_path, "--index", str(indexfile), "--jobs=2", "Open")
+                == expected
+            )
+        with pogrep.GrepIndex(str(indexfile)) as index:
+            assert sorted(os.path.basename(path) for path in index.files) == [
+                "af.po",
+                "nl.po",
+                "zu.po",
+            ]
+
+    def test_index_reuse_parser(self, tmp_path, monkeypatch) -> None:
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        (inputdir / "af.po").write_text(self.posource, encoding="utf-8")
+        parser = pogrep.cmdlineparser()
+        for args in (["--index", str(tmp_path / "index.db"), "Open"], ["Save"]):
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                [
+                    "pogrep",
+                    *args,
+                    "--progress=none",
+                    str(inputdir),
+                    str(tmp_path / args[-1]),
+                ],
+            )
+            parser.run()
+            assert parser.index is None
+            assert parser.candidates is None
+        assert [
+            unit.source
+            for unit in po.pofile((tmp_path / "Save" / "af.po").read_bytes()).units
+            if not unit.isheader()
+        ] == ["Save file"]
+
+    def test_getmatches(self, tmp_path) -> None:
+        inputfile = tmp_path / "af.po"
+        inputfile.write_text(self.posource, encoding="utf-8")
+        grepfilter = pogrep.GrepFilter("lêer", "msgstr")
+        with pogrep.GrepIndex(str(tmp_path / "index.db")) as index:
+            for _run in range(2):
+                matches = index.getmatches(grepfilter, [str(inputfile)])
+                assert [
+                    (match.unit.source, match.start, match.end)
+                    for match in matches[str(inputfile)]
+                ] == [("Open file", 5, 9), ("Save file", 6, 10)]
+            with pytest.raises(ValueError, match="plain search strings"):
+                index.getmatches(pogrep.GrepFilter("l", "msgstr"), [str(inputfile)])
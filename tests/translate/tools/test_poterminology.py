@@ -1,7 +1,7 @@
 import logging
 from pathlib import Path
 
-from translate.storage import factory
+from translate.storage import factory, po
 from translate.tools import poterminology
 
 base_dir = Path(__file__).parent.parent.parent
@@ -67,3 +67,118 @@ class TestPOTerminology:
         assert "ignored" not in extractor.stopwords
         assert "bad stopword entry starts with" in caplog.text
         assert "all lines after error ignored" in caplog.text
+
+    @staticmethod
+    def termitems(terms):
+        return {
+            term: (score, unit.target, sorted(unit.getnotes().splitlines()))
+            for term, (score, unit) in terms.items()
+        }
+
+    def test_merge(self) -> None:
+        """Merged summaries of several files give the same terms."""
+        with open(sample_po_file, "rb") as fh:
+            inputfile = factory.getobject(fh)
+        units = inputfile.units
+        parts = [(units[::2], "one.po"), (units[1::2], "two.po"), (units, "three.po")]
+
+        extractor = poterminology.TerminologyExtractor()
+        for part, filename in parts:
+            extractor.processunits(part, filename)
+        expected = self.termitems(extractor.extract_terms(inputmin=2))
+        assert len(expected) > 50
+
+        extractor = poterminology.TerminologyExtractor()
+        for part, filename in parts:
+            shard = poterminology.TerminologyExtractor()
+            shard.processunits(part, filename)
+            extractor.merge(shard.summarize_glossary(), shard.units)
+        assert extractor.units == 2 * len(units)
+        assert self.termitems(extractor.extract_terms(inputmin=2)) == expected
+
+    def test_merge_plurals(self) -> None:
+        shards = []
+        for sources in (["Open files", "Delete files"], ["Open file", "Close file"]):
+            store = po.pofile()
+            for source in sources:
+                store.addsourceunit(source)
+            shard = poterminology.TerminologyExtractor()
+            shard.processunits(store.units, "file.po")
+            shards.append(shard.summarize_glossary())
+        extractor = poterminology.TerminologyExtractor()
+        for shard in shards:
+            extractor.merge(shard)
+        assert "files" not in extractor.occurrences
+        assert extractor.occurrences["file"].count == 4
+
+    def test_max_occurrences(self) -> None:
+        with open(sample_po_file, "rb") as fh:
+            inputfile = factory.getobject(fh)
+        extractor = poterminology.TerminologyExtractor(maxoccurrences=2)
+        extractor.processunits(inputfile.units, str(sample_po_file))
+        extractor.processunits(inputfile.units, "other.po")
+        extractor.merge({})
+        assert extractor.occurrences
+        for occurrences in extractor.occurrences.values():
+            assert occurrences.numsources <= 2
+            assert len(occurrences.fullmsgs) <= 2
+        assert extractor.extract_terms()
+
+    def test_max_occurrences_files(self, tmp_path, monkeypatch) -> None:
+        """The occurrences of every file are summarized before the next one."""
+        for name in ("one", "two", "three"):
+            (tmp_path / "po").mkdir(exist_ok=True)
+            (tmp_path / "po" / f"{name}.po").write_bytes(sample_po_file.read_bytes())
+        glossaries = []
+        processunits = poterminology.TerminologyExtractor.processunits
+
+        def recordglossary(extractor, units, fullinputpath) -> None:
+            glossaries.append(len(extractor.glossary))
+            processunits(extractor, units, fullinputpath)
+
+        monkeypatch.setattr(
+            poterminology.TerminologyExtractor, "processunits", recordglossary
+        )
+        output = tmp_path / "terminology.pot"
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "poterminology",
+                "--progress=none",
+                "--max-occurrences",
+                "2",
+                str(tmp_path / "po"),
+                "-o",
+                str(output),
+            ],
+        )
+        poterminology.main()
+        assert glossaries == [0, 0, 0]
+        assert len(po.pofile(output.read_bytes()).units) > 50
+
+    def test_jobs(self, tmp_path, monkeypatch) -> None:
+        """Extracting in several processes gives the same terminology."""
+        for name in ("one", "two", "three"):
+            (tmp_path / "po").mkdir(exist_ok=True)
+            (tmp_path / "po" / f"{name}.po").write_bytes(sample_po_file.read_bytes())
+        outputs = []
+        for jobs in ("1", "2"):
+            output = tmp_path / f"terminology-{jobs}.pot"
+            monkeypatch.setattr(
+                "sys.argv",
+                [
+                    "poterminology",
+                    "--progress=none",
+                    "--jobs",
+                    jobs,
+                    str(tmp_path / "po"),
+                    "-o",
+                    str(output),
+                ],
+            )
+            poterminology.main()
+            outputs.append(po.pofile(output.read_bytes()).units)
+        assert len(outputs[0]) > 50
+        assert [(unit.source, unit.target) for unit in outputs[0]] == [
+            (unit.source, unit.target) for unit in outputs[1]
+        ]
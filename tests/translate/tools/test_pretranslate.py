@@ -2,6 +2,7 @@ from io import BytesIO
 
 from pytest import mark
 
+from translate.search import match, tmdb
 from translate.storage import po, xliff
 from translate.tools import pretranslate
 
@@ -329,6 +330,38 @@ msgstr "%s-rekenaars"
         # Layout might have changed, so we won't compare the serialised
         # versions
 
+    def test_match_fuzzy_many(self) -> None:
+        """Test that fuzzy matches are looked up from the queue of matchers."""
+        first = po.pofile(b'msgid "Open file"\nmsgstr "Maak leer oop"\n')
+        second = po.pofile(
+            b'msgid "Open file"\nmsgstr "Open leer"\n\n'
+            b'msgid "Close window"\nmsgstr "Sluit venster"\n'
+        )
+        matchers = [match.matcher(first), match.matcher(second)]
+        units = po.pofile(
+            b'msgid "Open files"\nmsgstr ""\n\n'
+            b'msgid "Close windows"\nmsgstr ""\n\n'
+            b'msgid "Something else"\nmsgstr ""\n'
+        ).units
+        fuzzymatches = pretranslate.match_fuzzy_many(units, matchers)
+        assert fuzzymatches["Open files"].target == "Maak leer oop"
+        assert fuzzymatches["Close windows"].target == "Sluit venster"
+        assert fuzzymatches["Something else"] is None
+
+    def test_tm_database(self, tmp_path, monkeypatch) -> None:
+        """Test using a translation memory database without a template."""
+        monkeypatch.setattr(pretranslate, "tmmatcher", None)
+        tmfile = tmp_path / "tm.po"
+        tmfile.write_bytes(b'msgid "Open file"\nmsgstr "Maak leer oop"\n')
+        dbname = str(tmp_path / "tm.tmdb")
+        with tmdb.TMDB(dbname) as database:
+            database.update([str(tmfile)])
+        input_store = po.pofile(b'msgid "Open files"\nmsgstr ""\n')
+        pretranslate.pretranslate_store(input_store, None, tm=dbname)
+        unit = input_store.units[0]
+        assert unit.target == "Maak leer oop"
+        assert unit.isfuzzy()
+
 
 class TestPretranslateCommand(test_convert.TestConvertCommand, TestPretranslate):
     """Tests running actual pretranslate commands on files."""
@@ -340,3 +373,15 @@ class TestPretranslateCommand(test_convert.TestConvertCommand, TestPretranslate)
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
     ]
+
+    def test_jobs_tm(self, monkeypatch) -> None:
+        """Checks that the TM is loaded once before forking the workers."""
+        monkeypatch.setattr(pretranslate, "tmmatcher", None)
+        self.create_testfile("tm.po", 'msgid "Open file"\nmsgstr "Maak leer oop"\n')
+        for name in ("one", "two"):
+            self.create_testfile(f"in/{name}.pot", 'msgid "Open files"\nmsgstr ""\n')
+        self.run_command("--tm=tm.po", "in", "out", jobs=2)
+        assert pretranslate.tmmatcher is not None
+        for name in ("one", "two"):
+            unit = po.pofile(self.read_testfile(f"out/{name}.po")).units[-1]
+            assert unit.target == "Maak leer oop"
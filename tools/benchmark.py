@@ -16,185 +16,440 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
+"""
+Benchmark suite for the Translate Toolkit.
+
+The benchmarks cover parsing and serializing every store class known to the
+storage factory, translation memory lookups, quality checks, the pot2po merge
+and the main converters. They run on synthetic corpora which are generated
+from a fixed seed, so that the results of two runs can be compared.
+
+For every benchmark the best and median time of several runs and the peak of
+the memory allocated during one run (measured with tracemalloc) are reported.
+Save the results of a run with --save and compare a later run against them
+with --compare to see the effect of a change::
+
+    python tools/benchmark.py --save before.json
+    python tools/benchmark.py --compare before.json
+
+Use -k to select benchmarks and --profile to see where the time goes.
+"""
+
+from __future__ import annotations
+
 import argparse
 import cProfile
-import os
+import fnmatch
+import gc
+import json
 import pstats
 import random
+import statistics
 import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
 from importlib import import_module
+from io import BytesIO
+from typing import TYPE_CHECKING
 
-from translate.storage import factory, placeables
-
-
-class TranslateBenchmarker:
-    """class to aid in benchmarking Translate Toolkit stores."""
-
-    def __init__(self, test_dir, storeclass) -> None:
-        """Sets up benchmarking on the test directory."""
-        self.test_dir = os.path.abspath(test_dir)
-        self.StoreClass = storeclass
-        self.extension = self.StoreClass.Extensions[0]
-        self.project_dir = os.path.join(self.test_dir, "benchmark")
-        self.file_dir = os.path.join(self.project_dir, "zxx")
-        self.parsedfiles = []
-
-    def clear_test_dir(self) -> None:
-        """Removes the given directory."""
-        if os.path.exists(self.test_dir):
-            for dirpath, subdirs, filenames in os.walk(self.test_dir, topdown=False):
-                for name in filenames:
-                    os.remove(os.path.join(dirpath, name))
-                for name in subdirs:
-                    os.rmdir(os.path.join(dirpath, name))
-        if os.path.exists(self.test_dir):
-            os.rmdir(self.test_dir)
-        assert not os.path.exists(self.test_dir)
-
-    def create_sample_files(
-        self,
-        num_dirs,
-        files_per_dir,
-        strings_per_file,
-        source_words_per_string,
-        target_words_per_string,
-    ) -> None:
-        """Creates sample files for benchmarking."""
-        if not os.path.exists(self.test_dir):
-            os.mkdir(self.test_dir)
-        if not os.path.exists(self.project_dir):
-            os.mkdir(self.project_dir)
-        if not os.path.exists(self.file_dir):
-            os.mkdir(self.file_dir)
-        for dirnum in range(num_dirs):
-            if num_dirs > 1:
-                dirname = os.path.join(self.file_dir, f"sample_{dirnum}")
-                if not os.path.exists(dirname):
-                    os.mkdir(dirname)
-            else:
-                dirname = self.file_dir
-            for filenum in range(files_per_dir):
-                sample_file = self.StoreClass()
-                for _stringnum in range(strings_per_file):
-                    source_string = " ".join(
-                        f"word{random.randint(0, strings_per_file) * i}"  # ruff:ignore[suspicious-non-cryptographic-random-usage]
-                        for i in range(source_words_per_string)
-                    )
-                    sample_unit = sample_file.addsourceunit(source_string)
-                    sample_unit.target = " ".join(
-                        f"drow{random.randint(0, strings_per_file) * i}"  # ruff:ignore[suspicious-non-cryptographic-random-usage]
-                        for i in range(target_words_per_string)
-                    )
-                sample_file.savefile(
-                    os.path.join(dirname, f"file_{filenum}.{self.extension}")
-                )
-
-    def parse_files(self, file_dir=None) -> None:
-        """Parses all the files in the test directory into memory."""
-        count = 0
-        self.parsedfiles = []
-        if file_dir is None:
-            file_dir = self.file_dir
-        for dirpath, _subdirs, filenames in os.walk(file_dir, topdown=False):
-            for name in filenames:
-                pofilename = os.path.join(dirpath, name)
-                parsedfile = self.StoreClass(open(pofilename, "rb"))
-                count += len(parsedfile.units)
-                self.parsedfiles.append(parsedfile)
-        print(f"counted {count} units")
-
-    def parse_placeables(self) -> None:
-        """Parses placeables."""
-        count = 0
-        for parsedfile in self.parsedfiles:
-            for unit in parsedfile.units:
-                placeables.parse(unit.source, placeables.general.parsers)
-                placeables.parse(unit.target, placeables.general.parsers)
-            count += len(parsedfile.units)
-        print(f"counted {count} units")
+from translate.convert import (
+    csv2po,
+    po2csv,
+    po2prop,
+    po2xliff,
+    pot2po,
+    prop2po,
+    xliff2po,
+)
+from translate.filters import checks
+from translate.misc.multistring import multistring
+from translate.search import match
+from translate.storage import factory, placeables, po, properties, pypo, xliff
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Process some integers.")
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "te", "vo", "zi", "pa", "de", "go"]
+PLACEABLES = ["%s", "%d", "{name}", "{count}", "<b>", "</b>", "&brand;", "%(file)s"]
+
+
+class Corpus:
+    """Reproducible synthetic translations."""
+
+    def __init__(self, units=2000, seed=42) -> None:
+        self.units = units
+        self.seed = seed
+        self.random = random.Random(seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+        self.words = sorted(
+            {
+                "".join(self.random.choices(SYLLABLES, k=self.random.randint(1, 4)))
+                for _ in range(units)
+            }
+        )
+        self.entries = [self.entry(number) for number in range(units)]
+
+    def sentence(self, minwords, maxwords) -> str:
+        words = self.random.choices(
+            self.words, k=self.random.randint(minwords, maxwords)
+        )
+        if self.random.random() < 0.3:
+            words.insert(
+                self.random.randrange(len(words)), self.random.choice(PLACEABLES)
+            )
+        text = " ".join(words)
+        return f"{text[0].upper()}{text[1:]}{self.random.choice(['', '.', ':', '?'])}"
+
+    def entry(self, number) -> dict:
+        source = self.sentence(1, 12)
+        # Translations keep the placeables and the punctuation of the source
+        target = " ".join(
+            word if word in PLACEABLES else word[::-1] for word in source.split(" ")
+        )
+        entry = {
+            "id": f"key_{number}",
+            "source": source,
+            "target": target,
+            "fuzzy": self.random.random() < 0.1,
+            "plural": None,
+        }
+        if self.random.random() < 0.05:
+            entry["plural"] = (f"{source} %d", f"{target} %d")
+        if self.random.random() < 0.1:
+            entry["target"] = ""
+        return entry
+
+    def pofile(self, translated=True) -> po.pofile:
+        """Returns the corpus as a PO file, or as a template."""
+        store = po.pofile()
+        store.updateheader(add=True, Content_Type="text/plain; charset=UTF-8")
+        for entry in self.entries:
+            unit = store.addsourceunit(entry["source"])
+            unit.addlocation(f"src/{entry['id']}.c:1")
+            if entry["plural"]:
+                unit.source = multistring([entry["source"], entry["plural"][0]])
+                if translated and entry["target"]:
+                    unit.target = multistring([entry["target"], entry["plural"][1]])
+                else:
+                    unit.target = multistring(["", ""])
+            elif translated:
+                unit.target = entry["target"]
+            if translated and entry["fuzzy"] and entry["target"]:
+                unit.markfuzzy()
+        return store
+
+    def changed(self) -> Corpus:
+        """Returns a copy with a tenth of the source strings changed."""
+        corpus = Corpus.__new__(Corpus)
+        corpus.__dict__.update(self.__dict__)
+        corpus.entries = [dict(entry) for entry in self.entries]
+        generator = random.Random(self.seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+        for entry in corpus.entries[::10]:
+            entry["source"] = f"{entry['source']} {generator.choice(self.words)}"
+        return corpus
+
+    def store(self, storeclass):
+        """Returns the corpus in a store of the given class."""
+        store = storeclass()
+        for entry in self.entries:
+            unit = store.addsourceunit(entry["source"])
+            unit.setid(entry["id"])
+            unit.target = entry["target"]
+        return store
+
+    def queries(self, count=200) -> list[str]:
+        """Returns strings similar to the ones in the corpus."""
+        generator = random.Random(self.seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+        queries = []
+        for entry in generator.sample(self.entries, min(count, len(self.entries))):
+            words = entry["source"].split(" ")
+            words[generator.randrange(len(words))] = generator.choice(self.words)
+            queries.append(" ".join(words))
+        return queries
+
+
+@dataclass
+class Benchmark:
+    """
+    A benchmark.
+
+    :param setup: Prepares the benchmark and returns the function to time.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+@dataclass
+class Result:
+    name: str
+    best: float
+    median: float
+    peak: int
+
+
+def storeclasses() -> dict[str, type]:
+    """Returns the store classes of the factory by their main extension."""
+    classes = {}
+    for extension, (modulename, classname) in factory._classes_str.items():
+        if extension.startswith("_"):
+            continue
+        try:
+            module = import_module(f"translate.storage.{modulename}")
+        except ImportError:
+            continue
+        storeclass = getattr(module, classname)
+        if storeclass not in classes.values():
+            classes[extension] = storeclass
+    return classes
+
+
+def storebenchmarks(corpus) -> Iterator[Benchmark]:
+    for extension, storeclass in storeclasses().items():
+
+        def parse(storeclass=storeclass):
+            data = bytes(corpus.store(storeclass))
+            return lambda: storeclass.parsestring(data)
+
+        def serialize(storeclass=storeclass):
+            store = storeclass.parsestring(bytes(corpus.store(storeclass)))
+            return lambda: bytes(store)
+
+        yield Benchmark(f"parse/{extension}", parse)
+        yield Benchmark(f"serialize/{extension}", serialize)
+
+    def iterparse():
+        data = bytes(corpus.pofile())
+        return lambda: sum(1 for _unit in pypo.iter_units(BytesIO(data)))
+
+    yield Benchmark("parse/po-stream", iterparse)
+
+
+def matchbenchmarks(corpus) -> Iterator[Benchmark]:
+    def build():
+        store = corpus.pofile()
+        return lambda: match.matcher(store)
+
+    def matches():
+        matcher = match.matcher(corpus.pofile())
+        queries = corpus.queries()
+        return lambda: [matcher.matches(query) for query in queries]
+
+    def matches_many():
+        matcher = match.matcher(corpus.pofile())
+        queries = corpus.queries()
+        return lambda: matcher.matches_many(queries)
+
+    yield Benchmark("match/build", build)
+    yield Benchmark("match/matches", matches)
+    yield Benchmark("match/matches_many", matches_many)
+
+
+def filterbenchmarks(corpus) -> Iterator[Benchmark]:
+    def run_filters():
+        checker = checks.TeeChecker(
+            checkerclasses=[checks.StandardChecker, checks.StandardUnitChecker]
+        )
+        units = [unit for unit in corpus.pofile().units if not unit.isheader()]
+        return lambda: checker.run_filters_many(units, categorised=True)
+
+    def parse_placeables():
+        units = corpus.pofile().units
+        return lambda: [
+            placeables.parse(unit.source, placeables.general.parsers) for unit in units
+        ]
+
+    yield Benchmark("filter/run_filters", run_filters)
+    yield Benchmark("placeables/parse", parse_placeables)
+
+
+def convert(function, inputdata, templatedata=None, **kwargs):
+    """Returns a function running a file based converter on the given data."""
+
+    def run():
+        templatefile = None if templatedata is None else BytesIO(templatedata)
+        output = BytesIO()
+        function(BytesIO(inputdata), output, templatefile, **kwargs)
+        return output.getvalue()
+
+    return run
+
+
+def convertbenchmarks(corpus) -> Iterator[Benchmark]:
+    def podata():
+        return bytes(corpus.pofile())
+
+    def propdata():
+        return bytes(corpus.store(properties.javautf8file))
+
+    def xliffdata():
+        return bytes(corpus.store(xliff.xlifffile))
+
+    def pot2po_():
+        template = bytes(corpus.changed().pofile(translated=False))
+        return convert(pot2po.convertpot, podata(), template)
+
+    yield Benchmark("convert/pot2po", pot2po_)
+    yield Benchmark(
+        "convert/prop2po",
+        lambda: convert(prop2po.convertprop, propdata(), personality="java-utf8"),
+    )
+    yield Benchmark(
+        "convert/po2prop",
+        lambda: convert(
+            po2prop.convertprop,
+            bytes(
+                prop2po.prop2po().convertstore(corpus.store(properties.javautf8file))
+            ),
+            propdata(),
+            personality="java-utf8",
+        ),
+    )
+    yield Benchmark("convert/po2csv", lambda: convert(po2csv.convertcsv, podata()))
+    yield Benchmark(
+        "convert/csv2po",
+        lambda: convert(csv2po.convertcsv, convert(po2csv.convertcsv, podata())()),
+    )
+    yield Benchmark("convert/po2xliff", lambda: convert(po2xliff.convertpo, podata()))
+    yield Benchmark(
+        "convert/xliff2po", lambda: convert(xliff2po.convertxliff, xliffdata())
+    )
+
+
+def benchmarks(corpus) -> Iterator[Benchmark]:
+    yield from storebenchmarks(corpus)
+    yield from matchbenchmarks(corpus)
+    yield from filterbenchmarks(corpus)
+    yield from convertbenchmarks(corpus)
+
+
+def measure(name, function, repeat) -> Result:
+    """Times the function and measures the peak of memory allocated in a run."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(name, min(times), statistics.median(times), peak)
+
+
+def change(value, baseline) -> str:
+    if not baseline:
+        return ""
+    return f"{(value - baseline) / baseline:+7.1%}"
+
+
+def main(arguments=None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        metavar="PATTERN",
+        help="only run benchmarks matching PATTERN, e.g. 'parse/*'",
+    )
+    parser.add_argument(
+        "--units",
+        type=int,
+        default=2000,
+        help="number of units in the corpus (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="seed used to generate the corpus (default: %(default)s)",
+    )
     parser.add_argument(
-        "podir",
-        metavar="DIR",
-        type=str,
-        nargs="?",
-        help="PO dir to use (default: create sample files)",
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed runs of each benchmark (default: %(default)s)",
     )
     parser.add_argument(
-        "--store-type",
-        dest="storetype",
-        action="store_const",
-        const="po",
-        default="po",
-        help="type of the store to benchmark (default: %(default)s)",
+        "--profile", action="store_true", help="print a profile of each benchmark"
     )
+    parser.add_argument("--save", metavar="FILE", help="save the results to FILE")
     parser.add_argument(
-        "--check-parsing",
-        dest="check_parsing",
-        action="store_true",
-        help="benchmark parsing files",
+        "--compare", metavar="FILE", help="compare the results with the saved FILE"
     )
     parser.add_argument(
-        "--check-placeables",
-        dest="check_placeables",
-        action="store_true",
-        help="benchmark placeables",
+        "--list", action="store_true", help="list the benchmarks and exit"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(arguments)
+
+    corpus = Corpus(args.units, args.seed)
+    selected = [
+        benchmark
+        for benchmark in benchmarks(corpus)
+        if not args.patterns
+        or any(fnmatch.fnmatch(benchmark.name, pattern) for pattern in args.patterns)
+    ]
+    if args.list:
+        for benchmark in selected:
+            print(benchmark.name)
+        return
 
-    storetype = args.storetype
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
 
-    if storetype in factory._classes_str:
-        _module, _class = factory._classes_str[storetype]
-        module = import_module(f"translate.storage.{_module}")
-        storeclass = getattr(module, _class)
-    else:
-        print(
-            f"StoreClass: '{storetype}' is not a base class that the class factory can load"
+    print(
+        f"{'benchmark':<24} {'best':>10} {'median':>10} {'peak':>10}"
+        + (f" {'time':>7} {'memory':>7}" if baseline else "")
+    )
+    results = {}
+    for benchmark in selected:
+        try:
+            function = benchmark.setup()
+        except Exception as error:  # Formats which cannot store the corpus
+            print(f"{benchmark.name:<24} skipped: {type(error).__name__}: {error}")
+            continue
+        result = measure(benchmark.name, function, args.repeat)
+        results[result.name] = {
+            "best": result.best,
+            "median": result.median,
+            "peak": result.peak,
+        }
+        line = (
+            f"{result.name:<24} {result.best * 1000:8.2f}ms {result.median * 1000:8.2f}ms"
+            f" {result.peak / 1024:8.0f}kB"
         )
-        sys.exit()
-
-    sample_files = [
-        # num_dirs, files_per_dir, strings_per_file, source_words_per_string, target_words_per_string
-        # (1, 1, 2, 2, 2),
-        (
-            1,
-            1,
-            10000,
-            5,
-            10,
-        ),  # Creat 1 very large file with German like ratios or source to target
-        # (100, 10, 10, 5, 10),   # Create lots of directories and files with smaller then average size
-        # (1, 5, 10, 10, 10),
-        # (1, 10, 10, 10, 10),
-        # (5, 10, 10, 10, 10),
-        # (5, 10, 100, 20, 20),
-        # (10, 20, 100, 10, 10),
-        # (10, 20, 100, 10, 10),
-        # (100, 2, 140, 3, 3),  # OpenOffice.org approximate ratios
-    ]
+        if result.name in baseline:
+            line += (
+                f" {change(result.best, baseline[result.name]['best'])}"
+                f" {change(result.peak, baseline[result.name]['peak'])}"
+            )
+        print(line)
+        if args.profile:
+            profile = cProfile.Profile()
+            profile.runcall(function)
+            pstats.Stats(profile, stream=sys.stdout).sort_stats("time").print_stats(20)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "units": args.units,
+                    "seed": args.seed,
+                    "python": sys.version,
+                    "results": results,
+                },
+                handle,
+                indent=2,
+            )
 
-    for sample_file_sizes in sample_files:
-        benchmarker = TranslateBenchmarker("BenchmarkDir", storeclass)
-        benchmarker.clear_test_dir()
-        if args.podir is None:
-            benchmarker.create_sample_files(*sample_file_sizes)
-        methods = []
-
-        if args.check_parsing:
-            methods.append(("parse_files", repr(args.podir)))
-
-        if args.check_placeables:
-            methods.append(("parse_placeables", ""))
-
-        for methodname, methodparam in methods:
-            print("_______________________________________________________")
-            statsfile = f"{methodname}_{storetype}{'_{}_{}_{}_{}_{}.stats'.format(*sample_file_sizes)}"
-            cProfile.run(f"benchmarker.{methodname}({methodparam})", statsfile)
-            stats = pstats.Stats(statsfile)
-            stats.sort_stats("time").print_stats(20)
-            print("_______________________________________________________")
-        benchmarker.clear_test_dir()
+
+if __name__ == "__main__":
+    main()
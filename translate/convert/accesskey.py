@@ -18,8 +18,6 @@
 
 """functions used to manipulate access keys in strings."""
 
-from translate.storage.placeables.general import XMLEntityPlaceable
-
 DEFAULT_ACCESSKEY_MARKER = "&"
 
 
@@ -113,6 +111,15 @@ class UnitMixer:
         return (labelentity, accesskeyentity)
 
 
+def _isentity(string: str) -> bool:
+    """Checks whether string starts with an XML entity."""
+    from translate.storage.placeables.general import (  # ruff:ignore[import-outside-top-level]
+        XMLEntityPlaceable,
+    )
+
+    return XMLEntityPlaceable.regex.match(string) is not None
+
+
 def extract(
     string: str, accesskey_marker: str = DEFAULT_ACCESSKEY_MARKER
 ) -> tuple[str, str]:
@@ -138,9 +145,7 @@ def extract(
             marker_pos += 1
             if marker_pos == len(string):
                 break
-            if accesskey_marker == "&" and XMLEntityPlaceable.regex.match(
-                string[marker_pos - 1 :]
-            ):
+            if accesskey_marker == "&" and _isentity(string[marker_pos - 1 :]):
                 continue
             # FIXME This is weak filtering, we should have a richer set of
             # invalid accesskeys, not just space.
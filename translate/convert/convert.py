@@ -25,7 +25,6 @@ import os.path
 from io import BytesIO
 
 from translate.misc import optrecurse
-from translate.tools import pocount
 
 # Don't import optparse ourselves, get the version from optrecurse.
 optparse = optrecurse.optparse
@@ -526,6 +525,15 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
             return outputstream
         return super().openoutputfile(options, fulloutputpath)
 
+    def canprocessinparallel(self, options) -> bool:
+        """Archives are shared between all files, so they are processed serially."""
+        return (
+            getattr(options, "inputarchive", None) is None
+            and getattr(self, "templatearchive", None) is None
+            and getattr(self, "outputarchive", None) is None
+            and super().canprocessinparallel(options)
+        )
+
     def recursiveprocess(self, options):
         """Recurse through directories and convert files."""
         try:
@@ -607,6 +615,8 @@ def should_output_store(store, threshold):
     if not threshold:
         return True
 
+    from translate.tools import pocount  # ruff:ignore[import-outside-top-level]
+
     units = [unit for unit in store.units if unit.istranslatable()]
     translated = [unit for unit in units if unit.istranslated()]
     wordcounts = {unit.getid(): pocount.wordsinunit(unit) for unit in units}
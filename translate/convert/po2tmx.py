@@ -93,16 +93,32 @@ def convertpo(
 
 
 class tmxmultifile:
-    def __init__(self, filename, mode=None) -> None:
-        """Initialises tmxmultifile from a seekable inputfile or writable outputfile."""
+    def __init__(self, filename, mode=None, sourcelanguage="en") -> None:
+        """
+        Initialises tmxmultifile from a seekable inputfile or writable outputfile.
+
+        The units of an outputfile are written as they are converted.
+        """
         self.filename = filename
         if mode is None:
             mode = "r" if os.path.exists(filename) else "w"
         self.mode = mode
         #        self.multifilestyle = multifilestyle
         self.multifilename = os.path.splitext(filename)[0]
-        #        self.multifile = open(filename, mode)
-        self.tmxfile = tmx.tmxfile()
+        if mode == "w":
+            self.output = open(filename, "wb")
+            self.tmxfile = tmx.TmxWriter(self.output, sourcelanguage)
+            self.tmxfile.open()
+        else:
+            self.output = None
+            self.tmxfile = tmx.tmxfile()
+
+    def close(self) -> None:
+        """Writes the end of an outputfile."""
+        if self.output is not None:
+            self.tmxfile.close()
+            self.output.close()
+            self.output = None
 
     def openoutputfile(self, subfile):
         """Returns a pseudo-file object for the given subfile."""
@@ -120,10 +136,8 @@ class TmxOptionParser(convert.ArchiveConvertOptionParser):
     def recursiveprocess(self, options) -> None:
         if not options.targetlanguage:
             raise ValueError("You must specify the target language")
+        self.archiveoptions = {"sourcelanguage": options.sourcelanguage}
         super().recursiveprocess(options)
-        with open(options.output, "wb") as self.output:
-            self.outputarchive.tmxfile.setsourcelanguage(options.sourcelanguage)
-            self.outputarchive.tmxfile.serialize(self.output)
 
 
 def main(argv=None) -> None:
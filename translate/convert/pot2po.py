@@ -24,7 +24,13 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import copy
+import functools
+import os
+import sys
+
 from translate.convert import convert
+from translate.misc import optrecurse
 from translate.misc.multistring import multistring
 from translate.search import match
 from translate.storage import catkeys, factory, poheader
@@ -41,12 +47,19 @@ def convertpot(
     maxlength=None,
     classes=None,
     classes_str=None,
+    input_store=None,
     **kwargs,
 ) -> int:
-    """Main conversion function."""
-    input_store = factory.getobject(
-        input_file, classes=classes, classes_str=classes_str
-    )
+    """
+    Main conversion function.
+
+    A parsed `input_store` can be shared between conversions of the same
+    template, it is not modified.
+    """
+    if input_store is None:
+        input_store = factory.getobject(
+            input_file, classes=classes, classes_str=classes_str
+        )
     try:
         temp_store = factory.getobject(input_file, classes_str=classes_str)
     except Exception:
@@ -115,6 +128,12 @@ def convert_stores(
     # initialize store
     _store_pre_merge(input_store, temp_store, template_store)
 
+    fuzzymatches = None
+    if matchers:
+        fuzzymatches = pretranslate.prepare_fuzzy_matches(
+            temp_store.units, template_store, matchers, input_store.merge_on
+        )
+
     # Do matching
     for input_unit in temp_store.units:
         if input_unit.istranslatable():
@@ -124,6 +143,7 @@ def convert_stores(
                 matchers,
                 mark_reused=True,
                 merge_on=input_store.merge_on,
+                fuzzymatches=fuzzymatches,
             )
             _unit_post_merge(input_unit, input_store, temp_store, template_store)
 
@@ -144,7 +164,7 @@ def _prepare_merge(input_store, output_store, template_store, **kwargs) -> None:
         )
 
     # Generate an index so we can search by source string and location later on
-    input_store.makeindex()
+    input_store.require_index()
     if template_store:
         template_store.makeindex()
 
@@ -320,6 +340,98 @@ def _do_poheaders(input_store, output_store, template_store) -> None:
         output_header.markfuzzy(template_header.isfuzzy())
 
 
+class Pot2PoOptionParser(convert.ConvertOptionParser):
+    """A specialized Option Parser which can update many languages at once."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        #: Parsed templates shared by all the languages when fanning out
+        self.inputstores = {}
+
+    def add_fanout_option(self) -> None:
+        self.add_option(
+            "",
+            "--fanout",
+            dest="fanout",
+            action="store_true",
+            default=False,
+            help="update each language in a subdirectory of TEMPLATE, writing "
+            "it to the same subdirectory of OUTPUT",
+        )
+
+    def recursiveprocess(self, options) -> None:
+        """Recurse through directories and process files."""
+        if not getattr(options, "fanout", False):
+            super().recursiveprocess(options)
+            return
+        if not options.input:
+            self.error("--fanout needs an input file or directory")
+        if not self.isrecursive(options.template, "template"):
+            self.error("--fanout needs a directory of languages as template")
+        if isinstance(options.input, list):
+            inputfiles = self.recurseinputfilelist(options)
+        elif self.isrecursive(options.input, "input"):
+            inputfiles = self.recurseinputfiles(options)
+        else:
+            inputfiles = [os.path.basename(options.input)]
+            options.input = os.path.dirname(options.input)
+        self.ensurerecursiveoutputdirexists(options)
+        options.recursiveoutput = True
+        options.recursivetemplate = True
+        inputfiles.sort()
+        self.loadinputstores(options, inputfiles)
+        languagefiles = []
+        for language in sorted(os.listdir(options.template)):
+            if not os.path.isdir(os.path.join(options.template, language)):
+                continue
+            self.checkoutputsubdir(options, language)
+            languagefiles.extend(
+                os.path.join(language, inputpath)
+                for inputpath in inputfiles
+                if self.getfullinputpath(options, inputpath) in self.inputstores
+            )
+        progress_bar = optrecurse.ProgressBar(options.progress, languagefiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(languagefiles) > 1 and self.canfork():
+            self.parallelprocess(options, languagefiles, progress_bar, jobs)
+        else:
+            self.serialprocess(options, languagefiles, progress_bar)
+
+    def loadinputstores(self, options, inputfiles) -> None:
+        """Parses and indexes each template once for all the languages."""
+        for inputpath in inputfiles:
+            fullinputpath = self.getfullinputpath(options, inputpath)
+            try:
+                input_store = factory.getobject(fullinputpath)
+                input_store.require_index()
+            except Exception:
+                self.warning(
+                    f"Couldn't handle input file {inputpath}", options, sys.exc_info()
+                )
+                continue
+            self.inputstores[fullinputpath] = input_store
+
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        pretranslate.preload_memory(options)
+        super().parallelprocess(options, inputfiles, progress_bar, jobs)
+
+    def getprocessingpaths(self, options, inputpath):
+        if not getattr(options, "fanout", False):
+            return super().getprocessingpaths(options, inputpath)
+        language, inputpath = inputpath.split(os.sep, 1)
+        languageoptions = copy.copy(options)
+        languageoptions.template = os.path.join(options.template, language)
+        languageoptions.output = os.path.join(options.output, language)
+        processingpaths = super().getprocessingpaths(languageoptions, inputpath)
+        if processingpaths is None:
+            return None
+        fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = processingpaths
+        fileprocessor = functools.partial(
+            fileprocessor, input_store=self.inputstores[fullinputpath]
+        )
+        return fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+
+
 def main(argv=None) -> None:
     formats = {
         "pot": ("po", convertpot),
@@ -335,7 +447,7 @@ def main(argv=None) -> None:
         "catkeys": ("catkeys", convertpot),
         ("catkeys", "catkeys"): ("catkeys", convertpot),
     }
-    parser = convert.ConvertOptionParser(
+    parser = Pot2PoOptionParser(
         formats,
         usepots=True,
         usetemplates=True,
@@ -348,7 +460,8 @@ def main(argv=None) -> None:
         "--tm",
         dest="tm",
         default=None,
-        help="The file to use as translation memory when fuzzy matching",
+        help="The file to use as translation memory when fuzzy matching, "
+        "can also be a database created by tmbuild",
     )
     parser.passthrough.append("tm")
 
@@ -373,6 +486,7 @@ def main(argv=None) -> None:
     parser.passthrough.append("fuzzymatching")
 
     parser.add_po_max_line_length_option()
+    parser.add_fanout_option()
 
     parser.run(argv)
 
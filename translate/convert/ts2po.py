@@ -71,11 +71,10 @@ class ts2po:
 
     def convertfile(self, inputfile):
         """Converts a .ts file to .po format."""
-        tsfile = ts2.tsfile(inputfile)
         thetargetfile = po.pofile()
 
         previouscontext = ""
-        for inputunit in tsfile.units:
+        for inputunit in ts2.tsfile().iterparse(inputfile):
             contexts = inputunit.getcontext().split("\n")
 
             context = contexts[0].strip()
@@ -313,6 +313,12 @@ class CheckerConfig:
                 break
 
 
+#: Number of prefilter results kept when checking several units
+RESULTS_CACHE_SIZE = 10000
+#: Number of filter plans kept by a checker
+FILTER_PLANS_SIZE = 8
+
+
 def cache_results(f):
     def cached_f(self, param1):
         key = (f.__name__, param1)
@@ -364,6 +370,8 @@ class UnitChecker:
 
         self.defaultfilters = self.getfilters(excludefilters, limitfilters)
         self.results_cache = {}
+        self.share_results_cache = False
+        self._filter_plans = {}
 
     def getfilters(self, excludefilters=None, limitfilters=None):
         """
@@ -478,24 +486,34 @@ class UnitChecker:
             )
         )
 
-    def run_filters(self, unit, categorised: bool = False) -> dict[str, dict]:
+    def get_filter_plan(self):
         """
-        Run all the tests in this suite.
+        Returns the filters to run on each unit, in the order to run them.
 
-        :return: Content of the dictionary is as follows::
+        The plan is built once for the current filters and target language,
+        with the filters ignored for that language left out.
 
-           {'testname': { 'message': message_or_exception, 'category': failure_category } }
+        :return: A list of ``(functionname, filterfunction, isdefault,
+            dependents)`` tuples, where ``dependents`` are the names of the
+            filters to skip when this one fails.
         """
-        self.results_cache = {}
-        failures = {}
-        ignores = self.get_ignored_filters()
-        functionnames = self.defaultfilters.keys()
-        priorityfunctionnames = self.preconditions.keys()
-        otherfunctionnames = filter(
-            lambda functionname: functionname not in self.preconditions, functionnames
-        )
+        cached = self._filter_plans.get(id(self.defaultfilters))
+        if (
+            cached is not None
+            and cached[0] is self.defaultfilters
+            and cached[1] is self.config.lang
+        ):
+            return cached[2]
+
+        ignores = set(self.get_ignored_filters())
+        functionnames = list(self.preconditions) + [
+            functionname
+            for functionname in self.defaultfilters
+            if functionname not in self.preconditions
+        ]
+        plan = []
 
-        for functionname in list(priorityfunctionnames) + list(otherfunctionnames):
+        for functionname in functionnames:
             if functionname in ignores:
                 continue
 
@@ -506,6 +524,47 @@ class UnitChecker:
             if filterfunction is None:
                 continue
 
+            plan.append(
+                (
+                    functionname,
+                    filterfunction,
+                    functionname in self.defaultfilters,
+                    self.preconditions.get(functionname, ()),
+                )
+            )
+
+        if len(self._filter_plans) >= FILTER_PLANS_SIZE:
+            self._filter_plans.clear()
+        # Keep a reference to the filters, so that their id is not reused
+        self._filter_plans[id(self.defaultfilters)] = (
+            self.defaultfilters,
+            self.config.lang,
+            plan,
+        )
+        return plan
+
+    def run_filters(self, unit, categorised: bool = False) -> dict[str, dict]:
+        """
+        Run all the tests in this suite.
+
+        :return: Content of the dictionary is as follows::
+
+           {'testname': { 'message': message_or_exception, 'category': failure_category } }
+        """
+        if not self.share_results_cache or len(self.results_cache) > RESULTS_CACHE_SIZE:
+            self.results_cache = {}
+        failures = {}
+        skipped = set()
+
+        for (
+            functionname,
+            filterfunction,
+            isdefault,
+            dependents,
+        ) in self.get_filter_plan():
+            if functionname in skipped:
+                continue
+
             filtermessage = ""
 
             try:
@@ -531,23 +590,38 @@ class UnitChecker:
                     filtermessage = pydoc.getdoc(filterfunction)
                 # We test some preconditions that aren't actually a cause for
                 # failure
-                if functionname in self.defaultfilters:
+                if isdefault:
                     failures[functionname] = {
                         "message": filtermessage,
                         "category": self.categories[functionname],
                     }
 
-                if functionname in self.preconditions:
-                    for ignoredfunctionname in self.preconditions[functionname]:
-                        ignores.append(ignoredfunctionname)
+                skipped.update(dependents)
 
-        self.results_cache = {}
+        if not self.share_results_cache:
+            self.results_cache = {}
 
         if not categorised:
             for name, info in failures.items():
                 failures[name] = info["message"]
         return failures
 
+    def run_filters_many(self, units, categorised: bool = False) -> list[dict]:
+        """
+        Run all the tests in this suite on several units.
+
+        The results of the prefilters like :meth:`filtervariables` are shared
+        between the units, which often contain the same strings.
+
+        :return: The failures of each unit, as returned by :meth:`run_filters`.
+        """
+        self.share_results_cache = True
+        try:
+            return [self.run_filters(unit, categorised) for unit in units]
+        finally:
+            self.share_results_cache = False
+            self.results_cache = {}
+
 
 class TranslationChecker(UnitChecker):
     """
@@ -684,6 +758,17 @@ class TeeChecker:
 
         return failures
 
+    def run_filters_many(self, units, categorised=False):
+        """Run all the tests in the checker's suites on several units."""
+        for checker in self.checkers:
+            checker.share_results_cache = True
+        try:
+            return [self.run_filters(unit, categorised) for unit in units]
+        finally:
+            for checker in self.checkers:
+                checker.share_results_cache = False
+                checker.results_cache = {}
+
     def setsuggestionstore(self, store) -> None:
         """
         Sets the filename that a checker should use for evaluating
@@ -2723,6 +2808,7 @@ class L20nChecker(MozillaChecker):
             kwargs["checkerconfig"] = checkerconfig
 
         super().__init__(**kwargs)
+        self._complex_unit_filters = (None, {})
 
     def run_filters(self, unit, categorised=False):
         is_unit_complex = (
@@ -2733,11 +2819,16 @@ class L20nChecker(MozillaChecker):
         saved_default_filters = {}
         if is_unit_complex:
             saved_default_filters = self.defaultfilters
-            self.defaultfilters = {
-                key: value
-                for (key, value) in self.defaultfilters.items()
-                if key not in self.excluded_filters_for_complex_units
-            }
+            if self._complex_unit_filters[0] is not saved_default_filters:
+                self._complex_unit_filters = (
+                    saved_default_filters,
+                    {
+                        key: value
+                        for (key, value) in saved_default_filters.items()
+                        if key not in self.excluded_filters_for_complex_units
+                    },
+                )
+            self.defaultfilters = self._complex_unit_filters[1]
 
         result = super().run_filters(unit, categorised=categorised)
 
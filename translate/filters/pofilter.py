@@ -63,19 +63,27 @@ class pocheckfilter:
 
         return "\n".join(filterdocs)
 
-    def filterunit(self, unit):
-        """Runs filters on an element."""
+    def shouldfilter(self, unit) -> bool:
+        """Returns whether the filters should be run on an element."""
         if unit.isheader():
-            return []
+            return False
 
         if not self.options.includefuzzy and unit.isfuzzy():
-            return []
+            return False
+
+        return self.options.includereview or not unit.isreview()
 
-        if not self.options.includereview and unit.isreview():
+    def filterunit(self, unit):
+        """Runs filters on an element."""
+        if not self.shouldfilter(unit):
             return []
 
-        failures = self.checker.run_filters(unit, categorised=True)
+        return self.handlefailures(
+            unit, self.checker.run_filters(unit, categorised=True)
+        )
 
+    def handlefailures(self, unit, failures):
+        """Returns the failures of an element, correcting it if requested."""
         if failures and self.options.autocorrect:
             # we can't get away with bad unquoting / requoting if we're going to change the result...
             correction = autocorrect.correct(unit.source, unit.target)
@@ -88,6 +96,42 @@ class pocheckfilter:
 
         return failures
 
+    def run_filters(self, units):
+        """
+        Runs the filters on the given elements.
+
+        When a cache file is configured, the failures of elements which were
+        already checked are read from it and only new elements are checked.
+        """
+        cachefile = getattr(self.options, "cachefile", None)
+        if not cachefile:
+            return self.checker.run_filters_many(units, categorised=True)
+
+        # The cache is only loaded when it is used
+        from translate.filters import resultcache  # ruff:ignore[import-outside-top-level]
+
+        with resultcache.ResultCache(
+            cachefile,
+            resultcache.checkerkey(
+                self.checker, self.options.excludefilters, self.options.limitfilters
+            ),
+        ) as cache:
+            keys = [cache.getkey(unit) for unit in units]
+            cached = cache.get(keys)
+            uncheckedunits = [
+                unit for unit, key in zip(units, keys, strict=True) if key not in cached
+            ]
+            results = dict(
+                zip(
+                    (key for key in keys if key not in cached),
+                    self.checker.run_filters_many(uncheckedunits, categorised=True),
+                    strict=True,
+                )
+            )
+            cache.set(results)
+        results.update(cached)
+        return [results[key] for key in keys]
+
     def filterfile(self, transfile):
         """
         Runs filters on a translation store object.
@@ -100,8 +144,11 @@ class pocheckfilter:
         newtransfile.setsourcelanguage(transfile.getsourcelanguage())
         newtransfile.settargetlanguage(transfile.gettargetlanguage())
 
-        for unit in transfile.units:
-            filter_result = self.filterunit(unit)
+        units = [unit for unit in transfile.units if self.shouldfilter(unit)]
+        unitsfailures = self.run_filters(units)
+
+        for unit, failures in zip(units, unitsfailures, strict=True):
+            filter_result = self.handlefailures(unit, failures)
 
             if filter_result:
                 if filter_result != autocorrect:
@@ -412,6 +459,15 @@ def cmdlineparser():
         metavar="FILE",
         help="read list of all valid characters from FILE (must be in UTF-8)",
     )
+    parser.add_option(
+        "",
+        "--cache",
+        dest="cachefile",
+        default=None,
+        type="string",
+        metavar="FILE",
+        help="store the results in FILE and only check units which changed since the last run",
+    )
 
     parser.passthrough.append("checkfilter")
     parser.description = f"{__doc__.strip()}\n"
@@ -0,0 +1,122 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+A persistent cache of the results of quality checks.
+
+The failures of a unit are stored under a key built from the checker
+configuration and the content of the unit, so that checking the same files
+again only runs the checks on the units which changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from translate.__version__ import sver
+from translate.misc.filecache import SQLiteCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    failures TEXT NOT NULL
+);
+"""
+
+
+def checkerkey(checker, excludefilters=None, limitfilters=None) -> str:
+    """
+    Returns a string describing the checks done by a checker.
+
+    :param checker: A :class:`~translate.filters.checks.TeeChecker` or
+        :class:`~translate.filters.checks.UnitChecker`.
+    """
+    checkers = getattr(checker, "checkers", [checker])
+    config = checker.config
+    return json.dumps(
+        [
+            sver,
+            [type(subchecker).__qualname__ for subchecker in checkers],
+            sorted(excludefilters or []),
+            sorted(limitfilters) if limitfilters is not None else None,
+            config.targetlanguage,
+            config.accelmarkers,
+            config.varmatches,
+            sorted(config.notranslatewords),
+            sorted(config.musttranslatewords),
+            sorted(config.validcharsmap),
+            config.punctuation,
+            config.endpunctuation,
+            config.ignoretags,
+            config.canchangetags,
+            config.criticaltests,
+        ],
+        default=str,
+    )
+
+
+def unitkey(unit) -> list:
+    """Returns the content of a unit which the checks can look at."""
+    return [
+        getattr(unit.source, "strings", unit.source),
+        getattr(unit.target, "strings", unit.target),
+        unit.getcontext(),
+        unit.getlocations(),
+        unit.getnotes(),
+        unit.isfuzzy(),
+        unit.isreview(),
+        [str(alt.target) for alt in getattr(unit, "getalttrans", list)()],
+    ]
+
+
+class ResultCache(SQLiteCache):
+    """The results of quality checks stored in an SQLite database."""
+
+    schema = SCHEMA
+
+    def __init__(self, filename, checkerkey: str) -> None:
+        super().__init__(filename)
+        self.checkerkey = checkerkey
+
+    def getkey(self, unit) -> str:
+        """Returns the cache key of a unit."""
+        content = json.dumps([self.checkerkey, unitkey(unit)], default=str)
+        return hashlib.sha1(content.encode(), usedforsecurity=False).hexdigest()
+
+    def get(self, keys) -> dict[str, dict]:
+        """Returns the cached failures of the given keys which are known."""
+        results = {}
+        for key in keys:
+            row = self.connection.execute(
+                "SELECT failures FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                results[key] = json.loads(row[0])
+        return results
+
+    def set(self, results: dict[str, dict]) -> None:
+        """Stores the failures of the given keys."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (key, failures) VALUES (?, ?)",
+                [
+                    (key, json.dumps(failures, default=str))
+                    for key, failures in results.items()
+                ],
+            )
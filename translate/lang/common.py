@@ -360,7 +360,10 @@ class Common:
         """Returns an iterator over the sentences in text."""
         lastmatch = 0
         text = text or ""
-        for item in cls.sentencere.finditer(text):
+        # The sentences follow each other: if there is no match at the end of
+        # the previous sentence, there is none later in the text either, so
+        # don't let finditer() search again from every following position.
+        while item := cls.sentencere.match(text, lastmatch):
             lastmatch = item.end()
             sentence = item.group()
             if strip:
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import cache
 
 languages = {
     "ach": ("Acholi", 2, "n > 1"),
@@ -1113,7 +1114,10 @@ def normalize_code(code):
     return code.replace("_", "-").replace("@", "-").lower()
 
 
-__normalised_languages = {normalize_code(key) for key in languages}
+@cache
+def _normalised_languages() -> frozenset[str]:
+    """The normalised codes of the known languages, built on first use."""
+    return frozenset(normalize_code(key) for key in languages)
 
 
 def simplify_to_common(language_code):
@@ -1126,7 +1130,7 @@ def simplify_to_common(language_code):
     if not simpler:
         return language_code
 
-    if normalize_code(language_code) in __normalised_languages:
+    if normalize_code(language_code) in _normalised_languages():
         return language_code
 
     return simplify_to_common(simpler)
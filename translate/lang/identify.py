@@ -23,6 +23,7 @@ models.
 
 from __future__ import annotations
 
+from functools import cache
 from os import extsep, path
 
 from translate.lang.ngram import NGram
@@ -30,6 +31,12 @@ from translate.misc.file_discovery import get_abs_data_filename
 from translate.storage.base import TranslationStore, TranslationUnit
 
 
+@cache
+def _load_models(model_dir) -> NGram:
+    """Load the language models of a directory, shared by all identifiers."""
+    return NGram(model_dir)
+
+
 class LanguageIdentifier:
     MODEL_DIR = get_abs_data_filename("langmodels")
     """The directory containing the ngram language model files."""
@@ -53,7 +60,12 @@ class LanguageIdentifier:
 
         self._lang_codes = {}
         self._load_config(conf_file)
-        self.ngram = NGram(model_dir)
+        self._model_dir = path.abspath(model_dir)
+
+    @property
+    def ngram(self) -> NGram:
+        """The language models, loaded when they are first needed."""
+        return _load_models(self._model_dir)
 
     def _load_config(self, conf_file) -> None:
         """
@@ -81,12 +93,29 @@ class LanguageIdentifier:
 
     def identify_lang(self, text):
         """Identify the language of the text in the given string."""
-        if not text:
+        return self.identify_langs([text])[0]
+
+    def identify_langs(self, texts) -> list[str | None]:
+        """Identify the languages of several strings at once."""
+        results = [None] * len(texts)
+        indexes = [i for i, text in enumerate(texts) if text]
+        if indexes:
+            langs = self.ngram.classify_many([texts[i] for i in indexes])
+            for i, result in zip(indexes, langs, strict=True):
+                results[i] = self._lang_codes.get(result, result)
+        return results
+
+    @staticmethod
+    def _store_text(instore, attribute: str, count: int) -> str | None:
+        """Join the source or target text of the first units of a store."""
+        if not isinstance(instore, (TranslationStore, list, tuple)):
             return None
-        result = self.ngram.classify(text)
-        if result in self._lang_codes:
-            result = self._lang_codes[result]
-        return result
+
+        return " ".join(
+            getattr(unit, attribute)
+            for unit in instore[:count]  # ty:ignore[not-subscriptable]
+            if unit.istranslatable() and getattr(unit, attribute)
+        )
 
     def identify_source_lang(
         self, instore: TranslationStore | list[TranslationUnit] | tuple[TranslationUnit]
@@ -98,17 +127,17 @@ class LanguageIdentifier:
         :returns: The identified language's code or ``None`` if the language
             could not be identified.
         """
-        if not isinstance(instore, (TranslationStore, list, tuple)):
-            return None
+        return self.identify_source_langs([instore])[0]
 
-        text = " ".join(
-            unit.source
-            for unit in instore[:50]  # ty:ignore[not-subscriptable]
-            if unit.istranslatable() and unit.source
+    def identify_source_langs(self, instores) -> list[str | None]:
+        """
+        Identify the source languages of several translation stores at once.
+        :param instores: The translation stores to extract source text from.
+        :returns: The identified language code (or ``None``) of every store.
+        """
+        return self.identify_langs(
+            [self._store_text(instore, "source", 50) for instore in instores]
         )
-        if not text:
-            return None
-        return self.identify_lang(text)
 
     def identify_target_lang(
         self,
@@ -121,17 +150,17 @@ class LanguageIdentifier:
         :returns: The identified language's code or ``None`` if the language
             could not be identified.
         """
-        if not isinstance(instore, (TranslationStore, list, tuple)):
-            return None
+        return self.identify_target_langs([instore])[0]
 
-        text = " ".join(
-            unit.target
-            for unit in instore[:200]  # ty:ignore[not-subscriptable]
-            if unit.istranslatable() and unit.target
+    def identify_target_langs(self, instores) -> list[str | None]:
+        """
+        Identify the target languages of several translation stores at once.
+        :param instores: The translation stores to extract target text from.
+        :returns: The identified language code (or ``None``) of every store.
+        """
+        return self.identify_langs(
+            [self._store_text(instore, "target", 200) for instore in instores]
         )
-        if not text:
-            return None
-        return self.identify_lang(text)
 
 
 if __name__ == "__main__":
@@ -95,8 +95,19 @@ class _NGram:
 
 
 class NGram:
+    """
+    The n-gram models of several languages.
+
+    The models are compiled into a single vocabulary of n-grams and the rank
+    of every n-gram in every model, so that a text is compared with all
+    models at once (using NumPy when it is available).
+    """
+
+    # Maximal number of model ranks compared at once by classify_many()
+    BATCH_SIZE = 4000000
+
     def __init__(self, folder, ext=".lm") -> None:
-        self.ngrams = {}
+        models = {}
         folder = path.join(folder, f"*{ext}")
         size = len(ext)
 
@@ -112,26 +123,102 @@ class NGram:
                 continue
 
             if ngrams:
-                self.ngrams[lang] = _NGram(ngrams)
+                models[lang] = ngrams
 
-        if not self.ngrams:
+        if not models:
             raise ValueError("no language files found")
 
-    def classify(self, text):
-        ngram = _NGram(text)
-        r = "guess"
-
-        min = sys.maxsize
+        self.langs = list(models)
+        # The column of every n-gram occurring in any model
+        self.vocabulary = {}
+        for ngrams in models.values():
+            for ngram in ngrams:
+                self.vocabulary.setdefault(ngram, len(self.vocabulary))
+        # The distance of a text having none of the n-grams of a model
+        self.maxdistances = [nb_ngrams * len(ngrams) for ngrams in models.values()]
+        try:
+            import numpy as np  # ruff:ignore[import-outside-top-level]
+        except ImportError:
+            # The models having every n-gram and its rank in them
+            self.ranks = None
+            self.postings = {}
+            for row, ngrams in enumerate(models.values()):
+                for ngram, rank in ngrams.items():
+                    self.postings.setdefault(ngram, []).append((row, rank))
+        else:
+            # The rank of every n-gram in every model, -1 when it is missing
+            self.ranks = np.full(
+                (len(self.langs), len(self.vocabulary)), -1, dtype=np.int32
+            )
+            for row, ngrams in enumerate(models.values()):
+                columns = [self.vocabulary[ngram] for ngram in ngrams]
+                self.ranks[row, columns] = list(ngrams.values())
+
+    def distances(self, profiles) -> list[list[int]]:
+        """
+        Returns the distances of normalised n-gram profiles to every model.
+
+        The distance sums the differences of the ranks of the n-grams of a
+        model in the profile and in the model, or :data:`nb_ngrams` for the
+        n-grams missing in the profile.
+        """
+        if self.ranks is None:
+            results = []
+            for profile in profiles:
+                distances = list(self.maxdistances)
+                for ngram, rank in profile.items():
+                    for row, modelrank in self.postings.get(ngram, ()):
+                        distances[row] -= nb_ngrams - abs(rank - modelrank)
+                results.append(distances)
+            return results
+
+        import numpy as np  # ruff:ignore[import-outside-top-level]
+
+        results = []
+        maxdistances = np.array(self.maxdistances)[:, np.newaxis]
+        batchcolumns = max(self.BATCH_SIZE // len(self.langs), nb_ngrams)
+        start = 0
+        while start < len(profiles):
+            # Compare the n-grams of a batch of profiles with all models
+            columns = []
+            ranks = []
+            bounds = [0]
+            end = start
+            while end < len(profiles) and len(columns) < batchcolumns:
+                for ngram, rank in profiles[end].items():
+                    column = self.vocabulary.get(ngram)
+                    if column is not None:
+                        columns.append(column)
+                        ranks.append(rank)
+                bounds.append(len(columns))
+                end += 1
+            modelranks = self.ranks[:, columns]
+            scores = np.where(
+                modelranks >= 0, nb_ngrams - np.abs(modelranks - ranks), 0
+            )
+            # Sum the scores of every profile
+            sums = np.zeros((len(self.langs), len(columns) + 1), dtype=np.int64)
+            np.cumsum(scores, axis=1, out=sums[:, 1:])
+            distances = maxdistances - (sums[:, bounds[1:]] - sums[:, bounds[:-1]])
+            results.extend(distances.T.tolist())
+            start = end
+        return results
+
+    def classify_many(self, texts) -> list[str]:
+        """Returns the languages of several texts."""
+        profiles = [_NGram(text).ngrams for text in texts]
+        results = []
+        for distances in self.distances(profiles):
+            # The first of the closest languages
+            lowest = min(distances)
+            if lowest > 0.8 * (nb_ngrams**2):
+                results.append("")
+            else:
+                results.append(self.langs[distances.index(lowest)])
+        return results
 
-        for lang, value in self.ngrams.items():
-            d = value.compare(ngram)
-            if d < min:
-                min = d
-                r = lang
-
-        if min > 0.8 * (nb_ngrams**2):
-            r = ""
-        return r
+    def classify(self, text):
+        return self.classify_many([text])[0]
 
 
 class Generate:
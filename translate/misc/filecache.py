@@ -0,0 +1,91 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Caches of work done on files, stored in SQLite databases.
+
+A file is recognised as unchanged by its modification time and size, and when
+these changed, by the hash of its content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import ClassVar, NamedTuple
+
+
+class FileState(NamedTuple):
+    """The state of a file when it was last processed."""
+
+    mtime: float
+    size: int
+    hash: str
+
+
+def filehash(filename) -> str:
+    """Returns the hash of the content of a file."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    with open(filename, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def filestate(filename, known: FileState | None = None) -> tuple[FileState, bool]:
+    """
+    Returns the current state of a file and whether its content changed since
+    the `known` state.
+
+    The content is only hashed when the modification time or size differ from
+    the known ones. A file which was touched but not changed keeps the known
+    hash with its new modification time and size.
+    """
+    stat = os.stat(filename)
+    if known is not None and (known.mtime, known.size) == (
+        stat.st_mtime,
+        stat.st_size,
+    ):
+        return known, False
+    state = FileState(stat.st_mtime, stat.st_size, filehash(filename))
+    return state, known is None or state.hash != known.hash
+
+
+class SQLiteCache:
+    """An SQLite database which several processes can update at the same time."""
+
+    schema: ClassVar[str] = ""
+    """The SQL statements creating the tables, if they do not exist yet"""
+
+    def __init__(self, filename) -> None:
+        import sqlite3  # ruff:ignore[import-outside-top-level]
+
+        self.filename = filename
+        # Wait for the other processes instead of failing when they write
+        self.connection = sqlite3.connect(filename, timeout=60)
+        self.connection.executescript(self.schema)
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -64,6 +64,23 @@ class ProgressBar:
         self._progressbar.show(filename)
 
 
+# The parser, options, function and arguments used by worker processes. They
+# are inherited from the parent process when forking instead of being pickled.
+_forkjob = None
+
+
+def _runforkjob(index):
+    """Calls the function with the given argument in a worker process."""
+    parser, options, function, arguments, errormessage = _forkjob  # ty:ignore[not-iterable]
+    argument = arguments[index]
+    try:
+        return True, function(argument)
+    except Exception:
+        return False, parser.formatwarning(
+            errormessage(argument), options, sys.exc_info()
+        )
+
+
 class RecursiveOption(optparse.Option):
     """Option type with extra usage metadata used by RecursiveOptionParser."""
 
@@ -141,6 +158,7 @@ class RecursiveOptionParser(optparse.OptionParser):
         self.setmanpageoption()
         self.setprogressoptions()
         self.seterrorleveloptions()
+        self.setjobsoptions()
         self.setformats(formats, usetemplates)
         self.passthrough = []
         self.allowmissingtemplate = allowmissingtemplate
@@ -241,6 +259,19 @@ class RecursiveOptionParser(optparse.OptionParser):
         | None = None,
     ) -> None:
         """Print a warning message incorporating 'msg' to stderr."""
+        logging.getLogger(self.get_prog_name()).warning(
+            self.formatwarning(msg, options, exc_info)
+        )
+
+    @staticmethod
+    def formatwarning(
+        msg,
+        options=None,
+        exc_info: tuple[type[BaseException], BaseException, TracebackType]
+        | tuple[None, None, None]
+        | None = None,
+    ) -> str:
+        """Returns a warning message incorporating 'msg' and the error information."""
         if options:
             if options.errorlevel == "traceback":
                 assert exc_info is not None
@@ -262,7 +293,7 @@ class RecursiveOptionParser(optparse.OptionParser):
                 errorinfo = ""
             if errorinfo:
                 msg += f": {errorinfo}"
-        logging.getLogger(self.get_prog_name()).warning(msg)
+        return msg
 
     @staticmethod
     def getusagestring(option):
@@ -426,6 +457,52 @@ class RecursiveOptionParser(optparse.OptionParser):
         )
         self.define_option(errorleveloption)
 
+    def setjobsoptions(self) -> None:
+        """Sets the option to process files in parallel."""
+        jobsoption = RecursiveOption(
+            None,
+            "--jobs",
+            dest="jobs",
+            default=1,
+            type="int",
+            action="callback",
+            callback=self.checkjobs,
+            metavar="JOBS",
+            help="number of files to process in parallel, 0 for the number of processors",
+        )
+        self.define_option(jobsoption)
+
+    @staticmethod
+    def checkjobs(option, opt_str, value, parser) -> None:
+        """Rejects a negative number of processes when parsing the options."""
+        if value < 0:
+            parser.error(f"{opt_str} must be 0 or more")
+        setattr(parser.values, option.dest, value)
+
+    @staticmethod
+    def getjobs(options) -> int:
+        """Returns the number of processes to use for processing files."""
+        jobs = getattr(options, "jobs", 1)
+        if jobs is None:
+            return 1
+        if jobs == 0:
+            return os.cpu_count() or 1
+        return jobs
+
+    def canprocessinparallel(self, options) -> bool:
+        """
+        Returns whether files can be processed in parallel, this requires every
+        input file to be written to its own output file.
+        """
+        return options.recursiveoutput and self.canfork()
+
+    @staticmethod
+    def canfork() -> bool:
+        """Returns whether worker processes can be forked."""
+        import multiprocessing  # ruff:ignore[import-outside-top-level]
+
+        return "fork" in multiprocessing.get_all_start_methods()
+
     @staticmethod
     def getformathelp(formats) -> str:
         """Make a nice help string for describing formats..."""
@@ -655,6 +732,14 @@ class RecursiveOptionParser(optparse.OptionParser):
         # this makes for more merge-friendly content in single-output-file mode.
         inputfiles.sort()
         progress_bar = ProgressBar(options.progress, inputfiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(inputfiles) > 1 and self.canprocessinparallel(options):
+            self.parallelprocess(options, inputfiles, progress_bar, jobs)
+            return
+        self.serialprocess(options, inputfiles, progress_bar)
+
+    def serialprocess(self, options, inputfiles, progress_bar) -> None:
+        """Process files one after the other."""
         for inputpath in inputfiles:
             try:
                 processingpaths = self.getprocessingpaths(options, inputpath)
@@ -685,6 +770,73 @@ class RecursiveOptionParser(optparse.OptionParser):
                 success = False
             progress_bar.report_progress(inputpath, success)
 
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        """
+        Process files in a pool of worker processes.
+
+        Warnings and progress are reported in the order of the input files.
+        """
+        processingjobs = []
+        for inputpath in inputfiles:
+            try:
+                processingpaths = self.getprocessingpaths(options, inputpath)
+            except Exception:
+                self.warning(
+                    f"Couldn't handle input file {inputpath}", options, sys.exc_info()
+                )
+                continue
+            if processingpaths is not None:
+                processingjobs.append((inputpath, processingpaths))
+
+        def processjob(job):
+            fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = job[1]
+            return self.processfile(
+                fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+            )
+
+        def errormessage(job) -> str:
+            _fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = job[1]
+            return f"Error processing: input {fullinputpath}, output {fulloutputpath}, template {fulltemplatepath}"
+
+        results = self.forkmap(options, processjob, processingjobs, jobs, errormessage)
+        for (inputpath, _processingpaths), (success, result) in zip(
+            processingjobs, results, strict=True
+        ):
+            progress_bar.report_progress(inputpath, success and bool(result))
+
+    def forkmap(self, options, function, arguments, jobs, errormessage):
+        """
+        Calls function with every argument in a pool of forked worker processes.
+
+        The function and arguments are inherited by the worker processes
+        instead of being pickled, only the results are pickled. When a call
+        raises an exception, a warning starting with ``errormessage(argument)``
+        is logged.
+
+        :return: Yields whether every call succeeded and its result (None when
+            it failed), in the order of the arguments.
+        """
+        global _forkjob  # ruff:ignore[global-statement]
+        import multiprocessing  # ruff:ignore[import-outside-top-level]
+        from concurrent.futures import (  # ruff:ignore[import-outside-top-level]
+            ProcessPoolExecutor,
+        )
+
+        arguments = list(arguments)
+        _forkjob = (self, options, function, arguments, errormessage)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                for success, result in executor.map(_runforkjob, range(len(arguments))):
+                    if success:
+                        yield True, result
+                    else:
+                        logging.getLogger(self.get_prog_name()).warning(result)
+                        yield False, None
+        finally:
+            _forkjob = None
+
     def ensurerecursiveoutputdirexists(self, options) -> None:
         if not self.isrecursive(options.output, "output"):
             if not options.output:
@@ -96,6 +96,30 @@ def parse_xml_file(
     )
 
 
+def iterparse_xml(
+    source: str | bytes | os.PathLike[str] | os.PathLike[bytes] | BinaryIO,
+    *,
+    tag: str | None = None,
+    strip_cdata: bool = False,
+    collect_ids: bool = True,
+) -> etree.iterparse:
+    """
+    Parse an XML document incrementally using the shared safe parser defaults.
+
+    The returned iterator yields the ``("end", element)`` events of the
+    elements matching ``tag``.
+    """
+    return etree.iterparse(
+        source,
+        events=("end",),
+        tag=tag,
+        collect_ids=collect_ids,
+        strip_cdata=strip_cdata,
+        resolve_entities=False,
+        no_network=True,
+    )
+
+
 def getText(node, xml_space="preserve"):
     """
     Extracts the plain text content out of the given node.
@@ -28,6 +28,7 @@ will be used which will provide better performance as it is implemented natively
 
 import logging
 import math
+from importlib.util import find_spec
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,30 @@ def native_distance(a, b, stopvalue=0):
     return Levenshtein.distance(a, b)
 
 
+def native_close_distances(queries, choices, stopvalue):
+    """
+    Calculates the distances between all queries and choices in one batch,
+    using all processors.
+
+    Returns a list with, for every query, the (index, distance) tuples of the
+    choices which are at most stopvalue away from it.
+    """
+    import numpy as np  # ruff:ignore[import-outside-top-level]
+    from rapidfuzz import process  # ruff:ignore[import-outside-top-level]
+
+    matrix = process.cdist(
+        queries,
+        choices,
+        scorer=Levenshtein.distance,
+        score_cutoff=stopvalue,
+        workers=-1,
+    )
+    return [
+        [(int(index), int(row[index])) for index in np.flatnonzero(row <= stopvalue)]
+        for row in matrix
+    ]
+
+
 try:
     from rapidfuzz.distance import Levenshtein
 
@@ -82,6 +107,13 @@ except ImportError:
     )
     distance = python_distance
 
+# RapidFuzz needs NumPy to calculate distances in batches, it is only imported
+# when it is used as it takes long to load
+if distance is native_distance and find_spec("numpy") is not None:
+    close_distances = native_close_distances
+else:
+    close_distances = None
+
 
 class LevenshteinComparer:
     def __init__(self, max_len=200) -> None:
@@ -164,6 +196,38 @@ class LevenshteinComparer:
             penalty = 0
         return 100 - (dist * 1.0 / l2) * 100 - penalty
 
+    def similarity_from_distance(self, len_a, len_b, dist, stoppercentage=40):
+        """
+        Returns the same similarity as :meth:`similarity` for two strings with
+        lengths len_a and len_b, given the Levenshtein distance between their
+        first MAX_LEN characters.
+
+        A distance beyond the stop value of stoppercentage gives the same
+        result as when :meth:`similarity` gives up.
+        """
+        l1, l2 = sorted((len_a, len_b))
+        if l1 == 0:
+            return 0
+
+        maxsimilarity = 100 - 100.0 * (l2 - l1) / l2
+        if maxsimilarity < stoppercentage:
+            return maxsimilarity * 1.0
+
+        penalty = 0
+        if l2 > self.MAX_LEN:
+            l2 = self.MAX_LEN
+            penalty += 7
+            if l1 > self.MAX_LEN:
+                penalty += 7
+
+        stopvalue = math.ceil((100.0 - stoppercentage) / 100 * l2)
+        if dist > stopvalue:
+            return stoppercentage - 1.0
+
+        if dist != 0:
+            penalty = 0
+        return 100 - (dist * 1.0 / l2) * 100 - penalty
+
 
 if __name__ == "__main__":
     from sys import argv
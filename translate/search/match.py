@@ -23,12 +23,15 @@ units.
 
 from __future__ import annotations
 
+import bisect
 import heapq
+import math
 import re
+from collections import Counter
 from operator import itemgetter
 
 from translate.misc.multistring import multistring
-from translate.search import lshtein, terminology
+from translate.search import lshtein, terminology, tmdb
 from translate.storage import base, po
 
 
@@ -47,6 +50,22 @@ def _sort_matches(matches, match_info) -> None:
     matches.sort(key=lambda x: match_info[x.source]["pos"])
 
 
+def ngrams(text, size):
+    """
+    Returns the character n-grams of text as (ngram, occurrence) tuples.
+
+    Repeated n-grams are numbered, so that the number of n-grams two strings
+    have in common is simply the size of the intersection of their n-grams.
+    """
+    seen = {}
+    grams = []
+    for i in range(len(text) - size + 1):
+        gram = text[i : i + size]
+        seen[gram] = occurrence = seen.get(gram, 0) + 1
+        grams.append((gram, occurrence))
+    return grams
+
+
 class matcher:
     """
     A class that will do matching and store configuration for the matching
@@ -54,6 +73,9 @@ class matcher:
     """
 
     sort_reverse = False
+    ngram_size = 2
+    # Maximal number of distances calculated at once by matches_many()
+    BATCH_SIZE = 4000000
 
     def __init__(
         self,
@@ -63,18 +85,22 @@ class matcher:
         max_length=70,
         comparer=None,
         usefuzzy=False,
+        useindex=True,
     ) -> None:
         """
         max_candidates is the maximum number of candidates that should be
         assembled, min_similarity is the minimum similarity that must be
         attained to be included in the result, comparer is an optional Comparer
-        with similarity() function.
+        with similarity() function. useindex enables the n-gram index used to
+        skip candidates that can not reach min_similarity (only used with the
+        Levenshtein comparer).
         """
         if comparer is None:
             comparer = lshtein.LevenshteinComparer(max_length)
         self.comparer = comparer
         self.setparameters(max_candidates, min_similarity, max_length)
         self.usefuzzy = usefuzzy
+        self.useindex = useindex
         self.inittm(store)
         self.addpercentage = True
 
@@ -96,12 +122,16 @@ class matcher:
         """
         Initialises the memory for later use. We use simple base units for
         speedup.
+
+        :param stores: A store, a :class:`~translate.search.tmdb.TMDB`
+                       translation memory database, or a list of them.
         """
         # reverse is deprecated - just use self.sort_reverse
         self.existingunits = {}
         self.candidates = base.TranslationStore()
+        self.index = None
 
-        if isinstance(stores, base.TranslationStore):
+        if isinstance(stores, (base.TranslationStore, tmdb.TMDB)):
             stores = [stores]
         for store in stores:
             self.extendtm(store.units, store=store, sort=False)
@@ -142,6 +172,68 @@ class matcher:
             self.candidates.units.append(simpleunit)
         if sort:
             self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
+        # The index refers to positions in the candidate list, it is rebuilt
+        # on the next lookup
+        self.index = None
+
+    def buildindex(self) -> None:
+        """
+        Builds the n-gram index of the candidates.
+
+        The index maps each source length to the positions of the candidates
+        having that length and to an inverted list of the n-grams occurring in
+        them. Only the part of the source considered by the comparer is
+        indexed.
+        """
+        max_len = self.comparer.MAX_LEN
+        index = {}
+        for position, candidate in enumerate(self.candidates.units):
+            length = len(candidate.source)
+            if length not in index:
+                index[length] = ([], {})
+            bucket_positions, postings = index[length]
+            bucket_positions.append(position)
+            for gram in ngrams(candidate.source[:max_len], self.ngram_size):
+                postings.setdefault(gram, []).append(position)
+        self.index = index
+
+    def indexedcandidates(self, text, startlength, stoplength):
+        """
+        Returns the candidates within the given length limits that could
+        reach :attr:`MIN_SIMILARITY`, in the order of the candidate list.
+
+        This uses the q-gram lemma: two strings with a Levenshtein distance of
+        at most k, the longest of them having length l, share at least
+        l - q + 1 - k * q of their q-grams.
+        """
+        if self.index is None:
+            self.buildindex()
+        max_len = self.comparer.MAX_LEN
+        size = self.ngram_size
+        # The comparer only considers the first MAX_LEN characters
+        text = text[:max_len]
+        textgrams = ngrams(text, size)
+        positions = []
+        for length, (bucket_positions, postings) in self.index.items():
+            if length < startlength or length > stoplength:
+                continue
+            longest = max(len(text), min(length, max_len))
+            maxdistance = math.ceil((100.0 - self.MIN_SIMILARITY) / 100 * longest)
+            mincommon = longest - size + 1 - maxdistance * size
+            if mincommon <= 0:
+                # Too short to filter anything
+                positions.extend(bucket_positions)
+                continue
+            common = Counter()
+            for gram in textgrams:
+                if gram in postings:
+                    common.update(postings[gram])
+            positions.extend(
+                position for position, count in common.items() if count >= mincommon
+            )
+        positions.sort()
+        units = self.candidates.units
+        return [units[position] for position in positions]
 
     def setparameters(
         self, max_candidates=10, min_similarity=75, max_length=70
@@ -184,27 +276,29 @@ class matcher:
         # that are better, we can adjust min_similarity upwards for speedup
         min_similarity = self.MIN_SIMILARITY
 
-        # We want to limit our search in self.candidates, so we want to ignore
-        # all units with a source string that is too short or too long. We use
-        # a binary search to find the shortest string, from where we start our
-        # search in the candidates.
-
-        # minimum source string length to be considered
+        # minimum and maximum source string length to be considered
         startlength = self.getstartlength(min_similarity, text)
-        startindex = 0
-        endindex = len(self.candidates.units)
-        while startindex < endindex:
-            mid = (startindex + endindex) // 2
-            if sourcelen(self.candidates.units[mid]) < startlength:
-                startindex = mid + 1
-            else:
-                endindex = mid
-
-        # maximum source string length to be considered
         stoplength = self.getstoplength(min_similarity, text)
         lowestscore = 0
 
-        for candidate in self.candidates.units[startindex:]:
+        if self.useindex and isinstance(self.comparer, lshtein.LevenshteinComparer):
+            candidates = self.indexedcandidates(text, startlength, stoplength)
+        else:
+            # We want to limit our search in self.candidates, so we want to
+            # ignore all units with a source string that is too short or too
+            # long. We use a binary search to find the shortest string, from
+            # where we start our search in the candidates.
+            startindex = 0
+            endindex = len(self.candidates.units)
+            while startindex < endindex:
+                mid = (startindex + endindex) // 2
+                if sourcelen(self.candidates.units[mid]) < startlength:
+                    startindex = mid + 1
+                else:
+                    endindex = mid
+            candidates = self.candidates.units[startindex:]
+
+        for candidate in candidates:
             cmpstring = candidate.source
             if len(cmpstring) > stoplength:
                 break
@@ -226,6 +320,109 @@ class matcher:
         bestcandidates.sort(key=itemgetter(0), reverse=True)
         return self.buildunits(bestcandidates)
 
+    def matches_many(self, texts) -> list[list[base.TranslationUnit]]:
+        """
+        Returns the lists of possible matches for several source texts.
+
+        This gives the same results as calling :meth:`matches` for every text,
+        but when RapidFuzz and NumPy are available the distances are
+        calculated in batches using all processors.
+
+        :param texts: The texts that will be searched for in the translation
+                      memory
+        :return: a list with the result of :meth:`matches` for every text.
+        """
+        if lshtein.close_distances is None or not isinstance(
+            self.comparer, lshtein.LevenshteinComparer
+        ):
+            return [self.matches(text) for text in texts]
+
+        max_len = self.comparer.MAX_LEN
+        units = self.candidates.units
+        lengths = [sourcelen(unit) for unit in units]
+        choices = [unit.source[:max_len] for unit in units]
+
+        # Compute every distinct text only once, shortest first so that
+        # neighbouring texts share most of their candidates
+        queries = sorted({str(text) for text in texts}, key=len)
+        windows = []
+        for query in queries:
+            startlength = self.getstartlength(self.MIN_SIMILARITY, query)
+            stoplength = self.getstoplength(self.MIN_SIMILARITY, query)
+            start = bisect.bisect_left(lengths, startlength)
+            windows.append(
+                (start, max(start, bisect.bisect_right(lengths, stoplength)))
+            )
+
+        results = {}
+        first = 0
+        while first < len(queries):
+            # Collect queries as long as the distance matrix stays reasonably
+            # sized
+            start, end = windows[first]
+            last = first + 1
+            while last < len(queries):
+                newend = max(end, windows[last][1])
+                if (last + 1 - first) * (newend - start) > self.BATCH_SIZE:
+                    break
+                end = newend
+                last += 1
+            batch = queries[first:last]
+            if start < end:
+                longest = min(max(len(batch[-1]), lengths[end - 1]), max_len)
+                stopvalue = math.ceil((100.0 - self.MIN_SIMILARITY) / 100 * longest)
+                distances = lshtein.close_distances(
+                    [query[:max_len] for query in batch], choices[start:end], stopvalue
+                )
+            else:
+                distances = [[] for query in batch]
+            for query, querydistances in zip(batch, distances, strict=True):
+                results[query] = self.bestmatches(
+                    query,
+                    [(start + index, dist) for index, dist in querydistances],
+                )
+            first = last
+
+        return [results[str(text)] for text in texts]
+
+    def bestmatches(self, text, distances):
+        """
+        Selects the best matches for text like :meth:`matches` does, given the
+        distances to the candidates that could reach :attr:`MIN_SIMILARITY`.
+
+        :param distances: (position, distance) tuples in candidate order.
+        """
+        bestcandidates = [(0.0, None)] * self.MAX_CANDIDATES
+        min_similarity = self.MIN_SIMILARITY
+        startlength = self.getstartlength(min_similarity, text)
+        stoplength = self.getstoplength(min_similarity, text)
+        lowestscore = 0
+
+        for position, dist in distances:
+            candidate = self.candidates.units[position]
+            cmpstring = candidate.source
+            if len(cmpstring) < startlength:
+                continue
+            if len(cmpstring) > stoplength:
+                break
+            similarity = self.comparer.similarity_from_distance(
+                len(text), len(cmpstring), dist, min_similarity
+            )
+            if similarity < min_similarity:
+                continue
+            if similarity > lowestscore:
+                heapq.heapreplace(bestcandidates, (similarity, candidate))
+                lowestscore = bestcandidates[0][0]
+                if lowestscore >= 100:
+                    break
+                if min_similarity < lowestscore:
+                    min_similarity = lowestscore
+                    stoplength = self.getstoplength(min_similarity, text)
+
+        bestcandidates = [item for item in bestcandidates if item[0] != 0]
+        bestcandidates.sort(key=itemgetter(0), reverse=True)
+        return self.buildunits(bestcandidates)
+
     def buildunits(self, candidates):
         """
         Builds a list of units conforming to base API, with the score
@@ -303,10 +500,30 @@ class terminologymatcher(matcher):
                     unit.markfuzzy()
                     extras.append(new_unit)
         self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
+        self.sortedcount = len(self.candidates.units)
         if extras:
             # We don't sort, so that the altered forms are at the back and
             # considered last.
             self.extendtm(extras, sort=False)
+        if self.useindex:
+            self.buildindex()
+
+    def extendtm(self, units, store=None, sort=True) -> None:
+        super().extendtm(units, store=store, sort=sort)
+        if sort:
+            self.sortedcount = len(self.candidates.units)
+
+    def buildindex(self) -> None:
+        """
+        Builds the automaton finding the candidate terms in a text.
+
+        The index is the automaton and the positions of the candidates having
+        each of the terms as source.
+        """
+        positions = {}
+        for position, candidate in enumerate(self.candidates.units):
+            positions.setdefault(candidate.source, []).append(position)
+        self.index = (terminology.TerminologyAutomaton(positions), positions)
 
     def getstartlength(self, min_similarity, text) -> int:
         # Let's number false matches by not working with terms of two
@@ -341,14 +558,16 @@ class terminologymatcher(matcher):
         matches = []
         known = set()
 
-        # We want to limit our search in self.candidates, so we want to ignore
-        # all units with a source string that is too long. We use binary search
-        # to find the first string short enough to occur in text, from where we
-        # start our search in the candidates.
+        # We want to limit our search in self.candidates, so we want to
+        # ignore all units with a source string that is too long. We use
+        # binary search to find the first string short enough to occur in
+        # text, from where we start our search in the candidates. Only the
+        # first sortedcount candidates are sorted, the altered forms added
+        # after them are always searched.
 
         # the maximum possible length is text_l
         startindex = 0
-        endindex = len(self.candidates.units)
+        endindex = self.sortedcount
         while startindex < endindex:
             mid = (startindex + endindex) // 2
             if sourcelen(self.candidates.units[mid]) > text_l:
@@ -356,14 +575,37 @@ class terminologymatcher(matcher):
             else:
                 endindex = mid
 
-        for cand in self.candidates.units[startindex:]:
-            source = cand.source
-            if (source, cand.target) in known:
-                continue
-            if comparer.similarity(text, source, self.MIN_SIMILARITY):
-                match_info[source] = {"pos": comparer.match_info[source]["pos"]}  # ty:ignore[unresolved-attribute]
+        if self.useindex and isinstance(comparer, terminology.TerminologyComparer):
+            # Find all the terms in one pass over the text, instead of looking
+            # for every term with the comparer
+            if self.index is None:
+                self.buildindex()
+            automaton, positions = self.index
+            found = automaton.find(text[: comparer.MAX_LEN])
+            units = self.candidates.units
+            for position in sorted(
+                position
+                for source in found
+                for position in positions[source]
+                if position >= startindex
+            ):
+                cand = units[position]
+                source = cand.source
+                if (source, cand.target) in known:
+                    continue
+                comparer.match_info[source] = {"pos": found[source]}  # ty:ignore[unresolved-attribute]
+                match_info[source] = {"pos": found[source]}
                 matches.append(cand)
                 known.add((source, cand.target))
+        else:
+            for cand in self.candidates.units[startindex:]:
+                source = cand.source
+                if (source, cand.target) in known:
+                    continue
+                if comparer.similarity(text, source, self.MIN_SIMILARITY):
+                    match_info[source] = {"pos": comparer.match_info[source]["pos"]}  # ty:ignore[unresolved-attribute]
+                    matches.append(cand)
+                    known.add((source, cand.target))
 
         final_matches = []
         lastend = 0
@@ -18,6 +18,10 @@
 
 """A class that does terminology matching."""
 
+from __future__ import annotations
+
+from collections import deque
+
 
 class TerminologyComparer:
     def __init__(self, max_len=500) -> None:
@@ -43,3 +47,77 @@ class TerminologyComparer:
             self.match_info[term] = {"pos": pos}
             return 100
         return 0
+
+
+class TerminologyAutomaton:
+    """
+    An Aho-Corasick automaton finding many terms in a text at once.
+
+    Looking up a text costs one pass over it, however many terms there are.
+    """
+
+    # The transitions of all states are kept in a single dictionary, the key
+    # of a transition combines the state and the code point of the character
+    CHARACTERS = 0x110000
+
+    def __init__(self, terms) -> None:
+        self.transitions = {}
+        # The state of the longest proper suffix of every state
+        self.failures = [0]
+        # The term ending at a state
+        self.outputs = {}
+        # The next state of the failure links at which a term ends
+        self.outputlinks = {}
+        children = [[]]
+        for term in terms:
+            state = 0
+            for char in term:
+                key = state * self.CHARACTERS + ord(char)
+                nextstate = self.transitions.get(key)
+                if nextstate is None:
+                    nextstate = self.transitions[key] = len(self.failures)
+                    self.failures.append(0)
+                    children[state].append((ord(char), nextstate))
+                    children.append([])
+                state = nextstate
+            self.outputs[state] = term
+        # Breadth first, so that the links of the shorter states are known
+        queue = deque(nextstate for _code, nextstate in children[0])
+        while queue:
+            state = queue.popleft()
+            for code, nextstate in children[state]:
+                queue.append(nextstate)
+                failure = self.failures[state]
+                while (
+                    failure and failure * self.CHARACTERS + code not in self.transitions
+                ):
+                    failure = self.failures[failure]
+                failure = self.transitions.get(failure * self.CHARACTERS + code, 0)
+                self.failures[nextstate] = failure
+                # The terms ending at the suffix also end here
+                if failure in self.outputs:
+                    self.outputlinks[nextstate] = failure
+                elif failure in self.outputlinks:
+                    self.outputlinks[nextstate] = self.outputlinks[failure]
+
+    def find(self, text) -> dict[str, int]:
+        """Returns the terms occurring in text and their first position."""
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+        outputlinks = self.outputlinks
+        characters = self.CHARACTERS
+        found = {outputs[0]: 0} if 0 in outputs else {}
+        state = 0
+        for end, char in enumerate(text, 1):
+            code = ord(char)
+            while state and state * characters + code not in transitions:
+                state = failures[state]
+            state = transitions.get(state * characters + code, 0)
+            output = state if state in outputs else outputlinks.get(state)
+            while output is not None:
+                term = outputs[output]
+                if term not in found:
+                    found[term] = end - len(term)
+                output = outputlinks.get(output)
+        return found
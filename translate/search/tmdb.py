@@ -0,0 +1,240 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+A translation memory database stored in SQLite.
+
+The database keeps the translated units of a set of translation files, so that
+a :class:`~translate.search.match.matcher` can be initialised from it without
+parsing the files again. It is updated incrementally: only files that changed
+since the last update are parsed again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from translate.misc.filecache import FileState, filestate
+from translate.misc.multistring import multistring
+from translate.storage import factory, po
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import IO
+
+    from translate.storage.base import TranslationUnit
+
+logger = logging.getLogger(__name__)
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    file INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    plurals TEXT,
+    notes TEXT NOT NULL,
+    fuzzy INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS units_file ON units(file);
+"""
+
+
+def istmdb(filename) -> bool:
+    """Returns whether filename is a translation memory database."""
+    if not isinstance(filename, str) or not os.path.isfile(filename):
+        return False
+    with open(filename, "rb") as handle:
+        return handle.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+
+def readunits(filename) -> Iterable[TranslationUnit]:
+    """Returns the units of a translation file, which are streamed if possible."""
+    return factory.iterunits(filename)
+
+
+def unitrows(units) -> list[tuple]:
+    """Returns the database rows of the translated units of a file."""
+    rows = []
+    for position, unit in enumerate(units):
+        source = unit.source
+        target = unit.target
+        if not source or not target:
+            continue
+        plurals = None
+        if isinstance(source, multistring) and len(source.strings) > 1:
+            plurals = json.dumps([source.strings, getattr(target, "strings", [target])])
+        rows.append(
+            (
+                position,
+                str(source),
+                str(target),
+                plurals,
+                unit.getnotes(origin="translator"),
+                unit.isfuzzy(),
+            )
+        )
+    return rows
+
+
+class TMDB:
+    """A translation memory database."""
+
+    def __init__(self, filename) -> None:
+        import sqlite3  # ruff:ignore[import-outside-top-level]
+
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def getpaths(self) -> list[str]:
+        """Returns the paths of all files in the database."""
+        return [
+            path
+            for (path,) in self.connection.execute(
+                "SELECT path FROM files ORDER BY path"
+            )
+        ]
+
+    def update(self, filenames, prune=False) -> int:
+        """
+        Adds the translations of the given files to the database.
+
+        Files which did not change since they were added are skipped.
+
+        :param filenames: The translation files to add.
+        :param prune: Whether to remove the files which are in the database
+                      but not in filenames.
+        :return: The number of files which were (re)added.
+        """
+        known = {
+            path: (fileid, FileState(mtime, size, oldhash))
+            for fileid, path, mtime, size, oldhash in self.connection.execute(
+                "SELECT id, path, mtime, size, hash FROM files"
+            )
+        }
+        paths = {os.path.abspath(filename) for filename in filenames}
+        updated = 0
+        with self.connection:
+            if prune:
+                for path in known.keys() - paths:
+                    self.connection.execute(
+                        "DELETE FROM files WHERE id = ?", (known[path][0],)
+                    )
+            for path in sorted(paths):
+                fileid, oldstate = known.get(path, (None, None))
+                state, changed = filestate(path, oldstate)
+                if not changed:
+                    if state != oldstate:
+                        # Touched but not changed
+                        self.connection.execute(
+                            "UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                            (state.mtime, state.size, fileid),
+                        )
+                    continue
+                if fileid is not None:
+                    self.connection.execute("DELETE FROM files WHERE id = ?", (fileid,))
+                try:
+                    rows = unitrows(readunits(path))
+                except Exception:
+                    logger.exception("Could not add %s", path)
+                    continue
+                cursor = self.connection.execute(
+                    "INSERT INTO files (path, mtime, size, hash) VALUES (?, ?, ?, ?)",
+                    (path, *state),
+                )
+                self.connection.executemany(
+                    "INSERT INTO units"
+                    " (file, position, source, target, plurals, notes, fuzzy)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(cursor.lastrowid, *row) for row in rows],
+                )
+                updated += 1
+        return updated
+
+    @property
+    def units(self):
+        """The translated units in the database, as PO units."""
+        return list(self.iterunits())
+
+    def iterunits(self) -> Iterator[po.pounit]:
+        """Yields the translated units in the database, as PO units."""
+        for source, target, plurals, notes, fuzzy in self.connection.execute(
+            "SELECT source, target, plurals, notes, fuzzy FROM units"
+            " JOIN files ON units.file = files.id"
+            " ORDER BY files.path, units.position"
+        ):
+            unit = po.pounit()
+            if plurals is None:
+                unit.source = source
+                unit.target = target
+            else:
+                sources, targets = json.loads(plurals)
+                unit.source = multistring(sources)
+                unit.target = multistring(targets)
+            if notes:
+                unit.addnote(notes, origin="translator")
+            unit.markfuzzy(bool(fuzzy))
+            yield unit
+
+    def exporttmx(self, out: IO[bytes], sourcelanguage, targetlanguage) -> int:
+        """
+        Writes the translations which are not fuzzy to a TMX file.
+
+        The units are written one by one, so that large databases can be
+        exported with bounded memory. Only the first plural forms are written.
+
+        :return: The number of exported units.
+        """
+        from translate.storage import tmx  # ruff:ignore[import-outside-top-level]
+
+        exported = 0
+        with tmx.TmxWriter(out, sourcelanguage) as writer:
+            for source, target, notes in self.connection.execute(
+                "SELECT source, target, notes FROM units"
+                " JOIN files ON units.file = files.id"
+                " WHERE NOT fuzzy"
+                " ORDER BY files.path, units.position"
+            ):
+                writer.addtranslation(
+                    source, sourcelanguage, target, targetlanguage, notes
+                )
+                exported += 1
+        return exported
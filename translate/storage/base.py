@@ -23,6 +23,7 @@ from __future__ import annotations
 import codecs
 import logging
 import os
+import zlib
 from io import BytesIO
 from itertools import starmap
 from typing import (
@@ -41,13 +42,13 @@ from typing import (
 
 from translate.lang.data import get_cldr_plural_tags
 from translate.misc.multistring import multistring
-from translate.storage.placeables import StringElem
-from translate.storage.placeables import parse as rich_parse
 from translate.storage.workflow import StateEnum as states
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
+    from translate.storage.placeables import StringElem
+
 logger = logging.getLogger(__name__)
 
 # Simple BOM based encoding detection
@@ -61,6 +62,28 @@ ENCODING_BOMS = (
     (codecs.BOM_UTF32_LE, "utf-32-le"),
 )
 
+#: BOMs recognised by :meth:`TranslationStore.quick_detection`, the UTF-32
+#: ones go first as they start with the UTF-16 ones
+SIGNATURE_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+#: Strategies for :attr:`TranslationStore.encoding_detection`
+ENCODING_DETECTION = ("full", "sample", "cache")
+
+#: Number of bytes the encoding is detected from when sampling
+ENCODING_SAMPLE_SIZE = 65536
+
+#: Confidence below which a detected encoding is ignored
+ENCODING_CONFIDENCE = 0.48
+
+#: Number of files remembered by the encoding detection cache
+ENCODING_CACHE_SIZE = 256
+
 MISSING = object()
 
 
@@ -69,6 +92,9 @@ class EncodingDict(TypedDict):
     confidence: float | None
 
 
+_encoding_cache: dict[tuple[str, int, int], EncodingDict] = {}
+
+
 class TranslateToolkitError(Exception):
     """Base class for toolkit-defined storage exceptions."""
 
@@ -309,6 +335,11 @@ class TranslationUnit:
              <StringElem([<StringElem(['bar'])>])>,
              <StringElem([<StringElem(['baz'])>])>]
         """
+        # The placeables are only loaded when rich strings are used
+        from translate.storage.placeables import (  # ruff:ignore[import-outside-top-level]
+            parse as rich_parse,
+        )
+
         if isinstance(mulstring, multistring):
             return [rich_parse(s, self.rich_parsers) for s in mulstring.strings]
         return [rich_parse(mulstring, self.rich_parsers)]
@@ -346,6 +377,8 @@ class TranslationUnit:
             raise ValueError("value must be iterable")
         if len(value) < 1:
             raise ValueError("value must have at least one element.")
+        from translate.storage.placeables import StringElem  # ruff:ignore[import-outside-top-level]
+
         if not isinstance(value[0], StringElem):
             raise TypeError("value[0] must be of type StringElem.")
         self._rich_source = list(value)
@@ -366,6 +399,8 @@ class TranslationUnit:
             raise ValueError("value must be iterable")
         if len(value) < 1:
             raise ValueError("value must have at least one element.")
+        from translate.storage.placeables import StringElem  # ruff:ignore[import-outside-top-level]
+
         if not isinstance(value[0], StringElem):
             raise TypeError("value[0] must be of type StringElem.")
         self._rich_target = list(value)
@@ -869,6 +904,12 @@ class TranslationStore(Generic[U]):
     for a unit"""
 
     default_encoding = "utf-8"
+    encoding_detection: Literal["full", "sample", "cache"] = "cache"
+    """How :meth:`detect_encoding` detects an encoding which is neither given
+    by a BOM nor UTF-8: ``"full"`` inspects all of the content, ``"sample"``
+    only its first :data:`ENCODING_SAMPLE_SIZE` bytes, and ``"cache"`` also
+    remembers the result for the file being parsed. With ``"full"`` the BOM
+    and UTF-8 checks are skipped as well."""
     sourcelanguage = None
     targetlanguage = None
 
@@ -1115,16 +1156,53 @@ class TranslationStore(Generic[U]):
                 return {"encoding": encoding, "confidence": 1.0}
         return {"encoding": None, "confidence": None}
 
-    def detect_encoding(
-        self, text: bytes, default_encodings: list[str] | None = None
-    ) -> tuple[str | None, str | None]:
+    @staticmethod
+    def quick_detection(text: bytes) -> EncodingDict | None:
         """
-        Try to detect a file encoding from `text`, using either the chardet lib
-        or by trying to decode the file.
+        Detect an encoding which is given by a BOM or UTF-8 which decodes
+        without errors, returns None when neither applies.
         """
-        if not default_encodings:
-            default_encodings = ["utf-8"]
-        detected_encoding: EncodingDict
+        for bom, encoding in SIGNATURE_BOMS:
+            if text.startswith(bom):
+                return {"encoding": encoding, "confidence": 1.0}
+        # UTF-16 without a BOM is often valid UTF-8 as well
+        if b"\0" in text:
+            return None
+        try:
+            text.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        return {"encoding": "ascii" if text.isascii() else "utf-8", "confidence": 1.0}
+
+    @staticmethod
+    def decodes(text: bytes, detected_encoding: EncodingDict) -> bool:
+        """Whether a confident detection result decodes `text`."""
+        encoding = detected_encoding["encoding"]
+        confidence = detected_encoding["confidence"]
+        if not encoding or confidence is None or confidence < ENCODING_CONFIDENCE:
+            return False
+        try:
+            codecs.decode(text, encoding)
+        except (LookupError, UnicodeDecodeError):
+            return False
+        return True
+
+    def charset_detection(self, text: bytes) -> EncodingDict:
+        """Detect the encoding of `text` as configured by :attr:`encoding_detection`."""
+        if self.encoding_detection not in ENCODING_DETECTION:
+            raise ValueError(
+                f"Unknown encoding detection strategy: {self.encoding_detection}"
+            )
+        if self.encoding_detection != "full":
+            detected_encoding = self.quick_detection(text)
+            if detected_encoding is not None:
+                return detected_encoding
+        key = None
+        filename = getattr(self, "filename", None)
+        if self.encoding_detection == "cache" and filename:
+            key = (os.path.abspath(filename), len(text), zlib.crc32(text))
+            if key in _encoding_cache:
+                return _encoding_cache[key].copy()
         try:
             # ruff:ignore[import-outside-top-level]
             # pylint: disable-next=import-outside-toplevel
@@ -1132,16 +1210,39 @@ class TranslationStore(Generic[U]):
         except ImportError:
             detected_encoding = self.fallback_detection(text)
         else:
-            detected_encoding = detect(text)
-            if (
-                detected_encoding["confidence"] is None
-                or detected_encoding["confidence"] < 0.48
-            ):
-                detected_encoding["encoding"] = None
-            elif detected_encoding["encoding"] == "ascii":
-                detected_encoding["encoding"] = self.encoding
-            elif detected_encoding["encoding"]:
-                detected_encoding["encoding"] = detected_encoding["encoding"].lower()
+            detected_encoding = None
+            if self.encoding_detection != "full" and len(text) > ENCODING_SAMPLE_SIZE:
+                detected_encoding = detect(text[:ENCODING_SAMPLE_SIZE])
+                # The sample is only trusted when it decodes all of the content
+                if not self.decodes(text, detected_encoding):
+                    detected_encoding = None
+            if detected_encoding is None:
+                detected_encoding = detect(text)
+        if key is not None:
+            if len(_encoding_cache) >= ENCODING_CACHE_SIZE:
+                del _encoding_cache[next(iter(_encoding_cache))]
+            _encoding_cache[key] = detected_encoding.copy()
+        return detected_encoding
+
+    def detect_encoding(
+        self, text: bytes, default_encodings: list[str] | None = None
+    ) -> tuple[str | None, str | None]:
+        """
+        Try to detect a file encoding from `text`, using either the chardet lib
+        or by trying to decode the file.
+        """
+        if not default_encodings:
+            default_encodings = ["utf-8"]
+        detected_encoding = self.charset_detection(text)
+        if (
+            detected_encoding["confidence"] is None
+            or detected_encoding["confidence"] < ENCODING_CONFIDENCE
+        ):
+            detected_encoding["encoding"] = None
+        elif detected_encoding["encoding"] == "ascii":
+            detected_encoding["encoding"] = self.encoding
+        elif detected_encoding["encoding"]:
+            detected_encoding["encoding"] = detected_encoding["encoding"].lower()
 
         encodings = []
         # Purposefully accessed the internal _encoding, as encoding is never 'auto'
@@ -23,10 +23,15 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from importlib import import_module
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
 from translate.storage.base import TranslationStore
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from translate.storage.base import TranslationUnit
+
 # TODO: Monolingual formats (with template?)
 
 decompressclass = {
@@ -248,6 +253,35 @@ def getobject(
     return store
 
 
+def iterunits(
+    storefile: str | BinaryIO, localfiletype: str | None = None
+) -> Iterator[TranslationUnit]:
+    """
+    Yields the units of a translation file.
+
+    Stores with an ``iterparse()`` method, like PO and XML files, are parsed
+    incrementally, so that large files are not loaded at once.
+
+    :param storefile: File object or file name.
+    """
+    storeclass = getclass(storefile, localfiletype)
+    if not hasattr(storeclass, "iterparse"):
+        yield from getobject(storefile, localfiletype).units
+        return
+    if not isinstance(storefile, str):
+        yield from storeclass().iterparse(storefile)
+        return
+    _name, ext = os.path.splitext(storefile)
+    ext = ext[len(os.path.extsep) :].lower()
+    if ext in decompressclass:
+        file = import_class(*decompressclass[ext])
+        handle = file(storefile)
+    else:
+        handle = open(storefile, "rb")
+    with handle:
+        yield from storeclass().iterparse(handle)
+
+
 supported = [
     (
         "Gettext PO file",
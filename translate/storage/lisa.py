@@ -22,7 +22,8 @@ from __future__ import annotations
 
 import contextlib
 import copy
-from typing import TypeVar
+from io import BytesIO
+from typing import TYPE_CHECKING, TypeVar
 
 from lxml import etree
 
@@ -31,12 +32,16 @@ from translate.misc.xml_helpers import (
     getText,
     getXMLlang,
     getXMLspace,
+    iterparse_xml,
     namespaced,
     parse_xml,
     reindent,
 )
 from translate.storage import base
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class LISAunit(base.TranslationUnit):
     """
@@ -271,6 +276,69 @@ class LISAunit(base.TranslationUnit):
 U = TypeVar("U", bound=LISAunit)
 
 
+class _UnitDetacher:
+    """
+    Moves the elements of units out of a document which is parsed
+    incrementally, into copies of their ancestors.
+
+    Only the elements preceding a unit in its parent, like the name of a
+    context, are copied with the ancestors. Consecutive units in the same
+    parent share these copies, up to :attr:`CHUNK` units, so that they are
+    not made for every unit while a kept unit holds only a few others.
+    Ancestors which are complete are removed from the document.
+    """
+
+    CHUNK = 64
+
+    def __init__(self) -> None:
+        #: The ancestors of the previous element
+        self.parents: list[etree._Element] = []
+        self.parentcopy: etree._Element | None = None
+        #: The element preceding the units in the document, when the copy
+        #: of their parent was made
+        self.previous: etree._Element | None = None
+        self.count = 0
+
+    def detach(self, element) -> None:
+        parent = element.getparent()
+        if parent is None:
+            return
+        if not self.parents or parent is not self.parents[-1]:
+            ancestors = list(element.iterancestors())
+            ancestors.reverse()
+            depth = 0
+            while (
+                depth < len(self.parents)
+                and depth < len(ancestors)
+                and self.parents[depth] is ancestors[depth]
+            ):
+                depth += 1
+            if depth < len(self.parents):
+                # The previous elements were in an ancestor which is complete
+                finished = self.parents[depth]
+                finished.getparent().remove(finished)
+            self.parents = ancestors
+            self.parentcopy = None
+        previous = element.getprevious()
+        if (
+            self.parentcopy is None
+            or self.count >= self.CHUNK
+            or previous is not self.previous
+        ):
+            root = self.parents[0]
+            parentcopy = etree.Element(root.tag, root.attrib, nsmap=root.nsmap)
+            for ancestor in self.parents[1:]:
+                parentcopy = etree.SubElement(parentcopy, ancestor.tag, ancestor.attrib)
+            # Preceding siblings are iterated backwards
+            for sibling in element.itersiblings(preceding=True):
+                parentcopy.insert(0, copy.deepcopy(sibling))
+            self.parentcopy = parentcopy
+            self.previous = previous
+            self.count = 0
+        self.parentcopy.append(element)
+        self.count += 1
+
+
 class LISAfile(base.TranslationStore[U]):
     """A class representing a file store for one of the LISA file formats."""
 
@@ -401,12 +469,61 @@ class LISAfile(base.TranslationStore[U]):
             xml.seek(0)
             posrc = xml.read()
             xml = posrc
-        self.document = parse_xml(xml, strip_cdata=False).getroottree()
-        self.encoding = self.document.docinfo.encoding
-        self.initbody()
-        assert self.document.getroot().tag == self.namespaced(self.rootNode)
+        self.setdocument(parse_xml(xml, strip_cdata=False).getroottree())
+        self.initunits()
+
+    def initunits(self) -> None:
+        """Creates the units of the parsed document."""
         for entry in self.document.getroot().iterdescendants(
             self.namespaced(self.UnitClass.rootNode)
         ):
             term = self.UnitClass.createfromxmlElement(entry)
             self.addunit(term, new=False)
+
+    def iterparse(self, xml) -> Iterator[U]:
+        """
+        Parses the given file incrementally and yields its units.
+
+        Unlike :meth:`parse` the units are not added to the store, and once
+        the next unit is read the element of a unit is moved out of the
+        document, so that large files can be processed with bounded memory.
+        The units can still be kept, as they are moved into copies of their
+        parent elements, keeping for example the file of XLIFF units or the
+        context of Qt Linguist messages.
+
+        Stores which parse their units differently are parsed at once.
+        """
+        if type(self).parse is not LISAfile.parse:
+            self.parse(xml)
+            yield from self.units
+            return
+        if not hasattr(self, "filename"):
+            self.filename = getattr(xml, "name", "")
+        if isinstance(xml, bytes):
+            xml = BytesIO(xml)
+        elif hasattr(xml, "read"):
+            xml.seek(0)
+        self.units = []
+        unittag = None
+        detacher = _UnitDetacher()
+        events = iterparse_xml(xml, tag=f"{{*}}{self.UnitClass.rootNode}")
+        for _event, element in events:
+            if unittag is None:
+                self.setdocument(element.getroottree())
+                unittag = self.namespaced(self.UnitClass.rootNode)
+            if element.tag != unittag:
+                continue
+            unit = self.UnitClass.createfromxmlElement(element)
+            unit.namespace = self.namespace
+            unit._store = self
+            yield unit
+            detacher.detach(element)
+        if unittag is None:
+            self.setdocument(events.root.getroottree())
+
+    def setdocument(self, document) -> None:
+        """Uses the given (partially) parsed document for this store."""
+        self.document = document
+        self.encoding = document.docinfo.encoding
+        self.initbody()
+        assert self.document.getroot().tag == self.namespaced(self.rootNode)
@@ -42,12 +42,19 @@ in very small files.
 from __future__ import annotations
 
 import array
+import mmap
+import os
 import re
 import struct
+from bisect import bisect_left
+from typing import TYPE_CHECKING
 
 from translate.misc.multistring import multistring
 from translate.storage import base, poheader
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 MO_MAGIC_NUMBER = 0x950412DE
 POT_HEADER = re.compile(r"^POT-Creation-Date:.*(\n|$)", re.IGNORECASE | re.MULTILINE)
 
@@ -64,7 +71,8 @@ def hashpjw(str_param):
         if g != 0:
             hval ^= g >> HASHWORDBITS - 8
             hval ^= g
-    return hval
+    # Gettext stores the hash as an unsigned 32-bit value
+    return hval & 0xFFFFFFFF
 
 
 def get_next_prime_number(start):
@@ -92,6 +100,92 @@ def get_next_prime_number(start):
     return candidate
 
 
+def lst_encode(lst, join_char=b""):
+    return join_char.join([i.encode("utf-8") for i in lst])
+
+
+def headertarget(target: str) -> bytes:
+    """Returns the encoded content of a header for an MO file."""
+    # Support for "reproducible builds": Delete information that
+    # may vary between builds in the same conditions.
+    return POT_HEADER.sub("", target).encode("utf-8")
+
+
+def writemessages(out, messages: dict[bytes, bytes], count: int | None = None) -> None:
+    """
+    Writes an MO file containing the given messages.
+
+    :param out: The binary file to write to.
+    :param messages: The encoded msgids (with their context and plural forms)
+        and their encoded translations.
+    :param count: The number of units the hash table is sized for, defaults to
+        the number of messages.
+    """
+    # check the header of this file for the copyright note of this function
+
+    def add_to_hash_table(string, i) -> None:
+        hash_value = hashpjw(string)
+        hash_cursor = hash_value % hash_size
+        increment = 1 + (hash_value % (hash_size - 2))
+        while hash_table[hash_cursor] != 0:
+            hash_cursor += increment
+            hash_cursor %= hash_size
+        hash_table[hash_cursor] = i + 1
+
+    if count is None:
+        count = len(messages)
+    # hash_size should be the smallest prime number that is greater
+    # or equal (4 / 3 * N) - where N is the number of keys/units.
+    # see gettext-0.17:gettext-tools/src/write-mo.c:406
+    hash_size = get_next_prime_number((count * 4) // 3)
+    if hash_size <= 2:
+        hash_size = 3
+    # using "I" works for 32- and 64-bit systems, but not for 16-bit!
+    hash_table = array.array("I", [0] * hash_size)
+    # the keys are sorted in the .mo file
+    keys = sorted(messages)
+    # The header is 7 32-bit unsigned integers
+    keystart = 7 * 4 + 16 * len(keys) + hash_size * 4
+    # and the values start after the keys
+    valuestart = keystart + sum(len(key) + 1 for key in keys)
+    # The string table first has the list of keys, then the list of values.
+    # Each entry has first the size of the string, then the file offset.
+    koffsets = []
+    voffsets = []
+    ids = []
+    strs = []
+    for i, key in enumerate(keys):
+        # For each string, we need size and file offset.  Each string is
+        # NUL terminated; the NUL does not count into the size.
+        # TODO: We don't do any encoding detection from the PO Header
+        add_to_hash_table(key, i)
+        string = messages[key]
+        koffsets += (len(key), keystart)
+        voffsets += (len(string), valuestart)
+        keystart += len(key) + 1
+        valuestart += len(string) + 1
+        ids.append(key)
+        strs.append(string)
+    out.write(
+        struct.pack(
+            "Iiiiiii",
+            MO_MAGIC_NUMBER,  # Magic
+            0,  # Version
+            len(keys),  # # of entries
+            7 * 4,  # start of key index
+            7 * 4 + len(keys) * 8,  # start of value index
+            hash_size,  # size of hash table
+            7 * 4 + 2 * (len(keys) * 8),  # offset of hash table
+        )
+    )
+    # additional data is not necessary for empty mo files
+    if len(keys) > 0:
+        out.write(array.array("i", koffsets + voffsets).tobytes())
+        out.write(hash_table.tobytes())
+        out.write(b"\0".join(ids) + b"\0")
+        out.write(b"\0".join(strs) + b"\0")
+
+
 class mounit(base.TranslationUnit):
     """A class representing a .mo translation message."""
 
@@ -119,6 +213,29 @@ class mounit(base.TranslationUnit):
         return bool(self.source)
 
 
+def charset(header: bytes) -> str | None:
+    """Returns the charset declared in the content of an MO file header."""
+    match = re.search(rb"charset=([^\s]+)", header)
+    if match:
+        return match.group(1).decode()
+    return None
+
+
+def buildunit(key: bytes, value: bytes, encoding: str) -> mounit:
+    """Returns the unit of an entry of an MO file."""
+    context = None
+    if b"\x04" in key:
+        context, key = key.split(b"\x04")
+    # Still need to handle KDE comments
+    source = multistring([s.decode(encoding) for s in key.split(b"\0")])
+    target = multistring([s.decode(encoding) for s in value.split(b"\0")])
+    unit = mounit(source)
+    unit.target = target
+    if context is not None:
+        unit.msgctxt.append(context.decode(encoding))
+    return unit
+
+
 class mofile(poheader.poheader, base.TranslationStore):
     """A class representing a .mo file."""
 
@@ -136,27 +253,7 @@ class mofile(poheader.poheader, base.TranslationStore):
 
     def serialize(self, out) -> None:
         """Output a string representation of the MO data file."""
-        # check the header of this file for the copyright note of this function
-
-        def add_to_hash_table(string, i) -> None:
-            hash_value = hashpjw(string)
-            hash_cursor = hash_value % hash_size
-            increment = 1 + (hash_value % (hash_size - 2))
-            while hash_table[hash_cursor] != 0:
-                hash_cursor += increment
-                hash_cursor %= hash_size
-            hash_table[hash_cursor] = i + 1
-
-        def lst_encode(lst, join_char=b""):
-            return join_char.join([i.encode("utf-8") for i in lst])
-
-        # hash_size should be the smallest prime number that is greater
-        # or equal (4 / 3 * N) - where N is the number of keys/units.
-        # see gettext-0.17:gettext-tools/src/write-mo.c:406
-        hash_size = get_next_prime_number((len(self.units) * 4) // 3)
-        if hash_size <= 2:
-            hash_size = 3
-        MESSAGES = {}
+        messages = {}
         for unit in self.units:
             # If the unit is not translated, we should rather omit it entirely
             if not unit.istranslated():
@@ -172,58 +269,12 @@ class mofile(poheader.poheader, base.TranslationStore):
             if isinstance(unit.target, multistring):
                 target = lst_encode(unit.target.strings, b"\0")
             elif unit.isheader():
-                # Support for "reproducible builds": Delete information that
-                # may vary between builds in the same conditions.
-                target = POT_HEADER.sub("", unit.target).encode("utf-8")
+                target = headertarget(unit.target)
             else:
                 target = unit.target.encode("utf-8")
             if unit.target:
-                MESSAGES[source] = target
-        # using "I" works for 32- and 64-bit systems, but not for 16-bit!
-        hash_table = array.array("I", [0] * hash_size)
-        # the keys are sorted in the .mo file
-        keys = sorted(MESSAGES.keys())
-        offsets = []
-        ids = strs = b""
-        for i, id in enumerate(keys):
-            # For each string, we need size and file offset.  Each string is
-            # NUL terminated; the NUL does not count into the size.
-            # TODO: We don't do any encoding detection from the PO Header
-            add_to_hash_table(id, i)
-            string = MESSAGES[id]  # id already encoded for use as dictionary key
-            offsets.append((len(ids), len(id), len(strs), len(string)))
-            ids = ids + id + b"\0"
-            strs = strs + string + b"\0"
-        # The header is 7 32-bit unsigned integers
-        keystart = 7 * 4 + 16 * len(keys) + hash_size * 4
-        # and the values start after the keys
-        valuestart = keystart + len(ids)
-        koffsets = []
-        voffsets = []
-        # The string table first has the list of keys, then the list of values.
-        # Each entry has first the size of the string, then the file offset.
-        for o1, l1, o2, l2 in offsets:
-            koffsets = [*koffsets, l1, o1 + keystart]
-            voffsets = [*voffsets, l2, o2 + valuestart]
-        offsets = koffsets + voffsets
-        out.write(
-            struct.pack(
-                "Iiiiiii",
-                MO_MAGIC_NUMBER,  # Magic
-                0,  # Version
-                len(keys),  # # of entries
-                7 * 4,  # start of key index
-                7 * 4 + len(keys) * 8,  # start of value index
-                hash_size,  # size of hash table
-                7 * 4 + 2 * (len(keys) * 8),  # offset of hash table
-            )
-        )
-        # additional data is not necessary for empty mo files
-        if len(keys) > 0:
-            out.write(array.array("i", offsets).tobytes())
-            out.write(hash_table.tobytes())
-            out.write(ids)
-            out.write(strs)
+                messages[source] = target
+        writemessages(out, messages, len(self.units))
 
     @staticmethod
     def parse_header(content: bytes) -> tuple[str, int, int, int, int, int, int, int]:
@@ -290,26 +341,129 @@ class mofile(poheader.poheader, base.TranslationStore):
             vlength, voffset = struct.unpack(
                 f"{endian}ii", content[nextvalue : nextvalue + (2 * 4)]
             )
-            source = content[koffset : koffset + klength]
-            context = None
-            if b"\x04" in source:
-                context, source = source.split(b"\x04")
-            # Still need to handle KDE comments
-            if not source:
-                charset = re.search(
-                    rb"charset=([^\s]+)", content[voffset : voffset + vlength]
-                )
-                if charset:
-                    self.encoding = charset.group(1).decode()
-            source = multistring([s.decode(self.encoding) for s in source.split(b"\0")])
-            target = multistring(
-                [
-                    s.decode(self.encoding)
-                    for s in content[voffset : voffset + vlength].split(b"\0")
-                ]
+            key = content[koffset : koffset + klength]
+            value = content[voffset : voffset + vlength]
+            if not key.rpartition(b"\x04")[2]:
+                self.encoding = charset(value) or self.encoding
+            self.addunit(buildunit(key, value, self.encoding))
+
+
+class MoReader:
+    """
+    Read-only access to the translations of a .mo file without parsing it.
+
+    The file is memory mapped and :meth:`translate` looks up single strings
+    through the hash table of the file, or with a binary search over the
+    sorted keys when the file has no hash table. Units are only created when
+    iterating over the reader.
+
+    :param input: A file name, a binary file object or the content of the file.
+    """
+
+    def __init__(self, input) -> None:
+        self._mmap = None
+        if isinstance(input, bytes):
+            content = input
+        else:
+            if isinstance(input, (str, os.PathLike)):
+                with open(input, "rb") as handle:
+                    self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._mmap = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+            content = self._mmap
+        self.content = memoryview(content)
+        (
+            endian,
+            version_maj,
+            version_min,
+            self.lenkeys,
+            self.startkey,
+            self.startvalue,
+            self.sizehash,
+            self.offsethash,
+        ) = mofile.parse_header(bytes(self.content[:28]))
+        if version_maj >= 1:
+            self.close()
+            raise base.ParseError(
+                f"Unable to process version {version_maj}.{version_min} MO files"
             )
-            newunit = mounit(source)
-            newunit.target = target
-            if context is not None:
-                newunit.msgctxt.append(context.decode(self.encoding))
-            self.addunit(newunit)
+        self._entry = struct.Struct(f"{endian}II")
+        self._hashentry = struct.Struct(f"{endian}I")
+        self.encoding = "utf-8"
+        header = self._lookup(b"")
+        if header is not None:
+            self.encoding = charset(self._value(header)) or self.encoding
+
+    def close(self) -> None:
+        self.content.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.lenkeys
+
+    def _key(self, index: int) -> bytes:
+        length, offset = self._entry.unpack_from(
+            self.content, self.startkey + index * 8
+        )
+        return bytes(self.content[offset : offset + length])
+
+    def _value(self, index: int) -> bytes:
+        length, offset = self._entry.unpack_from(
+            self.content, self.startvalue + index * 8
+        )
+        return bytes(self.content[offset : offset + length])
+
+    def _msgid(self, index: int) -> bytes:
+        """Returns the key of an entry, without the plural form."""
+        return self._key(index).partition(b"\0")[0]
+
+    def _lookup(self, msgid: bytes) -> int | None:
+        """Returns the index of the entry with the given key."""
+        if self.sizehash > 2:
+            # The same algorithm as Gettext uses
+            hash_value = hashpjw(msgid)
+            cursor = hash_value % self.sizehash
+            increment = 1 + (hash_value % (self.sizehash - 2))
+            for _ in range(self.sizehash):
+                (entry,) = self._hashentry.unpack_from(
+                    self.content, self.offsethash + cursor * 4
+                )
+                if entry == 0:
+                    return None
+                if self._msgid(entry - 1) == msgid:
+                    return entry - 1
+                cursor = (cursor + increment) % self.sizehash
+            return None
+        index = bisect_left(range(self.lenkeys), msgid, key=self._msgid)
+        if index < self.lenkeys and self._msgid(index) == msgid:
+            return index
+        return None
+
+    def translate(self, source: str, context: str | None = None):
+        """
+        Returns the translation of a source string, or None if there is none.
+
+        Plural translations are returned as a multistring.
+        """
+        msgid = source.encode(self.encoding)
+        if context is not None:
+            msgid = context.encode(self.encoding) + b"\x04" + msgid
+        index = self._lookup(msgid)
+        if index is None:
+            return None
+        target = self._value(index).decode(self.encoding)
+        if "\0" in target:
+            return multistring(target.split("\0"))
+        return target
+
+    def __iter__(self) -> Iterator[mounit]:
+        for index in range(self.lenkeys):
+            yield buildunit(self._key(index), self._value(index), self.encoding)
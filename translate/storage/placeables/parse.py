@@ -23,12 +23,88 @@ based "rich" string element trees.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
+from translate.storage.placeables.general import RegexParseMixin
 from translate.storage.placeables.strelem import StringElem
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
+
+
+class RegexTokenizer:
+    """
+    Parses strings into the same trees as :func:`parse` with the ``parse``
+    methods of :class:`~translate.storage.placeables.general.RegexParseMixin`
+    placeables.
+
+    Every part of the string is split by the first placeable which matches it,
+    and the parts between the matches by the following placeables, but the
+    tree is built directly instead of being expanded and pruned for every
+    placeable.
+    """
+
+    def __init__(self, placeables: Sequence[type[RegexParseMixin]]) -> None:
+        self.placeables = list(placeables)
+
+    def parse(self, text: str) -> StringElem:
+        tree = StringElem(text)
+        if text:
+            self.expand(tree, text, 0)
+        return tree
+
+    def expand(self, elem: StringElem, text: str, level: int) -> None:
+        """Splits the text of elem with the placeables from level on."""
+        for index in range(level, len(self.placeables)):
+            placeable = self.placeables[index]
+            sub: list[StringElem] = []
+            end = 0
+            for match in placeable.regex.finditer(text):
+                start = match.start()
+                if start != end:
+                    sub.append(StringElem(text[end:start]))
+                end = match.end()
+                sub.append(placeable([text[start:end]]))
+            if not sub:
+                continue
+            if end != len(text):
+                sub.append(StringElem(text[end:]))
+            if len(sub) == 1 and isinstance(sub[0], type(elem)) and elem == sub[0]:
+                continue
+            for position, child in enumerate(sub):
+                if not child.istranslatable:
+                    continue
+                childtext = str(child)
+                if not childtext:
+                    continue
+                self.expand(child, childtext, index + 1)
+                # A part which is a single placeable is replaced by it
+                if (
+                    type(child) is StringElem
+                    and len(child.sub) == 1
+                    and isinstance(child.sub[0], StringElem)
+                    and type(child.sub[0]) is not StringElem
+                ):
+                    sub[position] = child.sub[0]
+            elem.sub = sub
+            return
+
+
+@cache
+def compile_parsers(
+    parse_funcs: tuple[Callable[[str], StringElem | list[StringElem] | None], ...],
+) -> RegexTokenizer | None:
+    """
+    Returns the tokenizer for parsing functions, or None if they are not all
+    the ``parse`` methods of regular expression placeables.
+    """
+    placeables = []
+    for parse_func in parse_funcs:
+        if getattr(parse_func, "__func__", None) is not RegexParseMixin.parse.__func__:
+            return None
+        placeables.append(parse_func.__self__)  # ty:ignore[unresolved-attribute]
+    return RegexTokenizer(placeables)
 
 
 def parse(
@@ -48,6 +124,10 @@ def parse(
     set of leaves with the used parsing function removed from
     ``parse_funcs``.
 
+    Strings parsed with the ``parse`` methods of regular expression
+    placeables are split by a :class:`RegexTokenizer`, which builds the same
+    tree directly.
+
     :param tree: The string or string element sub-tree to parse.
     :param parse_funcs: A list of parsing functions. Each function takes
                         one argument (a ``unicode`` string to parse) and
@@ -56,6 +136,9 @@ def parse(
                         parsed, it should return ``None``.
     """
     if isinstance(tree, str):
+        tokenizer = compile_parsers(tuple(parse_funcs))
+        if tokenizer is not None:
+            return tokenizer.parse(tree)
         tree = StringElem(tree)
     if not parse_funcs:
         return tree
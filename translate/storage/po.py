@@ -28,14 +28,14 @@ tested).
 
 import logging
 import os
-import platform
+import sys
 
 __all__ = ("lsep", "pofile", "pounit")
 
 logger = logging.getLogger(__name__)
 usecpo = os.getenv("USECPO")
 
-if platform.python_implementation() == "CPython":
+if sys.implementation.name == "cpython":
     if usecpo == "1":
         from translate.storage.cpo import lsep, pofile, pounit
     elif usecpo == "2":
@@ -46,6 +46,6 @@ else:
     if usecpo:
         logger.error(
             "cPO and fPO do not work on %s defaulting to PyPO",
-            platform.python_implementation(),
+            sys.implementation.name,
         )
     from translate.storage.pypo import lsep, pofile, pounit
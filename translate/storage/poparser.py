@@ -40,7 +40,7 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
 
     from .pypo import pofile, pounit
 
@@ -64,7 +64,7 @@ class PoParseError(ValueError):
 class PoParseState:
     def __init__(
         self,
-        input_lines: list[bytes] | list[str],
+        input_lines: Sequence[bytes] | Sequence[str],
         UnitClass: Callable[[], pounit],
         encoding: str | None = None,
     ) -> None:
@@ -105,6 +105,7 @@ class PoParseState:
                 error_line=self.charset_line,
             ) from error
         self.encoding = encoding
+        self._current_encoding = encoding
         self.next_line = ""
         self.lineno = 0
         self.eof = False
@@ -151,7 +152,13 @@ class PoParseState:
                 self.next_line = next_line
         return current
 
-    def new_input(self, input_lines: list[bytes] | list[str]) -> PoParseState:
+    def discard_parsed_lines(self) -> None:
+        """Allow a streamed input to free the lines which were already parsed."""
+        discard = getattr(self._input_lines, "discard", None)
+        if discard is not None:
+            discard(self.lineno)
+
+    def new_input(self, input_lines: Sequence[bytes] | Sequence[str]) -> PoParseState:
         return PoParseState(input_lines, self.UnitClass, self.encoding)
 
 
@@ -436,12 +443,20 @@ def parse_header(parse_state: PoParseState, store: pofile) -> pounit | None:
     return parse_unit(parse_state)
 
 
-def parse_units(parse_state: PoParseState, store: pofile) -> None:
+def iter_units(parse_state: PoParseState, store: pofile) -> Iterator[pounit]:
     unit = parse_header(parse_state, store)
+    # The encoding is known now, the parser will not restart anymore
+    parse_state.discard_parsed_lines()
     while unit:
         if not unit.obsolete:
             unit.infer_state()
-        store.addunit(unit)
+        yield unit
         unit = parse_unit(parse_state)
+        parse_state.discard_parsed_lines()
     if not parse_state.eof:
         raise PoParseError(parse_state)
+
+
+def parse_units(parse_state: PoParseState, store: pofile) -> None:
+    for unit in iter_units(parse_state, store):
+        store.addunit(unit)
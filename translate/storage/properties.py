@@ -135,8 +135,6 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import TypeVar
 
-from lxml import etree
-
 from translate.lang import data
 from translate.misc.multistring import multistring
 from translate.misc.quote import (
@@ -148,7 +146,6 @@ from translate.misc.quote import (
     xwiki_properties_decode,
     xwiki_properties_encode,
 )
-from translate.misc.xml_helpers import get_safe_xml_parser
 from translate.storage import base
 
 labelsuffixes = (".label", ".title")
@@ -1457,8 +1454,18 @@ class XWikiPageProperties(xwikifile):
 
     @staticmethod
     def get_parser():
+        # lxml is only loaded for XWiki pages
+        from translate.misc.xml_helpers import (  # ruff:ignore[import-outside-top-level]
+            get_safe_xml_parser,
+        )
+
         return get_safe_xml_parser(strip_cdata=False)
 
+    def parse_xml(self, xmlsrc):
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
+        return etree.XML(xmlsrc, self.get_parser())
+
     def extract_language(self) -> None:
         language_node = self.root.find("language")  # ty:ignore[unresolved-attribute]
         if language_node is not None and language_node.text:
@@ -1470,7 +1477,7 @@ class XWikiPageProperties(xwikifile):
 
     def parse(self, propsrc) -> None:
         if propsrc != b"\n":
-            self.root = etree.XML(propsrc, self.get_parser())
+            self.root = self.parse_xml(propsrc)
             content = "".join(self.root.find("content").itertext())
             content = content.encode(self.encoding)
             self.extract_language()
@@ -1493,6 +1500,8 @@ class XWikiPageProperties(xwikifile):
             newroot.set("locale", language_node.text)
 
     def write_xwiki_xml(self, newroot, out) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         xml_content = etree.tostring(newroot, encoding=self.encoding, method="xml")
         out.write(self.XML_HEADER.encode(self.encoding))
         out.write(xml_content)
@@ -1500,7 +1509,7 @@ class XWikiPageProperties(xwikifile):
 
     def serialize(self, out) -> None:
         if self.root is None:
-            self.root = etree.XML(self.XWIKI_BASIC_XML, self.get_parser())
+            self.root = self.parse_xml(self.XWIKI_BASIC_XML)
         newroot = deepcopy(self.root)
         # We add a line break to ensure to have a line break before
         # closing of content tag.
@@ -1528,7 +1537,7 @@ class XWikiFullPage(XWikiPageProperties):
 
     def parse(self, propsrc) -> None:
         if propsrc != b"\n":
-            self.root = etree.XML(propsrc, self.get_parser())
+            self.root = self.parse_xml(propsrc)
             content = "".join(self.root.find("content").itertext()).replace("\n", "\\n")
             title = "".join(self.root.find("title").itertext())
             forparsing = ""
@@ -1549,7 +1558,7 @@ class XWikiFullPage(XWikiPageProperties):
         unit_title = self.findid("title")
         unit_content = self.findid("content")
         if self.root is None:
-            self.root = etree.XML(self.XWIKI_BASIC_XML, self.get_parser())
+            self.root = self.parse_xml(self.XWIKI_BASIC_XML)
         newroot = deepcopy(self.root)
         if unit_title is not None:
             newroot.find("title").text = self.output_unit(unit_title)
@@ -29,6 +29,7 @@ import copy
 import logging
 import re
 from functools import lru_cache
+from io import BytesIO
 from itertools import chain
 from string import punctuation
 from typing import IO, TYPE_CHECKING
@@ -65,6 +66,10 @@ po_line_break_chars = {"/", "}", ")", ">", "-"}
 po_mergeable_chars = po_line_break_chars | {" ", "\t"}
 po_open_parenthesis_chars = {"{", "("}
 po_punctuation = set(punctuation)
+po_newline_end_re = re.compile(rb"\n|\r[^\r]")
+
+BOM = b"\xef\xbb\xbf"
+READ_BLOCKSIZE = 1 << 16
 
 
 def splitlines(text: bytes) -> tuple[list[bytes], str]:
@@ -87,8 +92,14 @@ def splitlines(text: bytes) -> tuple[list[bytes], str]:
     """
     # Strip UTF-8 BOM if present. This file would not be accepted
     # by gettext, but some editors might create it, so better handle it.
-    if text[:3] == b"\xef\xbb\xbf":
+    if text[:3] == BOM:
         text = text[3:]
+    newline = detectnewline(text)
+    return [x + newline for x in text.split(newline)], newline.decode()
+
+
+def detectnewline(text: bytes) -> bytes:
+    """Returns the newline used after the first msgid, see :func:`splitlines`."""
     # Find first newline after first msgid
     newline = b"\n"
     msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
@@ -110,8 +121,70 @@ def splitlines(text: bytes) -> tuple[list[bytes], str]:
                 # Just CR without LF
                 newline = b"\r"
             break
+    return newline
 
-    return [x + newline for x in text.split(newline)], newline.decode()
+
+def hasnewline(text: bytes) -> bool:
+    """Returns whether text is long enough to detect the newline used."""
+    msgid_pos = max(text.find(b"\rmsgid "), text.find(b"\nmsgid "))
+    if msgid_pos < 0 and not text.startswith(b"msgid "):
+        return False
+    return po_newline_end_re.search(text, max(0, msgid_pos + 1)) is not None
+
+
+class PoLineStream:
+    """
+    The lines of a PO file which is read incrementally.
+
+    It can be used instead of the list of lines returned by
+    :func:`splitlines`, lines are read from the file when they are
+    accessed and can be discarded once they are parsed.
+    """
+
+    def __init__(self, inputfile: IO[bytes], blocksize: int = READ_BLOCKSIZE) -> None:
+        self._inputfile = inputfile
+        self._blocksize = blocksize
+        self._lines: list[bytes] = []
+        self._offset = 0
+        self._eof = False
+        data = b""
+        while not self._eof and not hasnewline(data):
+            data += self._read()
+        if data[:3] == BOM:
+            data = data[3:]
+        self.newline = detectnewline(data)
+        self._pending = b""
+        self._addlines(data)
+
+    def _read(self) -> bytes:
+        block = self._inputfile.read(self._blocksize)
+        if not block:
+            self._eof = True
+        return block
+
+    def _addlines(self, data: bytes) -> None:
+        lines = (self._pending + data).split(self.newline)
+        if self._eof:
+            self._pending = b""
+        else:
+            self._pending = lines.pop()
+        self._lines.extend(line + self.newline for line in lines)
+
+    def __getitem__(self, index: int) -> bytes:
+        index -= self._offset
+        while index >= len(self._lines):
+            if self._eof:
+                raise IndexError(index + self._offset)
+            self._addlines(self._read())
+        if index < 0:
+            raise IndexError(f"line {index + self._offset} was already discarded")
+        return self._lines[index]
+
+    def discard(self, index: int) -> None:
+        """Frees the lines before index, they can not be accessed anymore."""
+        if index > self._offset:
+            del self._lines[: index - self._offset]
+            self._offset = index
 
 
 def escapehandler(match: re.Match) -> str:
@@ -574,12 +647,13 @@ class pounit(pocommon.pounit):
                 mergelists(self.msgidcomments, otherunit.msgidcomments)
                 mergelists(self.sourcecomments, otherunit.sourcecomments, split=True)
         if not self.istranslated() or overwrite:
+            target = otherunit.target
             # Remove kde-style comments from the translation (if any).
-            if self._extract_msgidcomments(otherunit.target):
-                otherunit.target = otherunit.target.replace(
+            if otherunit.msgidcomments:
+                target = target.replace(
                     f"_: {otherunit._extract_msgidcomments()}{self.newline}", ""
                 )
-            self.target = otherunit.target
+            self.target = target
             if (
                 self.source != otherunit.source
                 or self.getcontext() != otherunit.getcontext()
@@ -894,17 +968,218 @@ class pounit(pocommon.pounit):
         return id
 
 
+class UnsetList(list):
+    """
+    The value of an unset list attribute of a :class:`compactpounit`.
+
+    The list stores itself on the unit when it is first changed, until then
+    the attribute takes no memory.
+    """
+
+    __slots__ = ("_slot", "_unit")
+
+    def __init__(self, unit: compactpounit, slot: str) -> None:
+        # The list is created empty, there is no need to call list.__init__
+        self._unit: compactpounit | None = unit
+        self._slot = slot
+
+    def __reduce_ex__(self, protocol):
+        # Copies are plain lists
+        return list, (list(self),)
+
+    def _attach(self) -> list:
+        """Returns the list to change, storing this one on the unit if unset."""
+        unit = self._unit
+        if unit is None:
+            return self
+        current = getattr(unit, self._slot)
+        if current is None:
+            setattr(unit, self._slot, self)
+            self._unit = None
+            return self
+        # Another list was stored meanwhile
+        return current
+
+    def append(self, value) -> None:
+        list.append(self._attach(), value)
+
+    def extend(self, values) -> None:
+        list.extend(self._attach(), values)
+
+    def insert(self, index, value) -> None:
+        list.insert(self._attach(), index, value)
+
+    def __setitem__(self, index, value) -> None:
+        list.__setitem__(self._attach(), index, value)
+
+    def __iadd__(self, values):
+        target = self._attach()
+        list.extend(target, values)
+        return target
+
+
+class LazyList:
+    """A list attribute of a :class:`compactpounit` which is created when changed."""
+
+    def __set_name__(self, owner, name) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, unit, owner=None):
+        if unit is None:
+            return self
+        value = getattr(unit, self.slot)
+        if value is None:
+            return UnsetList(unit, self.slot)
+        return value
+
+    def __set__(self, unit, value) -> None:
+        setattr(unit, self.slot, value)
+
+
+class compactpounit(pounit):
+    """
+    A PO unit which uses less memory.
+
+    The attributes are stored in slots instead of a dictionary, and the lists
+    of comments and of the optional fields are only created once something is
+    added to them. This saves much memory when loading large files, at the
+    cost of slightly slower parsing.
+    """
+
+    __slots__ = (
+        "_automaticcomments",
+        "_context",
+        "_docpath",
+        "_line_number",
+        "_msgctxt",
+        "_msgid_plural",
+        "_msgid_pluralcomments",
+        "_msgidcomments",
+        "_msgstrlen_cache",
+        "_othercomments",
+        "_prev_context",
+        "_prev_msgctxt",
+        "_prev_msgid",
+        "_prev_msgid_plural",
+        "_prev_source",
+        "_prev_target",
+        "_rich_source",
+        "_rich_target",
+        "_source_cache",
+        "_source_cache_key",
+        "_sourcecomments",
+        "_state_n",
+        "_store",
+        "_target_cache",
+        "_typecomments",
+        "_typecomments_cache",
+        "msgid",
+        "msgstr",
+        "obsolete",
+        "wrapper",
+    )
+
+    othercomments = LazyList()
+    automaticcomments = LazyList()
+    sourcecomments = LazyList()
+    typecomments = LazyList()
+    msgidcomments = LazyList()
+    prev_msgctxt = LazyList()
+    prev_msgid = LazyList()
+    prev_msgid_plural = LazyList()
+    msgctxt = LazyList()
+    msgid_pluralcomments = LazyList()
+    msgid_plural = LazyList()
+
+    def __init__(self, source=None, wrapper: PoWrapper | None = None, **kwargs) -> None:
+        self.wrapper = wrapper
+        self.obsolete = False
+        self._store = None
+        self._state_n = 0
+        self._line_number = None
+        self._rich_source = None
+        self._rich_target = None
+        self._msgstrlen_cache = None
+        self._typecomments_cache = None
+        self._source_cache = None
+        self._source_cache_key = None
+        self._target_cache = None
+        self._othercomments = None
+        self._automaticcomments = None
+        self._sourcecomments = None
+        self._typecomments = None
+        self._msgidcomments = None
+        self._prev_msgctxt = None
+        self._prev_msgid = None
+        self._prev_msgid_plural = None
+        self._msgctxt = None
+        self._msgid_pluralcomments = None
+        self._msgid_plural = None
+        # Almost all units have a msgid and a msgstr
+        self.msgid = []
+        self.msgstr = []
+        # Skip the initialisation of the other lists in pounit
+        super(pounit, self).__init__(source)
+
+    def __deepcopy__(self, memo={}):
+        new_unit = super().__deepcopy__(memo)
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            if slot not in self.__shallow__:
+                value = copy.deepcopy(value)
+            setattr(new_unit, slot, value)
+        return new_unit
+
+
+class PoWriter:
+    """
+    Writes PO units to a file one by one.
+
+    This allows writing units as soon as they are produced, for example while
+    reading another file with :func:`iter_units`, without collecting them in
+    a :class:`pofile` first.
+    """
+
+    def __init__(
+        self, out: IO[bytes], encoding: str = "utf-8", newline: str = "\n"
+    ) -> None:
+        self.out = out
+        self.encoding = encoding
+        self.newline = newline
+        self.at_start = True
+
+    def write(self, unit: pounit) -> None:
+        """Writes a unit, separated from the previous one by a blank line."""
+        output = unit._getoutput().encode(self.encoding)
+        if self.at_start:
+            self.at_start = False
+        else:
+            self.out.write(self.newline.encode())
+        self.out.write(output)
+
+    def writeunits(self, units: Iterable[pounit]) -> None:
+        """Writes all the given units."""
+        for unit in units:
+            self.write(unit)
+
+
 class pofile(pocommon.pofile[pounit]):
     """A .po file containing various units."""
 
     UnitClass = pounit
 
-    def __init__(self, inputfile=None, width=None, **kwargs) -> None:
+    def __init__(self, inputfile=None, width=None, compact=False, **kwargs) -> None:
+        """
+        :param compact: Whether to use :class:`compactpounit` for the units, to
+                        save memory when loading large files.
+        """
         wrapargs = {}
         if width is not None:
             wrapargs = {"width": width}
         self.wrapper: PoWrapper | None = PoWrapper(**wrapargs)
         self.newline = "\n"
+        if compact:
+            self.UnitClass = compactpounit
         super().__init__(inputfile, **kwargs)
 
     def create_unit(self) -> pounit:
@@ -923,6 +1198,29 @@ class pofile(pocommon.pofile[pounit]):
         self.units = []
         poparser.parse_units(poparser.PoParseState(lines, self.create_unit), self)
 
+    def iterparse(self, input) -> Generator[pounit]:
+        """
+        Parses the given file incrementally and yields its units.
+
+        Unlike :meth:`parse` the file is not read at once and the units are
+        not added to the store, so that large files can be processed with
+        bounded memory.
+        """
+        if hasattr(input, "name"):
+            self.filename = input.name
+        elif not getattr(self, "filename", ""):
+            self.filename = ""
+        if isinstance(input, bytes):
+            input = BytesIO(input)
+        lines = PoLineStream(input)
+        self.newline = lines.newline.decode()
+        self.units = []
+        for unit in poparser.iter_units(
+            poparser.PoParseState(lines, self.create_unit), self
+        ):
+            unit._store = self
+            yield unit
+
     def removeduplicates(self, duplicatestyle: str = "merge") -> None:
         """
         Make sure each msgid is unique ; merge comments etc from
@@ -979,14 +1277,8 @@ class pofile(pocommon.pofile[pounit]):
 
     def serialize(self, out: IO[bytes]) -> None:
         """Write to file."""
-        at_start = True
         try:
-            for unit in self.units:
-                if not at_start:
-                    out.write(self.newline.encode())
-                else:
-                    at_start = False
-                out.write(unit._getoutput().encode(self.encoding))
+            PoWriter(out, self.encoding, self.newline).writeunits(self.units)
         except UnicodeEncodeError:
             if self.encoding == "utf-8":
                 raise
@@ -1006,3 +1298,13 @@ class pofile(pocommon.pofile[pounit]):
         super().addunit(unit)
         if needs_update:
             unit.target = unit.target
+
+
+def iter_units(inputfile, compact=False) -> Generator[pounit]:
+    """
+    Yields the units of a PO file without loading the whole file.
+
+    :param inputfile: A binary file object or the content of the file.
+    :param compact: Whether to yield :class:`compactpounit` units.
+    """
+    return pofile(noheader=True, compact=compact).iterparse(inputfile)
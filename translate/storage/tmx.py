@@ -18,12 +18,20 @@
 
 """module for parsing TMX translation memory files."""
 
+from __future__ import annotations
+
+import contextlib
+from typing import IO, TYPE_CHECKING, Self
+
 from lxml import etree
 
 from translate import __version__
 from translate.misc.xml_helpers import safely_set_text, setXMLlang
 from translate.storage import lisa
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class tmxunit(lisa.LISAunit):
     """A single unit in the TMX file."""
@@ -148,6 +156,21 @@ class tmxunit(lisa.LISAunit):
         return ""
 
 
+def settranslation(
+    unit: tmxunit, srclang, translation, translang, comment=None, context=None
+) -> None:
+    """Sets the translation, languages, comment and context of a new unit."""
+    unit.target = translation
+    if comment is not None and len(comment) > 0:
+        unit.addnote(comment)
+    if context is not None and len(context) > 0:
+        unit.setcontext(context)
+
+    tuvs = unit.xmlelement.iterdescendants(unit.namespaced("tuv"))
+    setXMLlang(next(tuvs), srclang)
+    setXMLlang(next(tuvs), translang)
+
+
 class tmxfile(lisa.LISAfile):
     """Class representing a TMX file store."""
 
@@ -185,16 +208,87 @@ class tmxfile(lisa.LISAfile):
     ) -> None:
         """Addtranslation method for testing old unit tests."""
         unit = self.addsourceunit(source)
-        unit.target = translation
-        if comment is not None and len(comment) > 0:
-            unit.addnote(comment)
-        if context is not None and len(context) > 0:
-            unit.setcontext(context)
-
-        tuvs = unit.xmlelement.iterdescendants(self.namespaced("tuv"))
-        setXMLlang(next(tuvs), srclang)
-        setXMLlang(next(tuvs), translang)
+        settranslation(unit, srclang, translation, translang, comment, context)
 
     def translate(self, sourcetext, sourcelang=None, targetlang=None):  # ty:ignore[invalid-method-override]
         """Method to test old unit tests."""
         return getattr(self.findunit(sourcetext), "target", None)
+
+
+class TmxWriter:
+    """
+    Writes a TMX file unit by unit.
+
+    The units are written as soon as they are added, so that large
+    translation memories can be exported without building a :class:`tmxfile`
+    first. The output is the same as that of :meth:`tmxfile.serialize`.
+
+    Use it as a context manager, which writes the end of the file on exit::
+
+        with TmxWriter(out, "en") as writer:
+            writer.addtranslation("File", "en", "Lêer", "af")
+    """
+
+    def __init__(self, out: IO[bytes], sourcelanguage: str = "en") -> None:
+        self.out = out
+        self.sourcelanguage = sourcelanguage
+        self.writer = None
+        self.elements = contextlib.ExitStack()
+        self.inbody = False
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Writes the XML declaration and the header."""
+        skeleton = tmxfile(sourcelanguage=self.sourcelanguage).document
+        self.out.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n{skeleton.docinfo.doctype}\n'.encode()
+        )
+        self.writer = self.elements.enter_context(
+            etree.xmlfile(self.out, encoding="UTF-8")
+        )
+        self.elements.enter_context(
+            self.writer.element(tmxfile.rootNode, version="1.4")
+        )
+        # Callbacks are called in reverse order, before the end tags
+        self.elements.callback(self.writer.write, "\n")
+        self.writer.write("\n  ", skeleton.find("header"))
+
+    def write(self, unit: tmxunit) -> None:
+        """Writes a unit, indented like the output of :meth:`tmxfile.serialize`."""
+        if not self.inbody:
+            self.writer.write("\n  ")
+            self.elements.enter_context(self.writer.element(tmxfile.bodyNode))
+            self.elements.callback(self.writer.write, "\n  ")
+            self.inbody = True
+        etree.indent(unit.xmlelement, level=2)
+        unit.xmlelement.tail = None
+        self.writer.write("\n    ", unit.xmlelement)
+
+    def writeunits(self, units: Iterable[tmxunit]) -> None:
+        """Writes all the given units."""
+        for unit in units:
+            self.write(unit)
+
+    def addtranslation(
+        self, source, srclang, translation, translang, comment=None, context=None
+    ) -> None:
+        """Writes a new unit, see :meth:`tmxfile.addtranslation`."""
+        unit = tmxunit(source)
+        settranslation(unit, srclang, translation, translang, comment, context)
+        self.write(unit)
+
+    def close(self) -> None:
+        """Writes the end of the file."""
+        if self.writer is None:
+            return
+        if not self.inbody:
+            self.writer.write("\n  ", etree.Element(tmxfile.bodyNode))
+        self.elements.close()
+        self.writer = None
+        self.out.write(b"\n")
@@ -112,6 +112,8 @@ class tsunit(lisa.LISAunit):
     statemap_r = {i[1]: i[0] for i in statemap.items()}
     _context = None
     _locations = None
+    #: The unit before this one, when it is not in the units of the store
+    _previous_unit = None
 
     def createlanguageNode(self, lang, text, purpose):  # ty:ignore[invalid-method-override]
         """Returns an xml Element setup with given parameters."""
@@ -346,6 +348,9 @@ class tsunit(lisa.LISAunit):
                         location = last_location[0]
                     offset = last_location[1]
                 line = offset + int(line)
+            elif line is not None and line.isdigit():
+                # Absolute lines are offsets for the relative ones
+                line = int(line)
             if location or line:
                 last_location = (location, line)
                 locations.append(last_location)
@@ -364,6 +369,8 @@ class tsunit(lisa.LISAunit):
         return self._locations[-1]
 
     def get_previous_unit(self):
+        if self._previous_unit is not None:
+            return self._previous_unit
         found = None
         for pos, unit in enumerate(self._store.units):  # ty:ignore[unresolved-attribute]
             # Use is here to compare objects as __eq__ implementation in
@@ -459,6 +466,23 @@ class tsfile(lisa.LISAfile[tsunit]):
         else:
             self.body = root
 
+    def iterparse(self, xml):
+        """
+        Parses the given file incrementally and yields its units.
+
+        Relative locations depend on the previous units, so they are resolved
+        before the units are yielded.
+        """
+        previous = None
+        for unit in super().iterparse(xml):
+            unit._previous_unit = previous
+            if unit.getlocations():
+                previous = unit
+            # The locations are resolved, keeping the reference would keep
+            # all the previous units
+            unit._previous_unit = None
+            yield unit
+
     def getsourcelanguage(self) -> str:
         """
         Get the source language for this .ts file.
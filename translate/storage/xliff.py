@@ -22,7 +22,9 @@ Module for handling XLIFF files for translation.
 The official recommendation is to use the extension .xlf for XLIFF files.
 """
 
+import collections
 import contextlib
+from collections.abc import Iterator
 from typing import TypeVar
 
 from lxml import etree
@@ -523,6 +525,127 @@ class Xliff1File(XliffFile[U]):
     suggestions_in_format = True
     """xliff units have alttrans tags which can be used to store suggestions"""
 
+    #: The parsed units which were already created, while :attr:`units` is not
+    _unitcache: dict[etree._Element, U] | None = None
+    #: The ids and sources of the parsed units, see :meth:`getelementindex`
+    _elementindex: tuple[dict, dict] | None = None
+
+    @property
+    def units(self) -> list[U]:
+        """The units, which are only created when needed for parsed files."""
+        if self._units is None:
+            self._units = [
+                self._getunit(element) for element in self._iterunitelements()
+            ]
+            self._unitcache = None
+            self._elementindex = None
+        return self._units
+
+    @units.setter
+    def units(self, units: list[U]) -> None:
+        self._units = units
+
+    def initunits(self) -> None:
+        """
+        Defers creating the units of the parsed document until they are used.
+
+        :meth:`findid`, :meth:`findunit` and :meth:`unit_iter` only create
+        the units they return, so that changing a few units of a large file
+        does not create all of them. Accessing :attr:`units` creates them all.
+        """
+        self._units = None
+        self._unitcache = {}
+        self._elementindex = None
+        last = collections.deque(self._iterunitelements(), maxlen=1)
+        if last:
+            # New units are added to the file of the last unit, as when the
+            # units are created at once
+            parts = self._getunit(last[0]).getid().split(ID_SEPARATOR)
+            if len(parts) > 1:
+                self.switchfile(parts[0], createifmissing=True)
+
+    def _iterunitelements(self) -> Iterator[etree._Element]:
+        return self.document.getroot().iterdescendants(
+            self.namespaced(self.UnitClass.rootNode)
+        )
+
+    def _getunit(self, element: etree._Element) -> U:
+        """Returns the unit of a parsed element, creating it only once."""
+        unit = self._unitcache.get(element)  # ty:ignore[possibly-missing-attribute]
+        if unit is None:
+            unit = self.UnitClass.createfromxmlElement(element)
+            unit.namespace = self.namespace
+            unit._store = self
+            self._unitcache[element] = unit  # ty:ignore[invalid-assignment]
+        return unit
+
+    def getelementindex(self) -> tuple[dict, dict]:
+        """
+        Returns the elements of the parsed units by id and by source.
+
+        The index is built in a single pass over the document, without
+        creating the units, and skips blank units like :meth:`makeindex`.
+        """
+        if self._elementindex is not None:
+            return self._elementindex
+        ids = {}
+        sources = {}
+        filetag = self.namespaced("file")
+        unittag = self.namespaced(self.UnitClass.rootNode)
+        sourcetag = self.namespaced(self.UnitClass.languageNode)
+        prefix = ""
+        for element in self.document.getroot().iter(filetag, unittag):
+            if element.tag == filetag:
+                filename = element.get("original")
+                prefix = filename + ID_SEPARATOR if filename else ""
+                continue
+            sourcenode = element.find(sourcetag)
+            source = None
+            if sourcenode is not None:
+                source = lisa.getText(
+                    sourcenode,
+                    getXMLspace(element, self.UnitClass._default_xml_space),
+                )
+            if not source and self._getunit(element).isblank():
+                continue
+            unitid = str(element.get("id") or "").replace(
+                ID_SEPARATOR_SAFE, ID_SEPARATOR
+            )
+            ids[prefix + unitid] = element
+            sources.setdefault(source, []).append(element)
+        self._elementindex = (ids, sources)
+        return self._elementindex
+
+    def unit_iter(self) -> Iterator[U]:
+        if self._units is not None:
+            yield from self._units
+            return
+        for element in self._iterunitelements():
+            yield self._getunit(element)
+
+    def findid(self, id):
+        if self._units is not None:
+            return super().findid(id)
+        element = self.getelementindex()[0].get(id)
+        return None if element is None else self._getunit(element)
+
+    def findunit(self, source: str) -> U | None:
+        units = self.findunits(source)
+        return units[0] if units else None
+
+    def findunits(self, source: str) -> list[U] | None:
+        if self._units is not None:
+            return super().findunits(source)
+        elements = self.getelementindex()[1].get(source)
+        if elements is None:
+            return None
+        return [self._getunit(element) for element in elements]
+
+    def getids(self):
+        if self._units is not None:
+            return super().getids()
+        return self.getelementindex()[0].keys()
+
     def initbody(self) -> None:
         # Validate XLIFF version
         root = self.document.getroot()
@@ -800,13 +923,16 @@ class Xliff1File(XliffFile[U]):
         from translate.storage import poxliff  # ruff:ignore[import-outside-top-level]
 
         xliff = super().parsestring(storestring)
-        if xliff.units:
-            header = xliff.units[0]
-            if (
+        header = next(xliff.unit_iter(), None)
+        if (
+            header is not None
+            and (
                 "gettext-domain-header" in (header.getrestype() or "")
                 or xliff.getdatatype() == "po"
-            ) and cls.__name__.lower() != "poxlifffile":
-                xliff = poxliff.PoXliffFile.parsestring(storestring)
+            )
+            and cls.__name__.lower() != "poxlifffile"
+        ):
+            xliff = poxliff.PoXliffFile.parsestring(storestring)
         return xliff
 
 
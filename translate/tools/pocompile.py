@@ -23,10 +23,27 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import json
+import os
+from io import BytesIO
+
+from translate.__version__ import sver
 from translate.convert import convert
+from translate.misc.filecache import SQLiteCache, filehash
 from translate.misc.multistring import multistring
 from translate.storage import factory, mo
 
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    input TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    options TEXT NOT NULL,
+    output TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
 
 def _do_msgidcomment(string) -> str:
     return f"_: {string}\n"
@@ -34,35 +51,49 @@ def _do_msgidcomment(string) -> str:
 
 class POCompile:
     @staticmethod
-    def convertstore(inputfile, includefuzzy=False):
-        outputfile = mo.mofile()
+    def convertunit(unit) -> tuple[bytes, bytes]:
+        """Returns the encoded msgid and translation of a unit in an MO file."""
+        msgid = b""
+        if not unit.isheader():
+            strings = getattr(unit.source, "strings", [unit.source])
+            # Only PO units have KDE style comments
+            msgidcomment = getattr(unit, "msgidcomment", "")
+            if msgidcomment:
+                strings = [
+                    _do_msgidcomment(msgidcomment) + strings[0],
+                    *strings[1:],
+                ]
+            msgid = b"\0".join(string.encode("utf-8") for string in strings)
+            context = unit.getcontext()
+            if context and not msgidcomment:
+                msgid = context.encode("utf-8") + b"\x04" + msgid
+        target = unit.target
+        if isinstance(target, multistring):
+            msgstr = b"\0".join(string.encode("utf-8") for string in target.strings)
+        elif not msgid:
+            msgstr = mo.headertarget(target)
+        else:
+            msgstr = target.encode("utf-8")
+        return msgid, msgstr
+
+    @classmethod
+    def convertstore(cls, inputfile, includefuzzy=False) -> bytes:
+        messages = {}
+        count = 0
         for unit in inputfile.units:
             if (
                 unit.istranslated()
                 or (unit.isfuzzy() and includefuzzy and unit.target)
                 or unit.isheader()
             ):
-                mounit = mo.mounit()
-                if unit.isheader():
-                    mounit.source = ""
-                else:
-                    mounit.source = unit.source
-                    context = unit.getcontext()
-                    if unit.msgidcomment:
-                        if mounit.hasplural():
-                            mounit.source = multistring(
-                                _do_msgidcomment(unit.msgidcomment) + mounit.source,
-                                *mounit.source.strings[1:],
-                            )
-                        else:
-                            mounit.source = (
-                                _do_msgidcomment(unit.msgidcomment) + mounit.source
-                            )
-                    elif context:
-                        mounit.msgctxt = [context]
-                mounit.target = unit.target
-                outputfile.addunit(mounit)
-        return bytes(outputfile)
+                count += 1
+                # Untranslated headers are left out, like empty plural forms
+                if unit.target:
+                    msgid, msgstr = cls.convertunit(unit)
+                    messages[msgid] = msgstr
+        output = BytesIO()
+        mo.writemessages(output, messages, count)
+        return output.getvalue()
 
 
 def convertmo(inputfile, outputfile, templatefile, includefuzzy=False) -> int:
@@ -81,13 +112,95 @@ def convertmo(inputfile, outputfile, templatefile, includefuzzy=False) -> int:
     return 1
 
 
+class CompileCache(SQLiteCache):
+    """
+    The content hashes of compiled catalogs stored in an SQLite database.
+
+    A catalog does not need to be compiled again when its content and the
+    compile options did not change, and its MO file was not modified since.
+    """
+
+    schema = CACHE_SCHEMA
+
+    def isuptodate(self, inputpath, inputhash, outputpath, options: str) -> bool:
+        """Returns whether the output of inputpath does not need to be compiled."""
+        row = self.connection.execute(
+            "SELECT hash, options, output, mtime, size FROM catalogs WHERE input = ?",
+            (os.path.abspath(inputpath),),
+        ).fetchone()
+        if row is None or not os.path.isfile(outputpath):
+            return False
+        stat = os.stat(outputpath)
+        return row == (
+            inputhash,
+            options,
+            os.path.abspath(outputpath),
+            stat.st_mtime,
+            stat.st_size,
+        )
+
+    def update(self, inputpath, inputhash, outputpath, options: str) -> None:
+        """Records that inputpath was compiled to outputpath."""
+        stat = os.stat(outputpath)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO catalogs"
+                " (input, hash, options, output, mtime, size)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(inputpath),
+                    inputhash,
+                    options,
+                    os.path.abspath(outputpath),
+                    stat.st_mtime,
+                    stat.st_size,
+                ),
+            )
+
+
+class POCompileOptionParser(convert.ConvertOptionParser):
+    """A specialized Option Parser which can skip catalogs which did not change."""
+
+    def __init__(self, formats, description=None) -> None:
+        super().__init__(formats, usepots=False, description=description)
+        self.add_option(
+            "",
+            "--cache",
+            dest="cachefile",
+            default=None,
+            type="string",
+            metavar="FILE",
+            help="store content hashes in FILE and only compile files which changed since the last run",
+        )
+
+    def processfile(
+        self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+    ):
+        if not options.cachefile or fullinputpath is None or fulloutputpath is None:
+            return super().processfile(
+                fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+            )
+        inputhash = filehash(fullinputpath)
+        optionkey = json.dumps([sver, self.getpassthroughoptions(options)])
+        with CompileCache(options.cachefile) as cache:
+            if cache.isuptodate(fullinputpath, inputhash, fulloutputpath, optionkey):
+                return False
+        result = super().processfile(
+            fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+        )
+        if result and os.path.isfile(fulloutputpath):
+            with CompileCache(options.cachefile) as cache:
+                cache.update(fullinputpath, inputhash, fulloutputpath, optionkey)
+        return result
+
+
 def main() -> None:
     formats = {
         "po": ("mo", convertmo),
         "xlf": ("mo", convertmo),
         "xliff": ("mo", convertmo),
     }
-    parser = convert.ConvertOptionParser(formats, usepots=False, description=__doc__)
+    parser = POCompileOptionParser(formats, description=__doc__)
     parser.add_fuzzy_option()
     parser.run()
 
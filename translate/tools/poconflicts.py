@@ -23,12 +23,18 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import functools
 import os
+import re
 import sys
 
 from translate.misc import optrecurse
 from translate.storage import factory, po
 
+#: The reference to a unit is the index of its file shifted by this, plus its
+#: position in the file
+FILE_POSITIONS = 1 << 32
+
 
 class ConflictOptionParser(optrecurse.RecursiveOptionParser):
     """a specialized Option Parser for the conflict tool..."""
@@ -118,8 +124,17 @@ class ConflictOptionParser(optrecurse.RecursiveOptionParser):
             options.input = os.path.dirname(options.input)
         else:
             inputfiles = [options.input]
+        self.files = []
         self.textmap = {}
+        self.references = {}
+        self.conflicting = set()
         progress_bar = optrecurse.ProgressBar(options.progress, inputfiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(inputfiles) > 1 and self.canfork():
+            self.parallelprocess(options, inputfiles, progress_bar, jobs)
+            self.buildconflictmap(options)
+            self.outputconflicts(options)
+            return
         for inputpath in inputfiles:
             fullinputpath = self.getfullinputpath(options, inputpath)
             try:
@@ -132,9 +147,32 @@ class ConflictOptionParser(optrecurse.RecursiveOptionParser):
                 )
                 success = False
             progress_bar.report_progress(inputpath, success)
-        self.buildconflictmap()
+        self.buildconflictmap(options)
         self.outputconflicts(options)
 
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        """
+        Summarize the files in a pool of worker processes.
+
+        The summaries are added in the order of the input files.
+        """
+        fullinputpaths = [
+            self.getfullinputpath(options, inputpath) for inputpath in inputfiles
+        ]
+        results = self.forkmap(
+            options,
+            functools.partial(self.summarizefile, options),
+            fullinputpaths,
+            jobs,
+            lambda fullinputpath: f"Error processing: input {fullinputpath}",
+        )
+        for inputpath, fullinputpath, (success, summary) in zip(
+            inputfiles, fullinputpaths, results, strict=True
+        ):
+            if success:
+                self.addsummary(fullinputpath, summary)
+            progress_bar.report_progress(inputpath, success)
+
     @staticmethod
     def clean(string, options):
         """Returns the cleaned string that contains the text to be matched."""
@@ -144,48 +182,100 @@ class ConflictOptionParser(optrecurse.RecursiveOptionParser):
             string = string.replace(accelerator, "")
         return string.strip()
 
-    def processfile(self, fileprocessor, options, fullinputpath) -> bool:  # ty:ignore[invalid-method-override]
-        """Process an individual file."""
-        inputfile = self.openinputfile(options, fullinputpath)
-        inputfile = factory.getobject(inputfile)
-        for unit in inputfile.units:
-            if unit.isheader() or not unit.istranslated():
-                continue
-            if unit.hasplural():
+    def gettexts(self, unit, options):
+        """Returns the cleaned source and target of a unit, or None if it is not compared."""
+        if unit.isheader() or not unit.istranslated() or unit.hasplural():
+            return None
+        if not options.invert:
+            return self.clean(unit.source, options), self.clean(unit.target, options)
+        return self.clean(unit.target, options), self.clean(unit.source, options)
+
+    def summarizefile(self, options, fullinputpath):
+        """
+        Returns the hashes of the cleaned sources and targets of the units of a
+        file with their positions, the target is None for sources too short to
+        conflict.
+        """
+        with self.openinputfile(options, fullinputpath) as inputfile:
+            store = factory.getobject(inputfile)
+        summary = []
+        for position, unit in enumerate(store.units):
+            texts = self.gettexts(unit, options)
+            if texts is None:
                 continue
-            if not options.invert:
-                source = self.clean(unit.source, options)
-                target = self.clean(unit.target, options)
+            source, target = texts
+            if len(self.flatten(source, " ")) <= 1:
+                summary.append((hash(source), None, position))
             else:
-                target = self.clean(unit.source, options)
-                source = self.clean(unit.target, options)
-            self.textmap.setdefault(source, []).append((target, unit, fullinputpath))
+                summary.append((hash(source), hash(target), position))
+        return summary
+
+    def addsummary(self, fullinputpath, summary) -> None:
+        """
+        Adds the summary of a file.
+
+        Only the hash of the first target of every source and references to
+        the units are kept, the units are read again when they conflict.
+        Sources with the same hash are then told apart, but a conflict is
+        missed when the different targets of a source have the same hash.
+        """
+        fileindex = len(self.files)
+        self.files.append(fullinputpath)
+        for sourcehash, targethash, position in summary:
+            firsttarget = self.textmap.setdefault(sourcehash, targethash)
+            if targethash is None:
+                continue
+            if targethash != firsttarget:
+                self.conflicting.add(sourcehash)
+            self.references.setdefault(sourcehash, []).append(
+                fileindex * FILE_POSITIONS + position
+            )
+
+    def processfile(self, fileprocessor, options, fullinputpath) -> bool:  # ty:ignore[invalid-method-override]
+        """Process an individual file."""
+        self.addsummary(fullinputpath, self.summarizefile(options, fullinputpath))
         return True
 
     @staticmethod
     def flatten(text, joinchar):
         """Flattens text to just be words."""
-        flattext = ""
-        for c in text:
-            if c.isalnum():
-                flattext += c
-            elif flattext[-1:].isalnum():
-                flattext += joinchar
-        return flattext.rstrip(joinchar)
+        return joinchar.join(re.findall(r"[^\W_]+", text))
 
-    def buildconflictmap(self) -> None:
+    def readconflicts(self):
+        """Returns the units of the conflicting strings, read again from their files."""
+        positions = {}
+        for sourcehash in self.conflicting:
+            for reference in self.references[sourcehash]:
+                fileindex, position = divmod(reference, FILE_POSITIONS)
+                positions.setdefault(fileindex, []).append(position)
+        units = {}
+        for fileindex, filepositions in sorted(positions.items()):
+            store = factory.getobject(self.files[fileindex])
+            for position in filepositions:
+                units[fileindex * FILE_POSITIONS + position] = store.units[position]
+        return units
+
+    def buildconflictmap(self, options) -> None:
         """Work out which strings are conflicting."""
         self.conflictmap = {}
-        for source, translations in self.textmap.items():
-            source = self.flatten(source, " ")
-            if len(source) <= 1:
+        units = self.readconflicts()
+        for sourcehash, references in self.references.items():
+            if sourcehash not in self.conflicting:
                 continue
-            if len(translations) > 1:
+            # Different sources can have the same hash
+            textmap = {}
+            for reference in references:
+                unit = units[reference]
+                source, target = self.gettexts(unit, options)
+                textmap.setdefault(source, []).append(
+                    (target, unit, self.files[reference // FILE_POSITIONS])
+                )
+            for source, translations in textmap.items():
                 uniquetranslations = dict.fromkeys(
                     [target for target, unit, filename in translations]
                 )
                 if len(uniquetranslations) > 1:
-                    self.conflictmap[source] = translations
+                    self.conflictmap[self.flatten(source, " ")] = translations
 
     def outputconflicts(self, options) -> None:
         """Saves the result of the conflict match."""
@@ -29,6 +29,7 @@ for examples and usage instructions.
 from __future__ import annotations
 
 import csv
+import json
 import logging
 import os
 import re
@@ -38,13 +39,20 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
 from operator import itemgetter
-from typing import BinaryIO, TypedDict, cast
+from typing import TYPE_CHECKING, BinaryIO, TypedDict, cast
 
+from translate.__version__ import sver
 from translate.lang.common import Common
+from translate.misc.filecache import FileState, SQLiteCache, filestate
 from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.workflow import StateEnum
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from translate.storage.base import TranslationUnit
+
 extended_state_strings: dict[StateEnum | int, str] = {
     StateEnum.EMPTY: "empty",
     StateEnum.NEEDS_WORK: "needs-work",
@@ -82,6 +90,19 @@ xmltagre = re.compile(
 )
 numberre = re.compile(r"\D\.\D")
 
+IGNORED_DIRS = {"CVS", ".svn", "_darcs", ".git", ".hg", ".bzr"}
+
+STATS_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    stats TEXT NOT NULL
+);
+"""
+
 
 class ConsoleColor:
     """Class to implement color mode."""
@@ -172,13 +193,16 @@ class StatsDict(TypedDict, total=False):
 
 
 def calcstats(filename: str | BinaryIO) -> StatsDict:
-    # ignore totally blank or header units
     try:
-        store = factory.getobject(filename)
+        return unitstats(filename, factory.iterunits(filename))
     except ValueError as e:
         logger.warning("Error in %s: %s", filename, e)
         return {}
 
+
+def unitstats(filename: str | BinaryIO, units: Iterable[TranslationUnit]) -> StatsDict:
+    """Returns the statistics of units, which are read only once."""
+    # ignore totally blank or header units
     # Initialize counters
     stats: StatsDict = {"filename": filename}
     stats["translated"] = 0
@@ -195,7 +219,7 @@ def calcstats(filename: str | BinaryIO) -> StatsDict:
     extended_stats: dict[str, StatsDict] = {}
 
     # Single pass through all units
-    for unit in store.units:
+    for unit in units:
         if not unit.istranslatable():
             continue
 
@@ -251,6 +275,89 @@ def calcstats(filename: str | BinaryIO) -> StatsDict:
     return stats
 
 
+def sumstats(results: Iterable[StatsDict]) -> StatsDict:
+    """Returns the sum of the statistics of several files."""
+    totals = cast("StatsDict", defaultdict(int))
+    extended: dict[str, StatsDict] = {}
+    for stats in results:
+        for key, value in stats.items():
+            if key == "filename":
+                continue
+            if key == "extended":
+                for state, e_stats in cast("dict[str, StatsDict]", value).items():
+                    e_totals = extended.setdefault(
+                        state, cast("StatsDict", defaultdict(int))
+                    )
+                    for e_key, e_value in e_stats.items():
+                        e_totals[e_key] += e_value  # ty: ignore[invalid-key]
+                continue
+            totals[key] += cast("int", value)  # ty: ignore[unsupported-operator]
+    totals["extended"] = extended
+    return totals
+
+
+class StatsCache(SQLiteCache):
+    """
+    The statistics of files stored in an SQLite database.
+
+    A file is only counted again when its size or modification time changed
+    and its content differs from the one which was counted.
+    """
+
+    schema = STATS_CACHE_SCHEMA
+
+    def calcstats(self, filename: str) -> StatsDict:
+        """Returns the statistics of a file, counting it only if it changed."""
+        path = os.path.abspath(filename)
+        row = self.connection.execute(
+            "SELECT mtime, size, hash, stats FROM stats WHERE path = ? AND version = ?",
+            (path, sver),
+        ).fetchone()
+        known = None if row is None else FileState(*row[:3])
+        state, changed = filestate(path, known)
+        if row is not None and not changed:
+            if state != known:
+                # Touched but not changed
+                self.connection.execute(
+                    "UPDATE stats SET mtime = ?, size = ? WHERE path = ?",
+                    (state.mtime, state.size, path),
+                )
+            stats = json.loads(row[3])
+            stats["filename"] = filename
+            return stats
+
+        stats = calcstats(filename)
+        if stats:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO stats"
+                " (path, mtime, size, hash, version, stats)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    *state,
+                    sver,
+                    json.dumps({k: v for k, v in stats.items() if k != "filename"}),
+                ),
+            )
+        return stats
+
+
+def calcdirstats(items: list[str], cachefile=None) -> StatsDict:
+    """
+    Returns the total statistics of the given files and directories.
+
+    :param items: The files and directories to count, directories are counted
+                  recursively.
+    :param cachefile: The filename of an optional :class:`StatsCache`
+                      database, so that only files which changed since the
+                      last call are counted.
+    """
+    if cachefile is None:
+        return sumstats(StatCollector(items).results)
+    with StatsCache(cachefile) as cache:
+        return sumstats(StatCollector(items, cache=cache).results)
+
+
 @dataclass
 class Renderer:
     stats: StatCollector
@@ -453,8 +560,11 @@ def percent(denominator: int, devisor: int) -> int:
 
 
 class StatCollector:
-    def __init__(self, items: list[str], incomplete_only=False) -> None:
+    def __init__(
+        self, items: list[str], incomplete_only=False, cache: StatsCache | None = None
+    ) -> None:
         self.incomplete_only = incomplete_only
+        self.cache = cache
         self._results: list[StatsDict] = []
         self._handle_items(items)
 
@@ -487,7 +597,7 @@ class StatCollector:
 
     def _handle_dir(self, dirname) -> None:
         _, name = os.path.split(dirname)
-        if name in {"CVS", ".svn", "_darcs", ".git", ".hg", ".bzr"}:
+        if name in IGNORED_DIRS:
             return
         entries = os.listdir(dirname)
         self._handle_multiple_files(dirname, entries)
@@ -502,7 +612,10 @@ class StatCollector:
 
     def _handle_single_file(self, filename) -> None:
         try:
-            stats = calcstats(filename)
+            if self.cache is None:
+                stats = calcstats(filename)
+            else:
+                stats = self.cache.calcstats(filename)
             self._results.append(stats)
         except Exception:  # This happens if we have a broken file.
             logger.exception("Broken file")
@@ -519,13 +632,9 @@ class StatCollector:
     @cached_property
     def totals(self) -> StatsDict:
         """Total stats."""
-        totals = cast("StatsDict", defaultdict(int))
-        for stats in self._results:
-            for key, value in stats.items():
-                if key in {"extended", "filename"}:
-                    # FIXME: calculate extended totals
-                    continue
-                totals[key] += cast("int", value)  # ty: ignore[unsupported-operator]
+        totals = sumstats(self._results)
+        # The renderers do not show the extended totals
+        del totals["extended"]
         return totals
 
 
@@ -580,6 +689,12 @@ def main(arguments=None) -> None:
         "--no-color", action="store_true", help="show output without color"
     )
 
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="store the statistics in FILE and only count files which changed since the last run",
+    )
+
     parser.add_argument("files", nargs="+")
 
     args = parser.parse_args(arguments)
@@ -587,7 +702,13 @@ def main(arguments=None) -> None:
     logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
     ConsoleColor.color_mode = not args.no_color
 
-    StatCollector(args.files, args.incomplete_only).render(args.style)
+    if args.cache is None:
+        StatCollector(args.files, args.incomplete_only).render(args.style)
+    else:
+        with StatsCache(args.cache) as cache:
+            StatCollector(args.files, args.incomplete_only, cache=cache).render(
+                args.style
+            )
 
 
 if __name__ == "__main__":
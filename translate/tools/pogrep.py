@@ -27,11 +27,14 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import functools
 import locale
+import os
 import re
 
 from translate.lang import data
 from translate.misc import optrecurse
+from translate.misc.filecache import FileState, SQLiteCache, filestate
 from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.poheader import poheader
@@ -228,12 +231,25 @@ class GrepFilter:
             self.search_locations and self.matches(" ".join(unit.getlocations()))
         )
 
-    def filterfile(self, thefile):
-        """Runs filters on a translation file object."""
+    def filterfile(self, thefile, positions=None):
+        """
+        Runs filters on a translation file object.
+
+        :param positions: The positions of the only units which can match,
+            headers are always kept.
+        """
         thenewfile = type(thefile)()
         thenewfile.setsourcelanguage(thefile.sourcelanguage)
         thenewfile.settargetlanguage(thefile.targetlanguage)
-        for unit in thefile.units:
+        if positions is not None:
+            positions = set(positions)
+        for position, unit in enumerate(thefile.units):
+            if (
+                positions is not None
+                and position not in positions
+                and not unit.isheader()
+            ):
+                continue
             if self.filterunit(unit):
                 thenewfile.addunit(unit)
 
@@ -246,7 +262,7 @@ class GrepFilter:
             return [], []
 
         searchstring = self.searchstring
-        flags = re.LOCALE | re.MULTILINE | re.UNICODE
+        flags = re.MULTILINE | re.UNICODE
 
         if self.ignorecase:
             flags |= re.IGNORECASE
@@ -289,9 +305,180 @@ class GrepFilter:
         return matches, indexes
 
 
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS units USING fts5(
+    source, target, notes, locations, tokenize = 'trigram case_sensitive 1'
+);
+"""
+
+#: The row of a unit is the id of its file shifted by this, plus its position
+INDEX_POSITIONS = 1 << 32
+
+
+def indextext(strings) -> str:
+    """Returns the text of strings as it is indexed and searched."""
+    return data.normalize("\n".join(string or "" for string in strings)).casefold()
+
+
+class GrepIndex(SQLiteCache):
+    """
+    A trigram index of the units of translation files, stored in SQLite.
+
+    The index finds the units which contain a plain search string, files are
+    reindexed when their content changed. The candidate units are checked by
+    the filter as usual, as the index ignores case and where parts of units
+    are joined.
+    """
+
+    schema = INDEX_SCHEMA
+
+    def __init__(self, filename) -> None:
+        super().__init__(filename)
+        self.files = {
+            path: (fileid, FileState(mtime, size, filehash))
+            for fileid, path, mtime, size, filehash in self.connection.execute(
+                "SELECT id, path, mtime, size, hash FROM files"
+            )
+        }
+
+    @staticmethod
+    def query(grepfilter: GrepFilter) -> str | None:
+        """
+        Returns the full text query finding the candidate units of a filter,
+        or None if the index cannot answer its search.
+        """
+        searchstring = indextext([grepfilter.searchstring])
+        if (
+            grepfilter.useregexp
+            or grepfilter.invertmatch
+            or grepfilter.keeptranslations
+            or grepfilter.accelchar
+            # Shorter strings have no trigrams
+            or len(searchstring) < 3
+        ):
+            return None
+        columns = [
+            column
+            for column, searched in (
+                ("source", grepfilter.search_source),
+                ("target", grepfilter.search_target),
+                ("notes", grepfilter.search_notes),
+                ("locations", grepfilter.search_locations),
+            )
+            if searched
+        ]
+        if not columns:
+            return None
+        phrase = searchstring.replace('"', '""')
+        return f'{{{" ".join(columns)}}} : "{phrase}"'
+
+    def update(self, filename):
+        """
+        Indexes a file if it is new or its content changed.
+
+        :return: The units of the file when it was read, None when the index
+            is up to date.
+        """
+        path = os.path.abspath(filename)
+        fileid, known = self.files.get(path, (None, None))
+        state, changed = filestate(path, known)
+        if not changed:
+            if state != known:
+                # Touched but not changed
+                self.connection.execute(
+                    "UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                    (state.mtime, state.size, fileid),
+                )
+                self.files[path] = (fileid, state)
+            return None
+        units = factory.getobject(path).units
+        if fileid is None:
+            fileid = self.connection.execute(
+                "INSERT INTO files (path, mtime, size, hash) VALUES (?, ?, ?, ?)",
+                (path, *state),
+            ).lastrowid
+        else:
+            self.connection.execute(
+                "UPDATE files SET mtime = ?, size = ?, hash = ? WHERE id = ?",
+                (*state, fileid),
+            )
+            self.connection.execute(
+                "DELETE FROM units WHERE rowid BETWEEN ? AND ?",
+                (fileid * INDEX_POSITIONS, (fileid + 1) * INDEX_POSITIONS - 1),
+            )
+        self.connection.executemany(
+            "INSERT INTO units (rowid, source, target, notes, locations)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    fileid * INDEX_POSITIONS + position,
+                    indextext(getattr(unit.source, "strings", [unit.source])),
+                    indextext(getattr(unit.target, "strings", [unit.target])),
+                    indextext([unit.getnotes()]),
+                    # The filter searches the locations joined with spaces
+                    indextext([" ".join(unit.getlocations())]),
+                )
+                for position, unit in enumerate(units)
+                if not unit.isheader()
+            ],
+        )
+        self.files[path] = (fileid, state)
+        return units
+
+    def candidates(self, query: str) -> dict[str, list[int]]:
+        """Returns the positions of the units matching query in every file."""
+        paths = {fileid: path for path, (fileid, _state) in self.files.items()}
+        results = {}
+        for (rowid,) in self.connection.execute(
+            "SELECT rowid FROM units WHERE units MATCH ? ORDER BY rowid", (query,)
+        ):
+            fileid, position = divmod(rowid, INDEX_POSITIONS)
+            results.setdefault(paths[fileid], []).append(position)
+        return results
+
+    def getmatches(self, grepfilter: GrepFilter, filenames) -> dict[str, list]:
+        """
+        Returns the matches of a filter in translation files, only reading
+        the files which have candidate units.
+
+        :return: The :class:`GrepMatch` objects of every file with matches.
+        """
+        query = self.query(grepfilter)
+        if query is None:
+            raise ValueError("The index can only find plain search strings")
+        results = {}
+        candidates = None
+        for filename in filenames:
+            path = os.path.abspath(filename)
+            units = self.update(path)
+            if units is None:
+                if candidates is None:
+                    candidates = self.candidates(query)
+                positions = candidates.get(path)
+                if not positions:
+                    continue
+                allunits = factory.getobject(path).units
+                units = [allunits[position] for position in positions]
+            matches, _indexes = grepfilter.getmatches(units)
+            if matches:
+                results[filename] = matches
+        return results
+
+
 class GrepOptionParser(optrecurse.RecursiveOptionParser):
     """a specialized Option Parser for the grep tool..."""
 
+    index: GrepIndex | None = None
+    query: str | None = None
+    candidates: dict[str, list[int]] | None = None
+
     def parse_args(self, args=None, values=None):
         """Parses the command line options, handling implicit input/output args."""
         (options, args) = optrecurse.optparse.OptionParser.parse_args(
@@ -341,13 +528,56 @@ class GrepOptionParser(optrecurse.RecursiveOptionParser):
             options.accelchar,
             locale.getpreferredencoding(),
         )
-        self.recursiveprocess(options)
+        self.query = options.indexfile and GrepIndex.query(options.checkfilter)
+        if not self.query:
+            # Searches which the index cannot answer read all files
+            self.recursiveprocess(options)
+            return
+        try:
+            with GrepIndex(options.indexfile) as self.index:
+                self.recursiveprocess(options)
+        finally:
+            self.index = None
+            self.candidates = None
+
+    def canprocessinparallel(self, options) -> bool:
+        # Worker processes cannot share the connection to the index
+        return self.index is None and super().canprocessinparallel(options)
+
+    def processfile(
+        self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+    ):
+        """Only reads the files which have candidate units in the index."""
+        if self.index is None or fullinputpath is None:
+            return super().processfile(
+                fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+            )
+        units = self.index.update(fullinputpath)
+        if units is not None:
+            positions = [
+                position
+                for position, unit in enumerate(units)
+                if not unit.isheader() and options.checkfilter.filterunit(unit)
+            ]
+        else:
+            if self.candidates is None:
+                self.candidates = self.index.candidates(self.query)
+            positions = self.candidates.get(os.path.abspath(fullinputpath))
+        if not positions:
+            return False
+        return super().processfile(
+            functools.partial(fileprocessor, positions=positions),
+            options,
+            fullinputpath,
+            fulloutputpath,
+            fulltemplatepath,
+        )
 
 
-def rungrep(inputfile, outputfile, templatefile, checkfilter) -> bool:
+def rungrep(inputfile, outputfile, templatefile, checkfilter, positions=None) -> bool:
     """Reads in inputfile, filters using checkfilter, writes to outputfile."""
     fromfile = factory.getobject(inputfile)
-    tofile = checkfilter.filterfile(fromfile)
+    tofile = checkfilter.filterfile(fromfile, positions)
     if tofile.isempty():
         return False
     tofile.serialize(outputfile)
@@ -427,6 +657,14 @@ def cmdlineparser():
         default=False,
         help="always extract units with translations",
     )
+    parser.add_option(
+        "",
+        "--index",
+        dest="indexfile",
+        type="string",
+        metavar="FILE",
+        help="index the files in FILE and only read files which can match plain search strings",
+    )
     parser.set_usage()
     parser.passthrough.append("checkfilter")
     parser.description = __doc__
@@ -48,6 +48,95 @@ class UnitInfo(NamedTuple):
     transnotes: frozenset
 
 
+class TermOccurrences:
+    """
+    A compact summary of the occurrences of a phrase.
+
+    It only keeps what :meth:`TerminologyExtractor.extract_terms` needs, and the
+    summaries of a phrase in different files can be merged. A single source,
+    file or set of locations is kept as it is, so that it is shared with the
+    other phrases of the unit.
+    """
+
+    __slots__ = ("count", "files", "fullmsgs", "locations", "sources")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sources: str | set[str] | None = None
+        self.files: str | dict[str, int] | None = None
+        self.locations: frozenset[str] | set[str] = frozenset()
+        # The target, file and notes of the occurrences which are a full message
+        self.fullmsgs: list[tuple[str, str, frozenset, frozenset]] | tuple = ()
+
+    @property
+    def numsources(self) -> int:
+        """The number of different sources the phrase occurs in."""
+        if self.sources is None:
+            return 0
+        if isinstance(self.sources, str):
+            return 1
+        return len(self.sources)
+
+    @property
+    def filecounts(self) -> dict[str, int]:
+        """The number of occurrences in every file."""
+        if self.files is None:
+            return {}
+        if isinstance(self.files, str):
+            return {self.files: self.count}
+        return self.files
+
+    def addsource(self, source, maxoccurrences=None) -> None:
+        if self.sources is None:
+            self.sources = source
+        elif isinstance(self.sources, str):
+            if source != self.sources and maxoccurrences != 1:
+                self.sources = {self.sources, source}
+        elif maxoccurrences is None or len(self.sources) < maxoccurrences:
+            self.sources.add(source)
+
+    def addfile(self, filename, count=1) -> None:
+        if self.files is None or self.files == filename:
+            self.files = filename
+        else:
+            if isinstance(self.files, str):
+                self.files = {self.files: self.count}
+            self.files[filename] = self.files.get(filename, 0) + count
+        self.count += count
+
+    def addlocations(self, locations) -> None:
+        if locations is self.locations or locations <= self.locations:
+            return
+        if not self.locations:
+            self.locations = (
+                locations if isinstance(locations, frozenset) else set(locations)
+            )
+        else:
+            if isinstance(self.locations, frozenset):
+                self.locations = set(self.locations)
+            self.locations |= locations
+
+    def addfullmsg(self, fullmsg, maxoccurrences=None) -> None:
+        if maxoccurrences is None or len(self.fullmsgs) < maxoccurrences:
+            if not self.fullmsgs:
+                self.fullmsgs = []
+            self.fullmsgs.append(fullmsg)  # ty:ignore[unresolved-attribute]
+
+    def update(self, other, maxoccurrences=None, fullmsgs=True) -> None:
+        """Adds the occurrences of other."""
+        if isinstance(other.sources, str):
+            self.addsource(other.sources, maxoccurrences)
+        elif other.sources:
+            for source in other.sources:
+                self.addsource(source, maxoccurrences)
+        for filename, count in other.filecounts.items():
+            self.addfile(filename, count)
+        self.addlocations(other.locations)
+        if fullmsgs:
+            for fullmsg in other.fullmsgs:
+                self.addfullmsg(fullmsg, maxoccurrences)
+
+
 def create_termunit(
     term: str,
     unit: TranslationUnit | None,
@@ -91,6 +180,7 @@ class TerminologyExtractor:
         sourcelanguage="en",
         invert=False,
         stopfile=None,
+        maxoccurrences=None,
     ) -> None:
         self.foldtitle = foldtitle
         self.ignorecase = ignorecase
@@ -127,6 +217,10 @@ class TerminologyExtractor:
 
         self.units = 0
         self.glossary = {}
+        # The summarized occurrences merged from other processes
+        self.occurrences: dict[str, TermOccurrences] = {}
+        # The number of full message occurrences kept for every phrase
+        self.maxoccurrences = maxoccurrences
 
     def parse_stopword_file(self) -> None:
         actions = {
@@ -309,6 +403,79 @@ class TerminologyExtractor:
                             skips -= 1
                         self.addphrases(words, skips, translation)
 
+    def summarize(self, term, translations, fullsources=None) -> TermOccurrences:
+        """
+        Returns the summary of the occurrences of a phrase in the glossary.
+
+        :param fullsources: A dictionary caching the cleaned lowercase sources
+            of the units, shared between the phrases.
+        """
+        if fullsources is None:
+            fullsources = {}
+        occurrences = TermOccurrences()
+        lowerterm = term.lower()
+        for source, _target, unit_info, filename in translations:
+            occurrences.addsource(source, self.maxoccurrences)
+            occurrences.addfile(filename)
+            occurrences.addlocations(unit_info.locations)
+            fullsource = fullsources.get(unit_info.source)
+            if fullsource is None:
+                fullsource = fullsources[unit_info.source] = self.clean(
+                    unit_info.source
+                ).lower()
+            # Check if this is a full message match
+            if lowerterm == fullsource and (
+                self.maxoccurrences is None
+                or len(occurrences.fullmsgs) < self.maxoccurrences
+            ):
+                target = self.clean(unit_info.target)
+                if self.ignorecase or (self.foldtitle and target.istitle()):
+                    target = target.lower()
+                if lowerterm == unit_info.source.strip().lower():
+                    notes = (unit_info.sourcenotes, unit_info.transnotes)
+                else:
+                    notes = (frozenset(), frozenset())
+                occurrences.addfullmsg((target, filename, *notes))
+        return occurrences
+
+    def summarize_glossary(self) -> dict[str, TermOccurrences]:
+        """Returns the summaries of the occurrences of all phrases in the glossary."""
+        fullsources = {}
+        return {
+            term: self.summarize(term, translations, fullsources)
+            for term, translations in self.glossary.items()
+        }
+
+    def merge(self, occurrences: dict[str, TermOccurrences], units: int = 0) -> None:
+        """
+        Adds summarized occurrences of phrases, as returned by
+        :meth:`summarize_glossary` for other units.
+
+        The glossary is summarized and merged first, so that the phrases are
+        then extracted from the merged summaries.
+        """
+        if self.glossary:
+            glossary = self.summarize_glossary()
+            self.glossary = {}
+            self.merge(glossary)
+        self.units += units
+        for term, other in occurrences.items():
+            current = self.occurrences.get(term)
+            if current is None and " " not in term:
+                # reduce plurals like processunits() does, the occurrences of
+                # the plural are then no full message of the term
+                if len(term) > 3 and term[-1] == "s" and term[0:-1] in self.occurrences:
+                    self.occurrences[term[0:-1]].update(other, fullmsgs=False)
+                    continue
+                if len(term) > 2 and f"{term}s" in self.occurrences:
+                    current = self.occurrences.pop(f"{term}s")
+                    current.fullmsgs = ()
+                    self.occurrences[term] = current
+            if current is None:
+                self.occurrences[term] = other
+            else:
+                current.update(other, self.maxoccurrences)
+
     def extract_terms(
         self,
         create_termunit: Callable[
@@ -329,40 +496,41 @@ class TerminologyExtractor:
         locmin: int = 2,
     ) -> dict[str, tuple[int, TranslationUnit]]:
         terms: dict[str, tuple[int, TranslationUnit]] = {}
-        logger.info("%d terms from %d units", len(self.glossary), self.units)
-        for term, translations in self.glossary.items():
-            if len(translations) <= 1:
+        if self.occurrences:
+            # Units were also processed after the last merge
+            self.merge({})
+            logger.info("%d terms from %d units", len(self.occurrences), self.units)
+            items = self.occurrences.items()
+        else:
+            logger.info("%d terms from %d units", len(self.glossary), self.units)
+            fullsources = {}
+            items = (
+                (term, self.summarize(term, translations, fullsources))
+                for term, translations in self.glossary.items()
+                if len(translations) > 1
+            )
+        for term, occurrences in items:
+            if occurrences.count <= 1:
                 continue
-            filecounts: dict[str, int] = {}
-            sources: set[str] = set()
-            locations: set[str] = set()
+            filecounts = occurrences.filecounts
+            locations = occurrences.locations
             sourcenotes: set[str] = set()
             transnotes: set[str] = set()
             targets: dict[str, list[str]] = {}
-            fullmsg = False
+            fullmsgs = occurrences.fullmsgs
+            fullmsg = bool(fullmsgs)
             bestunit: TranslationUnit | None = None
-            for source, target, unit_info, filename in translations:
-                sources.add(source)
-                filecounts[filename] = filecounts.setdefault(filename, 0) + 1
-                # Check if this is a full message match
-                if term.lower() == self.clean(unit_info.source).lower():
-                    fullmsg = True
-                    target = self.clean(unit_info.target)
-                    if self.ignorecase or (self.foldtitle and target.istitle()):
-                        target = target.lower()
-                    if target:
-                        targets.setdefault(target, []).append(filename)
-                    if term.lower() == unit_info.source.strip().lower():
-                        sourcenotes.update(unit_info.sourcenotes)
-                        transnotes.update(unit_info.transnotes)
-                    # Create a unit object only when needed as the bestunit
-                    if bestunit is None:
-                        bestunit = po.pounit(term)
-                        bestunit.target = target
-                # Collect locations from unit_info
-                locations.update(unit_info.locations)
-
-            numsources = len(sources)
+            for target, filename, msgsourcenotes, msgtransnotes in fullmsgs:
+                if target:
+                    targets.setdefault(target, []).append(filename)
+                sourcenotes.update(msgsourcenotes)
+                transnotes.update(msgtransnotes)
+                # Create a unit object only when needed as the bestunit
+                if bestunit is None:
+                    bestunit = po.pounit(term)
+                    bestunit.target = target
+
+            numsources = occurrences.numsources
             numfiles = len(filecounts)
             numlocs = len(locations)
             if numfiles < inputmin or 0 < numlocs < locmin:
@@ -417,8 +585,7 @@ class TerminologyExtractor:
         termitems = list(terms.values())
         if sortorders is None:
             sortorders = self.sortorders_default
-        while len(sortorders) > 0:
-            order = sortorders.pop()
+        for order in reversed(sortorders):
             if order == "frequency":
                 termitems.sort(key=itemgetter(0), reverse=True)
             elif order == "dictionary":
@@ -465,6 +632,8 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             )
         if not options.input:
             self.error("No input file or directory was specified")
+        if options.maxoccurrences is not None and options.maxoccurrences < 1:
+            self.error("--max-occurrences must be at least 1")
         if isinstance(options.input, list) and len(options.input) == 1:
             options.input = options.input[0]
             if options.inputmin is None:
@@ -505,6 +674,7 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             sourcelanguage=options.sourcelanguage,
             invert=options.invert,
             stopfile=options.stopfile,
+            maxoccurrences=options.maxoccurrences,
         )
         self.recursiveprocess(options)
 
@@ -526,6 +696,11 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             options.output = os.path.join(options.output, "pootle-terminology.pot")
 
         progress_bar = optrecurse.ProgressBar(options.progress, inputfiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(inputfiles) > 1 and self.canfork():
+            self.parallelprocess(options, inputfiles, progress_bar, jobs)
+            self.outputterminology(options)
+            return
         for inputpath in inputfiles:
             self.files += 1
             fullinputpath = self.getfullinputpath(options, inputpath)
@@ -539,9 +714,44 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
                     sys.exc_info(),
                 )
                 success = False
+            if options.maxoccurrences is not None:
+                # Summarize the phrases of every file, keeping at most the
+                # maximum number of occurrences like parallelprocess() does
+                self.extractor.merge({})
             progress_bar.report_progress(inputpath, success)
         self.outputterminology(options)
 
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        """
+        Extract the phrases of the files in a pool of worker processes.
+
+        Every worker summarizes the phrases of one file, the summaries are
+        merged in the order of the input files.
+        """
+
+        def extractfile(fullinputpath):
+            extractor = self.extractor
+            extractor.glossary = {}
+            extractor.units = 0
+            self.processfile(None, options, fullinputpath, None, None)
+            return extractor.summarize_glossary(), extractor.units
+
+        fullinputpaths = [
+            self.getfullinputpath(options, inputpath) for inputpath in inputfiles
+        ]
+        results = self.forkmap(
+            options,
+            extractfile,
+            fullinputpaths,
+            jobs,
+            lambda fullinputpath: f"Error processing: input {fullinputpath}",
+        )
+        for inputpath, (success, result) in zip(inputfiles, results, strict=True):
+            self.files += 1
+            if success:
+                self.extractor.merge(*result)
+            progress_bar.report_progress(inputpath, success)
+
     def processfile(
         self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
     ) -> bool:
@@ -698,6 +908,16 @@ def main() -> None:
         help=f"output sort order(s): {', '.join(TerminologyExtractor.sortorders_default)} (may repeat option, default is all in above order)",
     )
 
+    parser.add_option(
+        "",
+        "--max-occurrences",
+        type="int",
+        dest="maxoccurrences",
+        default=None,
+        help="keep at most MAX different messages and full message translations of every term, to save memory",
+        metavar="MAX",
+    )
+
     parser.add_option(
         "",
         "--source-language",
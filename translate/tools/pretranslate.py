@@ -25,24 +25,34 @@ for examples and usage instructions.
 """
 
 from translate.convert import convert
-from translate.search import match
+from translate.search import match, tmdb
 from translate.storage import factory
 
 # We don't want to reinitialise the TM each time, so let's store it here.
 tmmatcher = None
 
 
+def tmstore(tmfile):
+    """
+    Returns the store for a TM file, which can also be a translation memory
+    database built with tmbuild.
+    """
+    if tmdb.istmdb(tmfile):
+        return tmdb.TMDB(tmfile)
+    return factory.getobject(tmfile)
+
+
 def memory(tmfiles, max_candidates=1, min_similarity=75, max_length=1000):
     """Returns the TM store to use. Only initialises on first call."""
     global tmmatcher  # ruff:ignore[global-statement]
     # Only initialise first time
     if tmmatcher is None:
         if isinstance(tmfiles, list):
-            tmstore = [factory.getobject(tmfile) for tmfile in tmfiles]
+            tmstores = [tmstore(tmfile) for tmfile in tmfiles]
         else:
-            tmstore = factory.getobject(tmfiles)
+            tmstores = tmstore(tmfiles)
         tmmatcher = match.matcher(
-            tmstore,
+            tmstores,
             max_candidates=max_candidates,
             min_similarity=min_similarity,
             max_length=max_length,
@@ -50,6 +60,28 @@ def memory(tmfiles, max_candidates=1, min_similarity=75, max_length=1000):
     return tmmatcher
 
 
+def preload_memory(options) -> None:
+    """
+    Loads the translation memory given in the command line options, so worker
+    processes forked for --jobs share it instead of each loading it.
+    """
+    if getattr(options, "tm", None) and getattr(options, "fuzzymatching", True):
+        memory(
+            options.tm,
+            max_candidates=1,
+            min_similarity=options.min_similarity,
+            max_length=1000,
+        )
+
+
+class PretranslateOptionParser(convert.ConvertOptionParser):
+    """A specialized Option Parser which loads the TM before forking."""
+
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        preload_memory(options)
+        super().parallelprocess(options, inputfiles, progress_bar, jobs)
+
+
 def pretranslate_file(
     input_file,
     output_file,
@@ -106,7 +138,7 @@ def match_source(input_unit, template_store):
     """Returns a matching unit from a template. matching based on unit id."""
     # hack for weird mozilla single letter strings, we don't want to
     # match them by anything but locations
-    if len(input_unit.source) > 1:
+    if template_store is not None and len(input_unit.source) > 1:
         return template_store.findunit(input_unit.source)
     return None
 
@@ -120,8 +152,79 @@ def match_fuzzy(input_unit, matchers):
     return None
 
 
+def match_fuzzy_many(input_units, matchers):
+    """
+    Return the fuzzy matches for several units from a queue of matchers.
+
+    Every matcher looks up all the units still lacking a match at once, see
+    :meth:`~translate.search.match.matcher.matches_many`.
+
+    :return: A dictionary mapping the source of the units to the best match
+        or None.
+    """
+    fuzzymatches = dict.fromkeys(input_unit.source for input_unit in input_units)
+    sources = list(fuzzymatches)
+    for matcher in matchers:
+        if not sources:
+            break
+        unmatched = []
+        for source, fuzzycandidates in zip(
+            sources, matcher.matches_many(sources), strict=True
+        ):
+            if fuzzycandidates:
+                fuzzymatches[source] = fuzzycandidates[0]
+            else:
+                unmatched.append(source)
+        sources = unmatched
+    return fuzzymatches
+
+
+def match_template(input_unit, template_store, merge_on="id"):
+    """Returns a matching unit from a template, using the given merge strategy."""
+    # :param:`merge_on` supports `location` and `id` for now
+    if merge_on == "location":
+        return match_template_location(input_unit, template_store)
+    return match_template_id(input_unit, template_store)
+
+
+def needs_fuzzy_match(input_unit, template_store, merge_on="id") -> bool:
+    """
+    Returns whether :func:`pretranslate_unit` will need a fuzzy match for the
+    unit, because no translation was found in the template.
+    """
+    if template_store:
+        matching_unit = match_template(input_unit, template_store, merge_on)
+        if matching_unit and matching_unit.gettargetlen() > 0:
+            return False
+    matching_unit = match_source(input_unit, template_store)
+    return not matching_unit or not matching_unit.gettargetlen()
+
+
+def prepare_fuzzy_matches(input_units, template_store, matchers, merge_on="id"):
+    """
+    Looks up the fuzzy matches needed to pretranslate the units in one batch.
+
+    :return: A dictionary to pass as ``fuzzymatches`` to
+        :func:`pretranslate_unit`.
+    """
+    return match_fuzzy_many(
+        [
+            input_unit
+            for input_unit in input_units
+            if input_unit.istranslatable()
+            and needs_fuzzy_match(input_unit, template_store, merge_on)
+        ],
+        matchers,
+    )
+
+
 def pretranslate_unit(
-    input_unit, template_store, matchers=None, mark_reused=False, merge_on="id"
+    input_unit,
+    template_store,
+    matchers=None,
+    mark_reused=False,
+    merge_on="id",
+    fuzzymatches=None,
 ):
     """
     Pretranslate a unit or return unchanged if no translation was found.
@@ -132,16 +235,14 @@ def pretranslate_unit(
         objects.
     :param mark_reused: Whether to mark old translations as reused or not.
     :param merge_on: Where will the merge matching happen on.
+    :param fuzzymatches: Optional fuzzy matches looked up in advance with
+        :func:`prepare_fuzzy_matches`.
     """
     matching_unit = None
 
     # Do template matching
     if template_store:
-        # :param:`merge_on` supports `location` and `id` for now
-        if merge_on == "location":
-            matching_unit = match_template_location(input_unit, template_store)
-        else:
-            matching_unit = match_template_id(input_unit, template_store)
+        matching_unit = match_template(input_unit, template_store, merge_on)
 
     if matching_unit and matching_unit.gettargetlen() > 0:
         input_unit.merge(matching_unit, authoritative=True)
@@ -151,7 +252,10 @@ def pretranslate_unit(
 
         if not matching_unit or not matching_unit.gettargetlen():
             # do fuzzy matching
-            matching_unit = match_fuzzy(input_unit, matchers)
+            if fuzzymatches is not None and input_unit.source in fuzzymatches:
+                matching_unit = fuzzymatches[input_unit.source]
+            else:
+                matching_unit = match_fuzzy(input_unit, matchers)
 
         if matching_unit and matching_unit.gettargetlen() > 0:
             # FIXME: should we dispatch here instead of this crude attr check
@@ -210,11 +314,21 @@ def pretranslate_store(
         matcher.addpercentage = False
         matchers.append(matcher)
 
+    fuzzymatches = None
+    if matchers:
+        fuzzymatches = prepare_fuzzy_matches(
+            input_store.units, template_store, matchers, input_store.merge_on
+        )
+
     # Main loop
     for input_unit in input_store.units:
         if input_unit.istranslatable():
             pretranslate_unit(
-                input_unit, template_store, matchers, merge_on=input_store.merge_on
+                input_unit,
+                template_store,
+                matchers,
+                merge_on=input_store.merge_on,
+                fuzzymatches=fuzzymatches,
             )
 
     return input_store
@@ -231,7 +345,7 @@ def main(argv=None) -> None:
         "xliff": ("xliff", pretranslate_file),
         ("xliff", "xliff"): ("xliff", pretranslate_file),
     }
-    parser = convert.ConvertOptionParser(
+    parser = PretranslateOptionParser(
         formats, usetemplates=True, allowmissingtemplate=True, description=__doc__
     )
     parser.add_option(
@@ -239,7 +353,8 @@ def main(argv=None) -> None:
         "--tm",
         dest="tm",
         default=None,
-        help="The file to use as translation memory when fuzzy matching",
+        help="The file to use as translation memory when fuzzy matching, "
+        "can also be a database created by tmbuild",
     )
     parser.passthrough.append("tm")
     defaultsimilarity = 75
@@ -0,0 +1,120 @@
+#
+# Copyright 2026 Translate toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Build or update a translation memory database from translation files.
+
+The database can be used as translation memory by pretranslate and pot2po.
+Only files which changed since the last run are read again.
+
+See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/commands/tmbuild.html
+for examples and usage instructions.
+"""
+
+import logging
+import os
+from argparse import ArgumentParser
+
+from translate.search import tmdb
+from translate.storage import factory
+
+logger = logging.getLogger(__name__)
+
+IGNORED_DIRS = {"CVS", ".svn", "_darcs", ".git", ".hg", ".bzr"}
+
+
+def supported_extensions():
+    """Returns the extensions of the files which can be added to the TM."""
+    return {
+        extension
+        for _name, extensions, _mimetypes in factory.supported_files()
+        for extension in extensions
+    }
+
+
+def find_files(items):
+    """Returns the supported translation files in the given files and directories."""
+    extensions = supported_extensions()
+    for item in items:
+        if not os.path.exists(item):
+            logger.error("cannot process %s: does not exist", item)
+        elif os.path.isdir(item):
+            for dirpath, dirnames, filenames in os.walk(item):
+                dirnames[:] = sorted(set(dirnames) - IGNORED_DIRS)
+                for filename in sorted(filenames):
+                    if os.path.splitext(filename)[1][1:] in extensions:
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield item
+
+
+def main(arguments=None) -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-d",
+        "--database",
+        required=True,
+        help="the translation memory database to create or update",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        default=False,
+        help="remove files from the database which are not given anymore",
+    )
+    parser.add_argument(
+        "--tmx",
+        metavar="FILE",
+        help="export the translations in the database to a TMX file",
+    )
+    parser.add_argument(
+        "-l",
+        "--language",
+        dest="targetlanguage",
+        help="the target language code of the TMX file (e.g. af-ZA)",
+    )
+    parser.add_argument(
+        "--source-language",
+        dest="sourcelanguage",
+        default="en",
+        help="the source language code of the TMX file (default: en)",
+    )
+    parser.add_argument("files", nargs="*")
+
+    args = parser.parse_args(arguments)
+    if not args.files and not args.tmx:
+        parser.error("the following arguments are required: files")
+    if args.tmx and not args.targetlanguage:
+        parser.error("--language is required to export a TMX file")
+
+    logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
+
+    with tmdb.TMDB(args.database) as database:
+        if args.files:
+            updated = database.update(find_files(args.files), prune=args.prune)
+            print(f"{updated} files added to {args.database}")
+        if args.tmx:
+            with open(args.tmx, "wb") as out:
+                exported = database.exporttmx(
+                    out, args.sourcelanguage, args.targetlanguage
+                )
+            print(f"{exported} translations exported to {args.tmx}")
+
+
+if __name__ == "__main__":
+    main()